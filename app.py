@@ -22,10 +22,15 @@ if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
 # Import the demo from our main app
-from backend.gradio_app import demo
+from backend.config import settings
+from backend.gradio_app import app_lifespan, demo
+from backend.services import get_metrics_routes
 
 # Launch with HF Spaces-compatible settings and queue configuration
 if __name__ == "__main__":
+    if settings.enable_performance_monitoring:
+        print("📊 Metrics: http://0.0.0.0:7860/metrics")
+
     demo.queue(
         default_concurrency_limit=10,  # Allow 10 concurrent requests (default=1)
         max_size=100,                  # Queue max 100 requests
@@ -35,4 +40,6 @@ if __name__ == "__main__":
         max_threads=80,                # Increase from 40 to 80 (monitor memory)
         share=False,                   # Not needed in HF Spaces (already hosted)
         show_error=True,               # Show errors for debugging
+        # API connection pool, metrics snapshots and quote snapshot poll; serve /metrics
+        app_kwargs={"lifespan": app_lifespan, "routes": get_metrics_routes()},
     )
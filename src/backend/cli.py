@@ -2,13 +2,24 @@
 
 import time
 from datetime import datetime
+from typing import AsyncIterator, Optional
 
-from agents import Runner, SQLiteSession
+from agents import RunConfig, Runner, SQLiteSession, gen_trace_id
 
 from .config import settings
-from .services import create_agent
-from .utils import print_error, print_response
-from .utils.token_utils import extract_token_usage_from_context_wrapper
+from .services import CompactingSession, create_agent
+from .tools.api_utils import get_connection_pool
+from .utils import print_error, print_response, print_response_stream
+from .utils.metrics_utils import record_request, record_token_usage
+from .utils.stream_utils import MarkdownStreamBuffer
+from .utils.tracing_utils import pop_phase_breakdown, setup_tracing
+from .utils.token_utils import (
+    calculate_cached_input_ratio,
+    extract_token_usage_from_context_wrapper,
+)
+
+# Raw Responses API event carrying an incremental chunk of the final answer
+_TEXT_DELTA_EVENT = "response.output_text.delta"
 
 
 def initialize_persistent_agent():
@@ -24,10 +35,11 @@ def initialize_persistent_agent():
     Returns:
         Agent: The initialized financial analysis agent
     """
+    setup_tracing()
     return create_agent()
 
 
-async def process_query(agent, session, user_input):
+async def process_query(agent, session, user_input, trace_id=None):
     """Process a user query using the persistent agent.
 
     This is the CORE BUSINESS LOGIC for query processing.
@@ -41,15 +53,41 @@ async def process_query(agent, session, user_input):
         agent: The persistent agent instance
         session: The SQLite session for conversation memory
         user_input: The user's query string
+        trace_id: Optional trace ID for the run (e.g., to look up its phase breakdown)
 
     Returns:
         RunResult: The result from Runner.run() containing the agent's response
     """
-    result = await Runner.run(agent, user_input, session=session)
+    run_config = RunConfig(trace_id=trace_id) if trace_id else None
+    result = await Runner.run(agent, user_input, session=session, run_config=run_config)
     return result
 
 
-def _format_performance_footer(processing_time: float, token_usage: dict, model_name: str) -> str:
+def process_query_streamed(agent, session, user_input, trace_id=None):
+    """Start a streaming run of a user query using the persistent agent.
+
+    Streaming counterpart of process_query(): the run starts immediately and
+    events are consumed from result.stream_events().
+
+    Args:
+        agent: The persistent agent instance
+        session: The SQLite session for conversation memory
+        user_input: The user's query string
+        trace_id: Optional trace ID for the run (e.g., to look up its phase breakdown)
+
+    Returns:
+        RunResultStreaming: The streaming result from Runner.run_streamed()
+    """
+    run_config = RunConfig(trace_id=trace_id) if trace_id else None
+    return Runner.run_streamed(agent, user_input, session=session, run_config=run_config)
+
+
+def _format_performance_footer(
+    processing_time: float,
+    token_usage: dict,
+    model_name: str,
+    phase_breakdown: Optional[dict] = None,
+) -> str:
     """Format performance metrics footer as plain text.
 
     This function generates the canonical footer format used by ALL interfaces.
@@ -59,6 +97,8 @@ def _format_performance_footer(processing_time: float, token_usage: dict, model_
         processing_time: Query processing time in seconds
         token_usage: Dict with token counts from extract_token_usage_from_context_wrapper()
         model_name: Model name (e.g., "gpt-5-nano")
+        phase_breakdown: Optional phase → seconds from pop_phase_breakdown()
+                         (shown when backend.monitoring.showPhaseBreakdown is on)
 
     Returns:
         str: Formatted footer text
@@ -66,8 +106,9 @@ def _format_performance_footer(processing_time: float, token_usage: dict, model_
     Example Output:
         Performance Metrics:
            Response Time: 5.135s
-           Tokens Used: 21,701 (Input: 21,402, Output: 299)
+           Tokens Used: 21,701 (Input: 21,402, Output: 299) | Cached Input: 18,944 (88.5%)
            Model: gpt-5-nano
+           Phases: llm 3.912s | tools 1.104s | http 0.987s | parse 0.012s | format 0.031s
     """
     footer = "Performance Metrics:\n"
     footer += f"   Response Time: {processing_time:.3f}s\n"
@@ -90,7 +131,11 @@ def _format_performance_footer(processing_time: float, token_usage: dict, model_
                 if cached_input > 0 or cached_output > 0:
                     cache_parts = []
                     if cached_input > 0:
-                        cache_parts.append(f"Cached Input: {cached_input:,}")
+                        cached_text = f"Cached Input: {cached_input:,}"
+                        cached_ratio = calculate_cached_input_ratio(token_usage)
+                        if cached_ratio is not None:
+                            cached_text += f" ({cached_ratio:.1%})"
+                        cache_parts.append(cached_text)
                     if cached_output > 0:
                         cache_parts.append(f"Cached Output: {cached_output:,}")
                     footer += f" | {', '.join(cache_parts)}"
@@ -100,6 +145,11 @@ def _format_performance_footer(processing_time: float, token_usage: dict, model_
     # Add model information
     footer += f"   Model: {model_name}\n"
 
+    # Add per-phase wall time (phases overlap: tools include http/parse/format)
+    if phase_breakdown:
+        phases = " | ".join(f"{phase} {seconds:.3f}s" for phase, seconds in phase_breakdown.items())
+        footer += f"   Phases: {phases}\n"
+
     return footer
 
 
@@ -137,7 +187,8 @@ async def process_query_with_footer(agent, session, user_input):
     start_time = time.perf_counter()
 
     # Call core query processor (existing shared function)
-    result = await process_query(agent, session, user_input)
+    trace_id = gen_trace_id()
+    result = await process_query(agent, session, user_input, trace_id)
 
     # Calculate processing time
     processing_time = time.perf_counter() - start_time
@@ -151,26 +202,97 @@ async def process_query_with_footer(agent, session, user_input):
     # Get model name from settings
     model_name = settings.available_models[0]
 
+    # Record latency, tokens and cost for the metrics endpoint
+    record_request(processing_time)
+    record_token_usage(model_name, token_usage)
+
     # Format footer using shared utility (single source of truth)
-    footer = _format_performance_footer(processing_time, token_usage, model_name)
+    footer = _format_performance_footer(
+        processing_time, token_usage, model_name, pop_phase_breakdown(trace_id)
+    )
 
     # Return complete response with footer appended
     return response_text + "\n\n" + footer
 
 
+async def stream_query_with_footer(agent, session, user_input) -> AsyncIterator[str]:
+    """Process query and stream the response text, then the performance footer.
+
+    Streaming counterpart of process_query_with_footer(): yields text deltas as
+    the model produces them, so time-to-first-byte no longer equals total
+    latency. Markdown tables are buffered and yielded whole (see
+    MarkdownStreamBuffer). The footer is yielded last, once token usage is known.
+
+    Args:
+        agent: The persistent agent instance
+        session: The SQLite session for conversation memory
+        user_input: The user's query string
+
+    Yields:
+        str: Response text chunks, followed by "\n\n" + performance footer
+
+    Architecture Pattern:
+        User Input → Interface → stream_query_with_footer() → process_query_streamed() → Agent
+    """
+    # Measure processing time
+    start_time = time.perf_counter()
+
+    trace_id = gen_trace_id()
+    result = process_query_streamed(agent, session, user_input, trace_id)
+    buffer = MarkdownStreamBuffer()
+    streamed_text = False
+
+    async for event in result.stream_events():
+        if event.type != "raw_response_event" or event.data.type != _TEXT_DELTA_EVENT:
+            continue
+        chunk = buffer.feed(event.data.delta)
+        if chunk:
+            streamed_text = True
+            yield chunk
+
+    remaining = buffer.flush()
+    if remaining:
+        streamed_text = True
+        yield remaining
+
+    # Fall back to the final output if the model produced no text deltas
+    if not streamed_text and result.final_output is not None:
+        yield str(result.final_output)
+
+    # Calculate processing time (full run, including tool calls)
+    processing_time = time.perf_counter() - start_time
+
+    # Extract token usage using shared utility (available once the stream completes)
+    token_usage = extract_token_usage_from_context_wrapper(result)
+    model_name = settings.available_models[0]
+
+    # Record latency, tokens and cost for the metrics endpoint
+    record_request(processing_time)
+    record_token_usage(model_name, token_usage)
+
+    yield "\n\n" + _format_performance_footer(
+        processing_time, token_usage, model_name, pop_phase_breakdown(trace_id)
+    )
+
+
 async def cli_async():
     """Run the interactive CLI loop."""
     print("Welcome to the GPT-5 powered Market Analysis Agent. Type 'exit' to quit.")
 
     try:
         # Initialize persistent CLI session for conversation memory
-        cli_session = SQLiteSession(settings.cli_session_name)
+        # (older turns are compacted before being replayed to the model)
+        cli_session = CompactingSession(SQLiteSession(settings.cli_session_name))
         print(f"📊 CLI session '{settings.cli_session_name}' initialized for conversation memory")
 
         # Create persistent agent ONCE for the entire session (following b866f0a pattern)
         analysis_agent = initialize_persistent_agent()
         print("🤖 Persistent agent initialized - agent will be reused for all messages")
 
+        # Pre-establish TLS connections so the first tool call skips the handshake
+        warmed_up = await get_connection_pool().warm_up()
+        print(f"🔌 API connections warmed up: {warmed_up}")
+
         await _run_cli_loop(cli_session, analysis_agent)
 
     except Exception as e:
@@ -182,6 +304,9 @@ async def cli_async():
                 # Session cleanup is handled automatically by SQLiteSession
                 print("📊 CLI session cleaned up")
 
+            # Close pooled HTTP sessions (graceful shutdown)
+            await get_connection_pool().close()
+
         except Exception as cleanup_error:
             print(f"Warning: Cleanup failed: {cleanup_error}")
 
@@ -204,6 +329,11 @@ async def _run_cli_loop(cli_session, analysis_agent):
                 print("Please enter a valid query (at least 2 characters).")
                 continue
 
+            if settings.stream_responses:
+                # Render response text incrementally as it streams (footer last)
+                await _stream_user_input(cli_session, analysis_agent, user_input)
+                continue
+
             # Process the user input with persistent agent (returns complete response with footer)
             complete_response = await _process_user_input(cli_session, analysis_agent, user_input)
 
@@ -249,6 +379,23 @@ async def _process_user_input(cli_session, analysis_agent, user_input):
         print_error(e, "AI Model Error")
         return f"Error: Unable to process request. {str(e)}"
 
+
+async def _stream_user_input(cli_session, analysis_agent, user_input):
+    """Process user input with streaming, rendering chunks as they arrive.
+
+    Args:
+        cli_session: The SQLite session for conversation memory
+        analysis_agent: The persistent agent instance (reused for all messages)
+        user_input: The user's query string
+    """
+    try:
+        await print_response_stream(
+            stream_query_with_footer(analysis_agent, cli_session, user_input)
+        )
+    except Exception as e:
+        print_error(e, "AI Model Error")
+
+
 def main():
     """Main entry point for CLI interface.
 
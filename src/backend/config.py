@@ -26,7 +26,12 @@ class Settings(BaseSettings):
     session_timeout_minutes: int = 30
     session_cleanup_interval_minutes: int = 5
     max_session_size: int = 1000
+    history_recent_turns: int = 2  # Turns replayed verbatim; older turns are compacted
+    history_token_budget: int = 6000  # Estimated tokens of replayed history per turn
     enable_session_persistence: bool = True
+    session_store_directory: str = "data/sessions"  # Sharded SQLite files for Gradio sessions
+    session_store_shards: int = 4
+    stream_responses: bool = True  # Stream text deltas (Runner.run_streamed) in CLI and Gradio
 
     # AI configuration
     default_active_model: str = "gpt-5-nano"
@@ -34,6 +39,15 @@ class Settings(BaseSettings):
     max_context_length: int = 400000
     ai_pricing: dict = {}
 
+    # Tool configuration
+    ta_indicator_mode: str = "local"  # "local" (NumPy engine) or "remote" (Polygon endpoints)
+    rate_limits: dict = {}  # Per-provider token buckets: {"tradier": {"requestsPerSecond", "burst"}}
+    connection_pool: dict = {}  # Per-provider aiohttp session limits, timeouts and warm-up
+    output_encoding: dict = {"default": "compact"}  # Per-tool "pretty" / "compact" / "table"
+    price_history_store: dict = {}  # Local daily bar store: enabled, path, eodRefreshTime
+    options_greeks: dict = {}  # Options greeks: source ("tradier"/"local"), riskFreeRate
+    quote_snapshots: dict = {}  # Background quote snapshots: enabled, watchlist, refreshSeconds
+
     # Logging configuration
     log_mode: str = "info"
 
@@ -43,6 +57,10 @@ class Settings(BaseSettings):
     enable_resource_monitoring: bool = True
     monitoring_log_level: str = "info"
     metrics_retention_days: int = 7
+    metrics_directory: str = "data/metrics"  # Daily JSONL metric snapshots ("" disables)
+    enable_tracing: bool = True  # Local trace processors (JSONL + phase breakdown)
+    trace_directory: str = "data/traces"  # Daily JSONL trace files ("" disables)
+    show_phase_breakdown: bool = False  # Per-phase time breakdown in the footer
 
     # Frontend configuration
     frontend_config: dict = {}
@@ -85,7 +103,12 @@ class Settings(BaseSettings):
                 self.session_timeout_minutes = agent_config["sessionTimeoutMinutes"]
                 self.session_cleanup_interval_minutes = agent_config["sessionCleanupIntervalMinutes"]
                 self.max_session_size = agent_config["maxSessionSize"]
+                self.history_recent_turns = agent_config["historyRecentTurns"]
+                self.history_token_budget = agent_config["historyTokenBudget"]
                 self.enable_session_persistence = agent_config["enableSessionPersistence"]
+                self.session_store_directory = agent_config["sessionStoreDirectory"]
+                self.session_store_shards = agent_config["sessionStoreShards"]
+                self.stream_responses = agent_config["streamResponses"]
 
                 # AI configuration
                 ai_config = backend_config["ai"]
@@ -94,6 +117,16 @@ class Settings(BaseSettings):
                 self.max_context_length = ai_config["maxContextLength"]
                 self.ai_pricing = ai_config["pricing"]
 
+                # Tool configuration
+                tools_config = backend_config["tools"]
+                self.ta_indicator_mode = tools_config["taIndicatorMode"]
+                self.rate_limits = tools_config["rateLimits"]
+                self.connection_pool = tools_config["connectionPool"]
+                self.output_encoding = tools_config["outputEncoding"]
+                self.price_history_store = tools_config["priceHistoryStore"]
+                self.options_greeks = tools_config["optionsGreeks"]
+                self.quote_snapshots = tools_config["quoteSnapshots"]
+
                 # Logging configuration
                 self.log_mode = backend_config["logging"]["mode"]
 
@@ -104,6 +137,10 @@ class Settings(BaseSettings):
                 self.enable_resource_monitoring = monitoring_config["enableResourceMonitoring"]
                 self.monitoring_log_level = monitoring_config["logLevel"]
                 self.metrics_retention_days = monitoring_config["metricsRetentionDays"]
+                self.metrics_directory = monitoring_config["metricsDirectory"]
+                self.enable_tracing = monitoring_config["enableTracing"]
+                self.trace_directory = monitoring_config["traceDirectory"]
+                self.show_phase_breakdown = monitoring_config["showPhaseBreakdown"]
             except (json.JSONDecodeError, KeyError) as e:
                 # Log error but continue with defaults
                 print(f"Warning: Failed to load config from {config_path}: {e}")
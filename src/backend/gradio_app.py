@@ -18,54 +18,91 @@ import asyncio
 from typing import List
 
 import gradio as gr
-from agents import SQLiteSession
 
 # Import CLI core functions (no duplication!)
 try:
     # Try relative imports first (when run as module)
-    from .cli import initialize_persistent_agent, process_query_with_footer
+    from .cli import (
+        initialize_persistent_agent,
+        process_query_with_footer,
+        stream_query_with_footer,
+    )
     from .config import settings
+    from .services import (
+        app_lifespan,
+        get_metrics_routes,
+        get_session_manager,
+        set_queue_depth_source,
+    )
+    from .utils.metrics_utils import get_metrics_registry, record_request
 except ImportError:
     # Fallback to absolute imports (when run directly)
-    from backend.cli import initialize_persistent_agent, process_query_with_footer
+    from backend.cli import (
+        initialize_persistent_agent,
+        process_query_with_footer,
+        stream_query_with_footer,
+    )
     from backend.config import settings
+    from backend.services import (
+        app_lifespan,
+        get_metrics_routes,
+        get_session_manager,
+        set_queue_depth_source,
+    )
+    from backend.utils.metrics_utils import get_metrics_registry, record_request
 
-# Initialize agent
+# Initialize agent (stateless, shared by all clients; conversation state lives in sessions)
 print("🚀 Initializing Market Parser Gradio Interface...")
-session = SQLiteSession(settings.agent_session_name)
+session_manager = get_session_manager()
 agent = initialize_persistent_agent()
 print("✅ Agent initialized successfully")
 
 
-async def chat_with_agent(message: str, history: List):
+async def chat_with_agent(message: str, history: List, request: gr.Request):
     """Process financial query using CLI core logic with footer.
 
-    This function wraps the CLI core business logic (process_query_with_footer).
-    NO logic duplication - calls shared function that returns complete response.
+    This function wraps the CLI core business logic (stream_query_with_footer,
+    or process_query_with_footer when streaming is disabled in config).
+    NO logic duplication - calls shared functions that produce the footer.
 
     Args:
         message: User's financial query
         history: Chat history (auto-managed by Gradio, unused here)
+        request: Gradio request (injected); its session_hash selects the
+            client's own conversation session
 
     Yields:
-        Streaming response text chunks (with footer already included)
+        Streaming response text (accumulated so far, footer appended at the end)
 
     Architecture Pattern:
-        User Input → Gradio UI → chat_with_agent() → process_query_with_footer() (CLI core)
+        User Input → Gradio UI → chat_with_agent() → stream_query_with_footer() (CLI core)
     """
+    metrics = get_metrics_registry()
+    metrics.in_progress += 1
     try:
-        # Call CLI core function - returns complete response with footer
-        complete_response = await process_query_with_footer(agent, session, message)
-
-        # Gradio streaming: yield complete response to preserve Markdown table structure
-        # Note: Sentence-based streaming was splitting on "|" which destroyed Markdown tables
-        # since tables use "|" as column separators. Yielding complete response preserves formatting.
-        yield complete_response
+        # Per-client session (isolated history, idle sessions evicted automatically)
+        session = session_manager.get_session(request.session_hash if request else None)
+
+        if not settings.stream_responses:
+            # Call CLI core function - returns complete response with footer
+            yield await process_query_with_footer(agent, session, message)
+            return
+
+        # Gradio streaming: yield the accumulated response after every chunk.
+        # Markdown tables arrive as whole blocks (buffered in the CLI core), so
+        # partially rendered tables never reach the Chatbot.
+        response = ""
+        async for chunk in stream_query_with_footer(agent, session, message):
+            response += chunk
+            yield response
 
     except Exception as e:
         # Error handling with informative message
+        record_request(None, status="error")
         error_msg = f"❌ Error: Unable to process request.\n\nDetails: {str(e)}"
         yield error_msg
+    finally:
+        metrics.in_progress -= 1
 
 
 # Create Gradio ChatInterface
@@ -92,6 +129,23 @@ demo = gr.ChatInterface(
     ],
 )
 
+
+def _gradio_queue_depth() -> int:
+    """Number of events waiting in the Gradio queue (0 if the queue is not running).
+
+    Gradio has no public queue-size API, so this reads queue internals; if they
+    change shape in a Gradio upgrade the gauge reports 0 instead of failing.
+    """
+    try:
+        event_queues = demo._queue.event_queue_per_concurrency_id
+        return sum(len(event_queue.queue) for event_queue in event_queues.values())
+    except Exception:
+        return 0
+
+
+set_queue_depth_source(_gradio_queue_depth)
+
+
 def main():
     """Main entry point for Market Parser Gradio interface.
 
@@ -109,6 +163,8 @@ def main():
     print("🔄 Hot Reload: Use 'uv run gradio src/backend/gradio_app.py'")
     print("📱 PWA: Install from browser (Chrome/Edge install icon)")
     print("💡 Tip: Changes auto-reload on file save in hot reload mode")
+    if settings.enable_performance_monitoring:
+        print("📊 Metrics: http://127.0.0.1:8000/metrics")
     print("="*60 + "\n")
 
     demo.launch(
@@ -120,6 +176,8 @@ def main():
         quiet=False,
         show_api=False,
         allowed_paths=[],
+        # Warm up API connections on startup, close them on shutdown; serve /metrics
+        app_kwargs={"lifespan": app_lifespan, "routes": get_metrics_routes()},
     )
 
 if __name__ == "__main__":
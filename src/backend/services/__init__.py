@@ -1,5 +1,27 @@
 """Services package for the Market Parser application."""
 
-from .agent_service import create_agent, get_enhanced_agent_instructions
+from .agent_service import (
+    create_agent,
+    get_dynamic_agent_instructions,
+    get_enhanced_agent_instructions,
+    get_static_agent_instructions,
+)
+from .history_compaction import CompactingSession, compact_history
+from .lifespan_service import app_lifespan
+from .metrics_service import get_metrics_routes, metrics_lifespan, set_queue_depth_source
+from .session_service import SessionManager, get_session_manager
 
-__all__ = ["create_agent", "get_enhanced_agent_instructions"]
+__all__ = [
+    "create_agent",
+    "get_enhanced_agent_instructions",
+    "get_dynamic_agent_instructions",
+    "get_static_agent_instructions",
+    "CompactingSession",
+    "compact_history",
+    "app_lifespan",
+    "get_metrics_routes",
+    "metrics_lifespan",
+    "set_queue_depth_source",
+    "SessionManager",
+    "get_session_manager",
+]
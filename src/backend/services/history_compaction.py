@@ -0,0 +1,196 @@
+"""Conversation history compaction for agent sessions.
+
+SQLiteSession replays the entire conversation on every turn, including every
+tool call and tool output (options chains, TA tables, price history). RULE #6
+asks the agent to reuse earlier data, so history matters, but replaying raw
+tool payloads makes input tokens grow without bound.
+
+CompactingSession wraps any session and compacts the history returned to the
+Runner with a deterministic policy (same stored items → same prompt):
+
+1. Read at most max_session_size stored items (latest first), dropping a
+   leading partial turn so every turn starts with its user message.
+2. Keep the most recent turns verbatim, tool outputs included
+   (backend.agent.historyRecentTurns).
+3. In older turns keep only the user message and the assistant's final
+   message items; reasoning, function_call and function_call_output items are
+   dropped together, so no call is left without its output. Kept assistant
+   messages are replayed as plain role/content input without their output
+   item id: reasoning models reject a message id whose paired reasoning item
+   is missing.
+4. Drop the oldest turns until the estimated history size fits the token
+   budget (backend.agent.historyTokenBudget); the latest turn is always kept.
+
+Nothing is deleted from the underlying store; compaction only changes what is
+sent to the model. last_compaction records item/token counts for benchmarking.
+"""
+
+import json
+from typing import Any, Optional
+
+from ..config import settings
+
+# Rough characters-per-token ratio used for deterministic size estimates
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(items: list[dict]) -> int:
+    """Estimate the prompt tokens of session items (deterministic, no tokenizer).
+
+    Args:
+        items: Session items (Responses API input items)
+
+    Returns:
+        Estimated token count (serialized JSON length / CHARS_PER_TOKEN)
+    """
+    return sum(len(json.dumps(item, ensure_ascii=False)) for item in items) // CHARS_PER_TOKEN
+
+
+def _is_user_message(item: dict) -> bool:
+    """Return True for a user message item (turn boundary)."""
+    return item.get("role") == "user" and item.get("type", "message") == "message"
+
+
+def _is_message(item: dict) -> bool:
+    """Return True for user/assistant message items (kept in older turns)."""
+    return item.get("role") in ("user", "assistant") and item.get("type", "message") == "message"
+
+
+def _plain_message(item: dict) -> dict:
+    """Assistant message as plain role/content input (output item id dropped)."""
+    if item.get("role") != "assistant":
+        return item
+    content = item.get("content")
+    if isinstance(content, list):
+        content = "".join(part.get("text") or part.get("refusal") or "" for part in content)
+    return {"role": "assistant", "content": content}
+
+
+def split_turns(items: list[dict]) -> list[list[dict]]:
+    """Split session items into turns, each starting with a user message.
+
+    Items before the first user message (a partial turn cut off by the read
+    limit) are dropped.
+
+    Args:
+        items: Session items in chronological order
+
+    Returns:
+        List of turns, each a list of items in chronological order
+    """
+    turns: list[list[dict]] = []
+    for item in items:
+        if _is_user_message(item):
+            turns.append([item])
+        elif turns:
+            turns[-1].append(item)
+    return turns
+
+
+def compact_history(
+    items: list[dict],
+    recent_turns: int,
+    token_budget: Optional[int] = None,
+) -> list[dict]:
+    """Apply the compaction policy to session items.
+
+    Args:
+        items: Session items in chronological order
+        recent_turns: Number of most recent turns kept verbatim
+        token_budget: Maximum estimated history tokens (None for no limit)
+
+    Returns:
+        Compacted items in chronological order
+    """
+    turns = split_turns(items)
+    boundary = max(0, len(turns) - recent_turns)
+    compacted = [
+        [_plain_message(item) for item in turn if _is_message(item)] if index < boundary else turn
+        for index, turn in enumerate(turns)
+    ]
+
+    if token_budget is not None:
+        turn_tokens = [estimate_tokens(turn) for turn in compacted]
+        total = sum(turn_tokens)
+        start = 0
+        # Always keep the latest turn, even if it alone exceeds the budget
+        while total > token_budget and start < len(compacted) - 1:
+            total -= turn_tokens[start]
+            start += 1
+        compacted = compacted[start:]
+
+    return [item for turn in compacted for item in turn]
+
+
+class CompactingSession:
+    """Session wrapper that compacts history before it is replayed to the model.
+
+    Implements the Agents SDK Session protocol by delegating storage to the
+    wrapped session (e.g., SQLiteSession) and compacting in get_items().
+    """
+
+    def __init__(
+        self,
+        session: Any,
+        max_items: Optional[int] = None,
+        token_budget: Optional[int] = None,
+        recent_turns: Optional[int] = None,
+    ):
+        """Wrap a session.
+
+        Args:
+            session: Underlying session that stores the full history
+            max_items: Maximum stored items read per turn (default: settings.max_session_size)
+            token_budget: Estimated history tokens (default: settings.history_token_budget)
+            recent_turns: Turns kept verbatim (default: settings.history_recent_turns)
+        """
+        self.session = session
+        self.session_id = session.session_id
+        self.max_items = max_items if max_items is not None else settings.max_session_size
+        self.token_budget = (
+            token_budget if token_budget is not None else settings.history_token_budget
+        )
+        self.recent_turns = (
+            recent_turns if recent_turns is not None else settings.history_recent_turns
+        )
+        self.last_compaction: dict = {}
+
+    async def get_items(self, limit: Optional[int] = None) -> list[dict]:
+        """Retrieve the compacted conversation history.
+
+        Args:
+            limit: Maximum number of items to return (latest N after compaction)
+
+        Returns:
+            Compacted items in chronological order
+        """
+        items = await self.session.get_items(limit=self.max_items)
+        compacted = compact_history(items, self.recent_turns, self.token_budget)
+
+        self.last_compaction = {
+            "items_before": len(items),
+            "items_after": len(compacted),
+            "tokens_before": estimate_tokens(items),
+            "tokens_after": estimate_tokens(compacted),
+        }
+
+        if limit is not None:
+            compacted = compacted[-limit:] if limit > 0 else []
+        return compacted
+
+    async def add_items(self, items: list[dict]) -> None:
+        """Store new items in the underlying session (uncompacted)."""
+        await self.session.add_items(items)
+
+    async def pop_item(self) -> Optional[dict]:
+        """Remove and return the most recent stored item."""
+        return await self.session.pop_item()
+
+    async def clear_session(self) -> None:
+        """Clear all stored items."""
+        await self.session.clear_session()
+
+    def close(self) -> None:
+        """Close the underlying session, if it supports closing."""
+        if hasattr(self.session, "close"):
+            self.session.close()
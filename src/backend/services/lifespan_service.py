@@ -0,0 +1,37 @@
+"""Server lifespan for the Gradio app.
+
+app_lifespan combines every startup/shutdown hook, so the local server
+(gradio_app.main) and the deployment entry point (app.py) run the same ones:
+
+- connection_pool_lifespan: Warm up API connections, close them on shutdown
+- metrics_lifespan: Metric snapshots and retention pruning
+- quote_snapshot_lifespan: Background quote snapshot poll for hot tickers
+- session_manager_lifespan: Stop session eviction, checkpoint and close session shards
+
+Hooks are entered in this order and exited in reverse.
+
+Usage Pattern:
+    ```python
+    demo.launch(app_kwargs={"lifespan": app_lifespan, "routes": get_metrics_routes()})
+    ```
+"""
+
+import contextlib
+from typing import AsyncIterator
+
+from ..tools.api_utils import connection_pool_lifespan
+from ..tools.quote_snapshot import quote_snapshot_lifespan
+from .metrics_service import metrics_lifespan
+from .session_service import session_manager_lifespan
+
+
+@contextlib.asynccontextmanager
+async def app_lifespan(app) -> AsyncIterator[None]:
+    """Server lifespan: connection pool, metrics, quote snapshot poll and session shards."""
+    async with (
+        connection_pool_lifespan(app),
+        metrics_lifespan(app),
+        quote_snapshot_lifespan(app),
+        session_manager_lifespan(app),
+    ):
+        yield
@@ -0,0 +1,267 @@
+"""Prometheus-style metrics endpoint for the Gradio deployment.
+
+Serves GET /metrics (text exposition format 0.0.4) next to the Gradio app:
+
+Recorded on the hot path (utils/metrics_utils.py):
+- market_parser_requests_total / _request_duration_seconds: agent queries
+- market_parser_tool_calls_total / _tool_duration_seconds: tool invocations
+  (instrument_tools() wraps each agent tool)
+- market_parser_upstream_requests_total: Tradier/Polygon requests by status
+- market_parser_tokens_total / _cost_usd_total: token usage and estimated cost
+
+Collected at scrape time:
+- market_parser_cache_{hits,misses}_total, _cache_hit_ratio, _cache_entries
+- market_parser_http_requests_{started,coalesced}_total, _sessions_active
+- Resource monitoring (enableResourceMonitoring): process_resident_memory_bytes,
+  market_parser_queue_depth (Gradio queue), _requests_in_progress
+
+Retention:
+    The endpoint exposes cumulative in-memory values (the scraper keeps the
+    time series). metrics_lifespan() also appends a snapshot every
+    METRICS_SNAPSHOT_INTERVAL_SECONDS to daily JSONL files in metricsDirectory
+    and deletes metric snapshots and trace files (see tracing_utils.py) older
+    than metricsRetentionDays.
+
+Everything is disabled when enablePerformanceMonitoring is off.
+
+Usage:
+    demo.launch(app_kwargs={"routes": get_metrics_routes(), "lifespan": metrics_lifespan})
+"""
+
+import asyncio
+import contextlib
+import dataclasses
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import AsyncIterator, Callable, Optional
+
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from ..config import settings
+from ..tools.api_utils import get_request_coalescing_stats
+from ..tools.cache_utils import get_cache_stats
+from ..tools.error_utils import is_error_response
+from ..utils.metrics_utils import (
+    METRIC_PREFIX,
+    format_labels,
+    get_metrics_registry,
+    get_process_rss_bytes,
+    record_tool_call,
+)
+from .session_service import get_session_manager
+
+# Content type of the Prometheus text exposition format
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# How often metrics_lifespan() writes a snapshot and prunes old files
+METRICS_SNAPSHOT_INTERVAL_SECONDS = 300
+
+# Daily files subject to retention: metric snapshots and trace JSONL exports
+SNAPSHOT_FILE_PREFIX = "metrics_"
+TRACE_FILE_PREFIX = "agent_traces_"
+
+_process_start_time = time.time()
+
+# Callable returning the number of queued (not yet started) requests, if known
+_queue_depth_source: Optional[Callable[[], int]] = None
+
+
+def set_queue_depth_source(source: Callable[[], int]) -> None:
+    """Register a callable reporting the request queue depth (e.g., Gradio's queue)."""
+    global _queue_depth_source
+    _queue_depth_source = source
+
+
+def instrument_tools(tools: list) -> list:
+    """Wrap agent tools so every invocation records latency and outcome.
+
+    Args:
+        tools: FunctionTool instances (from @function_tool)
+
+    Returns:
+        Copies of the tools with timed on_invoke_tool (tools unchanged when
+        performance monitoring is disabled)
+    """
+    if not settings.enable_performance_monitoring:
+        return tools
+
+    def instrument(tool):
+        invoke = tool.on_invoke_tool
+
+        async def timed_invoke(ctx, input_json):
+            start = time.perf_counter()
+            error = True
+            try:
+                result = await invoke(ctx, input_json)
+                error = isinstance(result, str) and is_error_response(result)
+                return result
+            finally:
+                record_tool_call(tool.name, time.perf_counter() - start, error)
+
+        return dataclasses.replace(tool, on_invoke_tool=timed_invoke)
+
+    return [instrument(tool) for tool in tools]
+
+
+def _gauge(name: str, help_text: str, samples: list[tuple[dict, float]]) -> list[str]:
+    """Render a gauge (or scrape-time counter via name suffix) with its samples."""
+    metric_type = "counter" if name.endswith("_total") else "gauge"
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+    lines.extend(f"{name}{format_labels(labels)} {value}" for labels, value in samples)
+    return lines
+
+
+def render_metrics() -> str:
+    """Render all metrics in the Prometheus text exposition format."""
+    lines = get_metrics_registry().render()
+
+    caches = sorted(get_cache_stats().items())
+    lines += _gauge(
+        f"{METRIC_PREFIX}_cache_hits_total",
+        "Tool cache hits.",
+        [({"cache": name}, stats["hits"]) for name, stats in caches],
+    )
+    lines += _gauge(
+        f"{METRIC_PREFIX}_cache_misses_total",
+        "Tool cache misses.",
+        [({"cache": name}, stats["misses"]) for name, stats in caches],
+    )
+    lines += _gauge(
+        f"{METRIC_PREFIX}_cache_hit_ratio",
+        "Tool cache hit ratio since start.",
+        [({"cache": name}, stats["hit_ratio"]) for name, stats in caches],
+    )
+    lines += _gauge(
+        f"{METRIC_PREFIX}_cache_entries",
+        "Entries currently cached.",
+        [({"cache": name}, stats["size"]) for name, stats in caches],
+    )
+
+    coalescing = get_request_coalescing_stats()
+    lines += _gauge(
+        f"{METRIC_PREFIX}_http_requests_started_total",
+        "Upstream requests started (after coalescing).",
+        [({}, coalescing["started"])],
+    )
+    lines += _gauge(
+        f"{METRIC_PREFIX}_http_requests_coalesced_total",
+        "Upstream requests served by an identical in-flight request.",
+        [({}, coalescing["coalesced"])],
+    )
+    lines += _gauge(
+        f"{METRIC_PREFIX}_sessions_active",
+        "Conversation sessions held in memory.",
+        [({}, get_session_manager().stats()["active"])],
+    )
+
+    if settings.enable_resource_monitoring:
+        lines += _gauge(
+            "process_resident_memory_bytes", "Resident memory size.", [({}, get_process_rss_bytes())]
+        )
+        lines += _gauge(
+            "process_start_time_seconds", "Process start time (Unix).", [({}, _process_start_time)]
+        )
+        lines += _gauge(
+            f"{METRIC_PREFIX}_requests_in_progress",
+            "Agent queries currently running.",
+            [({}, get_metrics_registry().in_progress)],
+        )
+        if _queue_depth_source is not None:
+            lines += _gauge(
+                f"{METRIC_PREFIX}_queue_depth",
+                "Requests waiting in the server queue.",
+                [({}, _queue_depth_source())],
+            )
+
+    return "\n".join(lines) + "\n"
+
+
+async def metrics_endpoint(request: Request) -> PlainTextResponse:
+    """GET /metrics handler."""
+    return PlainTextResponse(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
+def get_metrics_routes() -> list[Route]:
+    """Routes to add to the Gradio FastAPI app (empty when monitoring is disabled)."""
+    if not settings.enable_performance_monitoring:
+        return []
+    return [Route("/metrics", metrics_endpoint, methods=["GET"])]
+
+
+def write_metrics_snapshot(directory: Path) -> None:
+    """Append the current metrics to today's snapshot file (JSON line)."""
+    now = datetime.now(timezone.utc)
+    snapshot = {
+        "timestamp": now.isoformat(),
+        "metrics": get_metrics_registry().snapshot(),
+        "caches": get_cache_stats(),
+        "rss_bytes": get_process_rss_bytes() if settings.enable_resource_monitoring else None,
+    }
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{SNAPSHOT_FILE_PREFIX}{now:%Y-%m-%d}.jsonl"
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(snapshot) + "\n")
+
+
+def prune_expired_files(directories: list[Path], retention_days: int) -> int:
+    """Delete daily snapshot/trace files older than the retention period.
+
+    Args:
+        directories: Directories holding metrics_YYYY-MM-DD / agent_traces_YYYY-MM-DD files
+        retention_days: Days of files to keep (today included)
+
+    Returns:
+        Number of files deleted
+    """
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=retention_days)).strftime("%Y-%m-%d")
+    deleted = 0
+    for directory in directories:
+        if not directory.is_dir():
+            continue
+        for prefix in (SNAPSHOT_FILE_PREFIX, TRACE_FILE_PREFIX):
+            for path in directory.glob(f"{prefix}*.jsonl"):
+                day = path.stem[len(prefix) :]
+                if day < cutoff:
+                    path.unlink(missing_ok=True)
+                    deleted += 1
+    return deleted
+
+
+async def _snapshot_loop() -> None:
+    """Write snapshots and apply retention every METRICS_SNAPSHOT_INTERVAL_SECONDS."""
+    directories = [Path(settings.metrics_directory)]
+    if settings.trace_directory:
+        directories.append(Path(settings.trace_directory))
+
+    while True:
+        try:
+            await asyncio.to_thread(write_metrics_snapshot, directories[0])
+            await asyncio.to_thread(
+                prune_expired_files, directories, settings.metrics_retention_days
+            )
+        except OSError as e:
+            print(f"Warning: Metrics snapshot failed: {e}")
+        await asyncio.sleep(METRICS_SNAPSHOT_INTERVAL_SECONDS)
+
+
+@contextlib.asynccontextmanager
+async def metrics_lifespan(app) -> AsyncIterator[None]:
+    """Gradio/FastAPI lifespan hook running the snapshot/retention task.
+
+    Usage:
+        demo.launch(app_kwargs={"lifespan": metrics_lifespan})
+    """
+    task = None
+    if settings.enable_performance_monitoring and settings.metrics_directory:
+        task = asyncio.create_task(_snapshot_loop())
+    try:
+        yield
+    finally:
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
@@ -0,0 +1,412 @@
+"""Per-client conversation session management for the Market Parser application.
+
+The Gradio server used to share one module-level SQLiteSession between every
+browser client, so concurrent conversations interleaved in a single history
+and every write serialized on one database. SessionManager gives each client
+its own session, keyed by the Gradio session hash.
+
+Storage:
+- Persistence enabled (backend.agent.enableSessionPersistence): sessions are
+  spread over N sharded SQLite files in WAL mode. Each shard keeps one pooled
+  connection per worker thread (shared by all sessions in that shard), so
+  concurrent users mostly write to different files and readers never block
+  writers.
+- Persistence disabled: each session uses its own in-memory SQLite database.
+
+Idle eviction:
+    A background task runs every session_cleanup_interval_minutes and evicts
+    sessions idle for longer than session_timeout_minutes (history is deleted).
+
+Usage Pattern:
+    ```python
+    session = get_session_manager().get_session(request.session_hash)
+    result = await Runner.run(agent, message, session=session)
+    ```
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from agents import SQLiteSession
+from agents.memory.session import SessionABC
+
+from ..config import settings
+from .history_compaction import CompactingSession
+
+# SQLite tables (same names as the SQLiteSession defaults)
+SESSIONS_TABLE = "agent_sessions"
+MESSAGES_TABLE = "agent_messages"
+
+# Milliseconds a writer waits for a shard lock before raising "database is locked"
+SQLITE_BUSY_TIMEOUT_MS = 5000
+
+
+class SQLiteShard:
+    """One SQLite database file with pooled, per-thread WAL connections.
+
+    Session queries run in worker threads (asyncio.to_thread). A plain
+    file-backed SQLiteSession opens a connection per session per thread; the
+    shard instead keeps one connection per thread for all of its sessions.
+    """
+
+    def __init__(self, db_path: Path):
+        """Create the shard database file and schema.
+
+        Args:
+            db_path: Path to the shard database file
+        """
+        self.db_path = db_path
+        # Thread ident → that thread's connection
+        self._connections: dict[int, sqlite3.Connection] = {}
+        self._connections_lock = threading.Lock()
+
+        # SQLiteSession creates the schema on construction; create it once here
+        SQLiteSession(
+            "__schema__", db_path, sessions_table=SESSIONS_TABLE, messages_table=MESSAGES_TABLE
+        )
+
+    def get_connection(self) -> sqlite3.Connection:
+        """Get this thread's pooled connection (created on first use)."""
+        thread_id = threading.get_ident()
+        connection = self._connections.get(thread_id)
+        if connection is None:
+            connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+            with self._connections_lock:
+                self._connections[thread_id] = connection
+        return connection
+
+    def close(self) -> None:
+        """Checkpoint the WAL and close every pooled connection (later queries open new ones)."""
+        with self._connections_lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for index, connection in enumerate(connections):
+            if index == 0:
+                try:
+                    connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                except sqlite3.Error as e:
+                    print(f"Warning: Session shard checkpoint failed for {self.db_path}: {e}")
+            connection.close()
+
+    def delete_sessions(self, session_ids: list[str]) -> None:
+        """Delete the history of the given sessions (runs in the calling thread)."""
+        if not session_ids:
+            return
+        connection = self.get_connection()
+        rows = [(session_id,) for session_id in session_ids]
+        connection.executemany(f"DELETE FROM {MESSAGES_TABLE} WHERE session_id = ?", rows)
+        connection.executemany(f"DELETE FROM {SESSIONS_TABLE} WHERE session_id = ?", rows)
+        connection.commit()
+
+    def delete_idle_sessions(self, idle_minutes: int) -> int:
+        """Delete sessions not updated for idle_minutes (e.g., left over from a restart).
+
+        Returns:
+            Number of sessions deleted
+        """
+        connection = self.get_connection()
+        cutoff = f"-{int(idle_minutes)} minutes"
+        session_ids = [
+            row[0]
+            for row in connection.execute(
+                f"SELECT session_id FROM {SESSIONS_TABLE} "
+                "WHERE updated_at < datetime('now', ?)",
+                (cutoff,),
+            )
+        ]
+        self.delete_sessions(session_ids)
+        return len(session_ids)
+
+
+class PooledSQLiteSession(SessionABC):
+    """Agents SDK session stored in a shard, using the shard's pooled connections.
+
+    Same tables and item encoding as SQLiteSession, so shard files remain
+    readable by a plain SQLiteSession.
+    """
+
+    def __init__(self, session_id: str, shard: SQLiteShard):
+        """Create a session stored in a shard (the schema already exists).
+
+        Args:
+            session_id: Unique identifier for the conversation session
+            shard: Shard holding this session's history
+        """
+        self.session_id = session_id
+        self._shard = shard
+
+    async def get_items(self, limit: Optional[int] = None) -> list[dict]:
+        """Retrieve the conversation history for this session.
+
+        Args:
+            limit: Maximum number of items (latest N); None for all items
+
+        Returns:
+            Items in chronological order
+        """
+
+        def get_items_sync():
+            connection = self._shard.get_connection()
+            if limit is None:
+                rows = connection.execute(
+                    f"SELECT message_data FROM {MESSAGES_TABLE} "
+                    "WHERE session_id = ? ORDER BY id ASC",
+                    (self.session_id,),
+                ).fetchall()
+            else:
+                rows = connection.execute(
+                    f"SELECT message_data FROM {MESSAGES_TABLE} "
+                    "WHERE session_id = ? ORDER BY id DESC LIMIT ?",
+                    (self.session_id, limit),
+                ).fetchall()
+                rows.reverse()
+            return [item for item in (_decode_item(row[0]) for row in rows) if item is not None]
+
+        return await asyncio.to_thread(get_items_sync)
+
+    async def add_items(self, items: list[dict]) -> None:
+        """Append items to the conversation history.
+
+        Args:
+            items: Session items to store
+        """
+        if not items:
+            return
+
+        def add_items_sync():
+            connection = self._shard.get_connection()
+            connection.execute(
+                f"INSERT OR IGNORE INTO {SESSIONS_TABLE} (session_id) VALUES (?)",
+                (self.session_id,),
+            )
+            connection.executemany(
+                f"INSERT INTO {MESSAGES_TABLE} (session_id, message_data) VALUES (?, ?)",
+                [(self.session_id, json.dumps(item)) for item in items],
+            )
+            connection.execute(
+                f"UPDATE {SESSIONS_TABLE} SET updated_at = CURRENT_TIMESTAMP "
+                "WHERE session_id = ?",
+                (self.session_id,),
+            )
+            connection.commit()
+
+        await asyncio.to_thread(add_items_sync)
+
+    async def pop_item(self) -> Optional[dict]:
+        """Remove and return the most recent item (None if the session is empty)."""
+
+        def pop_item_sync():
+            connection = self._shard.get_connection()
+            row = connection.execute(
+                f"DELETE FROM {MESSAGES_TABLE} WHERE id = ("
+                f"SELECT id FROM {MESSAGES_TABLE} WHERE session_id = ? "
+                "ORDER BY id DESC LIMIT 1) RETURNING message_data",
+                (self.session_id,),
+            ).fetchone()
+            connection.commit()
+            return _decode_item(row[0]) if row else None
+
+        return await asyncio.to_thread(pop_item_sync)
+
+    async def clear_session(self) -> None:
+        """Delete all items of this session."""
+        await asyncio.to_thread(self._shard.delete_sessions, [self.session_id])
+
+    def close(self) -> None:
+        """No-op: connections belong to the shard, not the session."""
+
+
+def _decode_item(message_data: str) -> Optional[dict]:
+    """Decode a stored item (None for corrupted JSON, skipped like SQLiteSession)."""
+    try:
+        return json.loads(message_data)
+    except json.JSONDecodeError:
+        return None
+
+
+class SessionManager:
+    """Create, reuse and evict per-client conversation sessions."""
+
+    def __init__(
+        self,
+        session_prefix: str,
+        timeout_minutes: int,
+        cleanup_interval_minutes: int,
+        persistent: bool,
+        store_directory: str,
+        shard_count: int,
+    ):
+        """Create a session manager.
+
+        Args:
+            session_prefix: Prefix for session IDs (e.g., settings.agent_session_name)
+            timeout_minutes: Idle time after which a session is evicted
+            cleanup_interval_minutes: How often idle sessions are evicted
+            persistent: Store sessions in sharded SQLite files (else in memory)
+            store_directory: Directory holding the shard files
+            shard_count: Number of shard files
+        """
+        self.session_prefix = session_prefix
+        self.timeout_seconds = timeout_minutes * 60
+        self.cleanup_interval_seconds = cleanup_interval_minutes * 60
+        self._sessions: dict[str, CompactingSession] = {}
+        self._last_used: dict[str, float] = {}
+        self._cleanup_task: Optional[asyncio.Task] = None
+        self.created = 0
+        self.evicted = 0
+
+        self._shards: list[SQLiteShard] = []
+        if persistent:
+            directory = Path(store_directory)
+            directory.mkdir(parents=True, exist_ok=True)
+            self._shards = [
+                SQLiteShard(directory / f"sessions_{index}.db")
+                for index in range(max(1, shard_count))
+            ]
+
+    def _shard_for(self, session_id: str) -> SQLiteShard:
+        """Pick the shard for a session ID (stable across restarts)."""
+        digest = hashlib.sha1(session_id.encode("utf-8")).digest()
+        return self._shards[int.from_bytes(digest[:4], "big") % len(self._shards)]
+
+    def get_session(self, client_id: Optional[str]) -> CompactingSession:
+        """Get (or create) the session for a client and mark it as used.
+
+        Args:
+            client_id: Gradio session hash; None falls back to a shared session
+
+        Returns:
+            The client's conversation session (history compacted on read)
+        """
+        self._ensure_cleanup_task()
+
+        session_id = f"{self.session_prefix}:{client_id or 'default'}"
+        session = self._sessions.get(session_id)
+        if session is None:
+            if self._shards:
+                store = PooledSQLiteSession(session_id, self._shard_for(session_id))
+            else:
+                store = SQLiteSession(session_id)
+            session = CompactingSession(store)
+            self._sessions[session_id] = session
+            self.created += 1
+
+        self._last_used[session_id] = time.monotonic()
+        return session
+
+    def _ensure_cleanup_task(self) -> None:
+        """Start the idle-eviction task on the running event loop (once)."""
+        if self._cleanup_task is not None and not self._cleanup_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._cleanup_task = loop.create_task(self._cleanup_loop())
+
+    async def _cleanup_loop(self) -> None:
+        """Evict idle sessions every cleanup interval."""
+        while True:
+            await asyncio.sleep(self.cleanup_interval_seconds)
+            try:
+                await self.evict_idle_sessions()
+            except Exception as e:
+                print(f"Warning: Session cleanup failed: {e}")
+
+    async def evict_idle_sessions(self) -> int:
+        """Evict sessions idle for longer than the session timeout.
+
+        Returns:
+            Number of sessions evicted
+        """
+        cutoff = time.monotonic() - self.timeout_seconds
+        idle_ids = [sid for sid, used_at in self._last_used.items() if used_at < cutoff]
+
+        by_shard: dict[SQLiteShard, list[str]] = {}
+        for session_id in idle_ids:
+            session = self._sessions.pop(session_id)
+            del self._last_used[session_id]
+            if self._shards:
+                by_shard.setdefault(self._shard_for(session_id), []).append(session_id)
+            else:
+                session.close()
+
+        def delete_sync():
+            for shard in self._shards:
+                shard.delete_sessions(by_shard.get(shard, []))
+                # Also drop rows left behind by a previous process
+                shard.delete_idle_sessions(self.timeout_seconds // 60)
+
+        if self._shards:
+            await asyncio.to_thread(delete_sync)
+
+        self.evicted += len(idle_ids)
+        return len(idle_ids)
+
+    async def close(self) -> None:
+        """Stop the idle-eviction task and close shard connections (history is kept)."""
+        if self._cleanup_task is not None:
+            self._cleanup_task.cancel()
+            try:
+                await self._cleanup_task
+            except asyncio.CancelledError:
+                pass
+            self._cleanup_task = None
+
+        for shard in self._shards:
+            shard.close()
+
+    def stats(self) -> dict:
+        """Return active/created/evicted session counters."""
+        return {
+            "active": len(self._sessions),
+            "created": self.created,
+            "evicted": self.evicted,
+            "shards": len(self._shards),
+        }
+
+
+# Shared manager for the Gradio server (created on first use)
+_session_manager: Optional[SessionManager] = None
+
+
+def get_session_manager() -> SessionManager:
+    """Get the shared session manager configured from settings.
+
+    Returns:
+        SessionManager used by all Gradio clients in this process
+    """
+    global _session_manager
+    if _session_manager is None:
+        _session_manager = SessionManager(
+            session_prefix=settings.agent_session_name,
+            timeout_minutes=settings.session_timeout_minutes,
+            cleanup_interval_minutes=settings.session_cleanup_interval_minutes,
+            persistent=settings.enable_session_persistence,
+            store_directory=settings.session_store_directory,
+            shard_count=settings.session_store_shards,
+        )
+    return _session_manager
+
+
+@contextlib.asynccontextmanager
+async def session_manager_lifespan(app) -> AsyncIterator[None]:
+    """Gradio/FastAPI lifespan hook that closes the shared session manager on shutdown.
+
+    Stops idle eviction and checkpoints/closes the shard connections.
+    """
+    try:
+        yield
+    finally:
+        if _session_manager is not None:
+            await _session_manager.close()
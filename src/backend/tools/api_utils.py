@@ -8,11 +8,35 @@ Created: October 18, 2025
 Part of: Code Cleanup & Refactoring Phase 2
 """
 
+import asyncio
+import contextlib
+import os
+import time
+from typing import Any, AsyncIterator, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from ..config import settings
+from ..utils.metrics_utils import record_upstream_request
+from ..utils.tracing_utils import trace_span
+from .coalescing_utils import SingleFlight
+from .rate_limit_utils import get_rate_limiter, parse_retry_after
+
 # API Request Timeout Constants (seconds)
 TRADIER_TIMEOUT = 10
 POLYGON_TIMEOUT = 10
 DEFAULT_TIMEOUT = 10
 
+# API Base URLs (overridable via environment, e.g. to point at a local fixture
+# server in tests/benchmarks; read once at import time)
+TRADIER_BASE_URL = os.getenv("TRADIER_BASE_URL", "https://api.tradier.com").rstrip("/")
+POLYGON_BASE_URL = os.getenv("POLYGON_BASE_URL", "https://api.polygon.io").rstrip("/")
+PROVIDER_BASE_URLS = {
+    "tradier": TRADIER_BASE_URL,
+    "polygon": POLYGON_BASE_URL,
+}
+
 
 def create_tradier_headers(api_key: str) -> dict:
     """Create standard Tradier API request headers.
@@ -42,22 +66,145 @@ def create_tradier_headers(api_key: str) -> dict:
     }
 
 
+def create_polygon_headers(api_key: str) -> dict:
+    """Create standard Polygon.io API request headers.
+
+    Polygon accepts the API key as a Bearer token, which keeps it out of
+    request URLs (and out of single-flight keys and logs).
+
+    Args:
+        api_key: Polygon API key for authorization
+
+    Returns:
+        Dictionary with Accept and Authorization headers for Polygon API requests
+
+    Examples:
+        >>> create_polygon_headers("test_key_12345")
+        {'Accept': 'application/json', 'Authorization': 'Bearer test_key_12345'}
+    """
+    return {
+        "Accept": "application/json",
+        "Authorization": f"Bearer {api_key}"
+    }
+
+
 # ============================================================================
 # Phase 1: Connection Pooling Infrastructure (October 19, 2025)
 # ============================================================================
 
-import aiohttp
-from typing import Optional
+# Default per-provider pool settings (overridden by backend.tools.connectionPool)
+DEFAULT_POOL_CONFIG = {
+    "limit": 100,                   # Max concurrent connections per provider session
+    "limitPerHost": 10,             # Max connections per host
+    "timeoutSeconds": 30,           # Overall request timeout
+    "keepaliveTimeoutSeconds": 60,  # Keep idle connections open for reuse
+    "warmupConnections": 2,         # TLS connections pre-established by warm_up()
+}
+
+
+class ConnectionPoolMetrics:
+    """Connection reuse, queue wait and acquisition latency counters for one provider.
+
+    Populated from aiohttp client tracing signals:
+    - Acquisition latency: request start → connection obtained (new or reused)
+    - Queue wait: time spent waiting for a free slot when the pool is at its limit
+    - Creation latency: DNS + TCP + TLS time for new connections
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.queue_waits = 0
+        self.queue_wait_seconds_total = 0.0
+        self.queue_wait_seconds_max = 0.0
+        self.acquisition_seconds_total = 0.0
+        self.acquisition_seconds_max = 0.0
+        self.creation_seconds_total = 0.0
+
+    def create_trace_config(self) -> aiohttp.TraceConfig:
+        """Create an aiohttp TraceConfig that records into these counters."""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            ctx.request_started_at = time.perf_counter()
+            self.requests += 1
+
+        async def on_connection_queued_start(session, ctx, params):
+            ctx.queued_at = time.perf_counter()
+
+        async def on_connection_queued_end(session, ctx, params):
+            waited = time.perf_counter() - ctx.queued_at
+            self.queue_waits += 1
+            self.queue_wait_seconds_total += waited
+            self.queue_wait_seconds_max = max(self.queue_wait_seconds_max, waited)
+
+        async def on_connection_create_start(session, ctx, params):
+            ctx.create_started_at = time.perf_counter()
+
+        async def on_connection_create_end(session, ctx, params):
+            self.connections_created += 1
+            self.creation_seconds_total += time.perf_counter() - ctx.create_started_at
+            self._record_acquisition(ctx)
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self.connections_reused += 1
+            self._record_acquisition(ctx)
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_queued_start.append(on_connection_queued_start)
+        trace_config.on_connection_queued_end.append(on_connection_queued_end)
+        trace_config.on_connection_create_start.append(on_connection_create_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+    def _record_acquisition(self, ctx) -> None:
+        """Record time from request start until a connection was obtained."""
+        started_at = getattr(ctx, "request_started_at", None)
+        if started_at is None:
+            return
+        acquired = time.perf_counter() - started_at
+        self.acquisition_seconds_total += acquired
+        self.acquisition_seconds_max = max(self.acquisition_seconds_max, acquired)
+
+    def stats(self) -> dict:
+        """Return counters plus derived reuse ratio and averages."""
+        acquisitions = self.connections_created + self.connections_reused
+        return {
+            "requests": self.requests,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "reuse_ratio": round(self.connections_reused / acquisitions, 4) if acquisitions else 0.0,
+            "queue_waits": self.queue_waits,
+            "queue_wait_seconds_total": round(self.queue_wait_seconds_total, 6),
+            "queue_wait_seconds_max": round(self.queue_wait_seconds_max, 6),
+            "acquisition_seconds_avg": (
+                round(self.acquisition_seconds_total / acquisitions, 6) if acquisitions else 0.0
+            ),
+            "acquisition_seconds_max": round(self.acquisition_seconds_max, 6),
+            "creation_seconds_avg": (
+                round(self.creation_seconds_total / self.connections_created, 6)
+                if self.connections_created
+                else 0.0
+            ),
+        }
 
 
 class APIConnectionPool:
     """
     Singleton connection pool for API requests.
 
-    Provides persistent HTTP sessions with connection pooling for:
-    - Polygon.io API
-    - Tradier API
-    - Other external APIs
+    Provides one persistent HTTP session per provider, each with its own
+    connection limits and timeouts (config: backend.tools.connectionPool):
+    - Polygon.io API ("polygon")
+    - Tradier API ("tradier")
+    - Other external APIs ("default")
+
+    Lifecycle:
+    - warm_up(): Pre-establish TLS connections at startup so the first request
+      does not pay the DNS + TCP + TLS handshake cost
+    - close(): Close all sessions on shutdown (CLI exit, Gradio lifespan end)
     """
 
     _instance: Optional['APIConnectionPool'] = None
@@ -74,37 +221,102 @@ class APIConnectionPool:
         if self._initialized:
             return
 
-        # Create aiohttp session with connection pooling
-        self.session: Optional[aiohttp.ClientSession] = None
+        # Sessions are created lazily per provider
+        self.sessions: dict[str, aiohttp.ClientSession] = {}
+        self.metrics: dict[str, ConnectionPoolMetrics] = {}
         self._initialized = True
 
-    async def get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session with connection pooling.
+    @staticmethod
+    def get_provider_config(provider: str) -> dict:
+        """Get pool settings for a provider (config file values over defaults).
+
+        Args:
+            provider: Provider name ("tradier", "polygon" or "default")
+
+        Returns:
+            Dictionary with limit, limitPerHost, timeoutSeconds,
+            keepaliveTimeoutSeconds and warmupConnections
+        """
+        return {**DEFAULT_POOL_CONFIG, **settings.connection_pool.get(provider, {})}
+
+    async def get_session(self, provider: str = "default") -> aiohttp.ClientSession:
+        """Get or create the HTTP session for a provider.
+
+        Args:
+            provider: Provider name ("tradier", "polygon" or "default")
 
         Returns:
             aiohttp.ClientSession: HTTP session with connection pooling configured
 
-        Configuration:
-            - limit=100: Max 100 concurrent connections
-            - limit_per_host=10: Max 10 connections per host
+        Configuration (per provider, see DEFAULT_POOL_CONFIG):
+            - limit / limitPerHost: Concurrent connection limits
+            - keepaliveTimeoutSeconds: Idle time before a pooled connection is closed
+            - timeoutSeconds: Overall request timeout
             - ttl_dns_cache=300: Cache DNS entries for 5 minutes
-            - timeout=30s: Overall request timeout
         """
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(
+        session = self.sessions.get(provider)
+        if session is None or session.closed:
+            config = self.get_provider_config(provider)
+            metrics = self.metrics.setdefault(provider, ConnectionPoolMetrics())
+            session = aiohttp.ClientSession(
                 connector=aiohttp.TCPConnector(
-                    limit=100,          # Max 100 concurrent connections
-                    limit_per_host=10,  # Max 10 per host
+                    limit=config["limit"],
+                    limit_per_host=config["limitPerHost"],
+                    keepalive_timeout=config["keepaliveTimeoutSeconds"],
                     ttl_dns_cache=300,  # Cache DNS for 5 minutes
                 ),
-                timeout=aiohttp.ClientTimeout(total=30),  # 30s timeout
+                timeout=aiohttp.ClientTimeout(total=config["timeoutSeconds"]),
+                trace_configs=[metrics.create_trace_config()],
             )
-        return self.session
+            self.sessions[provider] = session
+        return session
+
+    async def warm_up(self, providers: tuple[str, ...] = ("tradier", "polygon")) -> dict:
+        """Pre-establish TLS connections to each provider's API host.
+
+        Opens warmupConnections concurrent connections per provider with a HEAD
+        request to the API base URL. The connections stay in the pool (keep-alive)
+        and are reused by the first tool calls. Failures are reported but never
+        raised - warm-up is best effort.
+
+        Args:
+            providers: Provider names to warm up
+
+        Returns:
+            Dictionary mapping provider to the number of connections established
+        """
+        async def open_connection(session: aiohttp.ClientSession, url: str) -> bool:
+            try:
+                async with session.head(url, allow_redirects=False) as response:
+                    await response.read()
+                return True
+            except Exception:
+                return False
+
+        established = {}
+        for provider in providers:
+            session = await self.get_session(provider)
+            count = self.get_provider_config(provider)["warmupConnections"]
+            results = await asyncio.gather(
+                *(open_connection(session, PROVIDER_BASE_URLS[provider]) for _ in range(count))
+            )
+            established[provider] = sum(results)
+        return established
 
     async def close(self):
-        """Close HTTP session and cleanup resources."""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        """Close all HTTP sessions and cleanup resources."""
+        for session in self.sessions.values():
+            if not session.closed:
+                await session.close()
+        self.sessions.clear()
+
+    def get_stats(self) -> dict[str, dict]:
+        """Get connection metrics for every provider session created so far.
+
+        Returns:
+            Dictionary mapping provider name to ConnectionPoolMetrics.stats()
+        """
+        return {provider: metrics.stats() for provider, metrics in self.metrics.items()}
 
 
 # Singleton instance
@@ -119,7 +331,7 @@ def get_connection_pool() -> APIConnectionPool:
 
     Usage:
         pool = get_connection_pool()
-        session = await pool.get_session()
+        session = await pool.get_session("tradier")
         async with session.get(url) as response:
             data = await response.json()
     """
@@ -127,3 +339,123 @@ def get_connection_pool() -> APIConnectionPool:
     if _connection_pool is None:
         _connection_pool = APIConnectionPool()
     return _connection_pool
+
+
+@contextlib.asynccontextmanager
+async def connection_pool_lifespan(app) -> AsyncIterator[None]:
+    """Gradio/FastAPI lifespan hook that warms up and closes the connection pool.
+
+    Runs on the server's event loop, so the sessions are created and closed on
+    the same loop that serves tool calls.
+
+    Usage:
+        demo.launch(app_kwargs={"lifespan": connection_pool_lifespan})
+    """
+    pool = get_connection_pool()
+    await pool.warm_up()
+    try:
+        yield
+    finally:
+        await pool.close()
+
+
+# ============================================================================
+# Shared Fetch Path with Single-Flight Coalescing
+# ============================================================================
+
+# Coalescing group shared by all upstream GET requests (Tradier and Polygon)
+_http_flights = SingleFlight("http")
+
+# Attempts per request when the provider answers HTTP 429 (Too Many Requests)
+MAX_RATE_LIMITED_ATTEMPTS = 3
+
+
+async def fetch_json(
+    provider: str, url: str, headers: dict, params: Optional[dict] = None
+) -> tuple[int, Any]:
+    """GET a JSON endpoint through the shared connection pool.
+
+    Concurrent calls with identical url, params and headers share a single
+    in-flight request (see SingleFlight). The parsed body is shared between
+    callers, so callers must treat it as read-only.
+
+    Each upstream request acquires a token from the provider's rate limiter
+    (see rate_limit_utils.py). HTTP 429 responses slow the limiter down, honor
+    the Retry-After header, and are retried up to MAX_RATE_LIMITED_ATTEMPTS times.
+
+    Args:
+        provider: Provider name for rate limiting ("tradier" or "polygon")
+        url: Full endpoint URL
+        headers: Request headers (e.g., from create_tradier_headers)
+        params: Optional query parameters
+
+    Returns:
+        Tuple of (status, data):
+        - status: HTTP status code
+        - data: Parsed JSON body for 200 responses, None otherwise
+
+    Raises:
+        asyncio.TimeoutError: Request exceeded the session timeout
+        aiohttp.ClientError: Connection/network failure
+
+    Usage Pattern:
+        ```python
+        status, data = await fetch_json("tradier", url, create_tradier_headers(api_key), params)
+        if status != 200:
+            return create_error_response("API request failed", f"Tradier API returned status {status}")
+        ```
+    """
+    key = (
+        url,
+        tuple(sorted((params or {}).items())),
+        tuple(sorted(headers.items())),
+    )
+    return await _http_flights.do(
+        key, lambda: _fetch_json_once(provider, url, headers, params)
+    )
+
+
+async def _fetch_json_once(
+    provider: str, url: str, headers: dict, params: Optional[dict]
+) -> tuple[int, Any]:
+    """Perform a rate-limited GET request and parse the JSON body (no coalescing)."""
+    limiter = get_rate_limiter(provider)
+    pool = get_connection_pool()
+    session = await pool.get_session(provider)
+
+    with trace_span("http", provider=provider, path=urlsplit(url).path) as span_data:
+        for attempt in range(1, MAX_RATE_LIMITED_ATTEMPTS + 1):
+            span_data["attempts"] = attempt
+            await limiter.acquire()
+
+            try:
+                response = await session.get(url, headers=headers, params=params)
+            except (asyncio.TimeoutError, aiohttp.ClientError):
+                record_upstream_request(provider, "error")
+                raise
+
+            async with response:
+                span_data["status"] = response.status
+                record_upstream_request(provider, response.status)
+                if response.status == 429:
+                    limiter.on_rate_limited(parse_retry_after(response.headers.get("Retry-After")))
+                    if attempt < MAX_RATE_LIMITED_ATTEMPTS:
+                        continue
+                    return response.status, None
+
+                limiter.on_success()
+                if response.status != 200:
+                    return response.status, None
+                with trace_span("parse", provider=provider):
+                    return response.status, await response.json()
+
+    return 429, None
+
+
+def get_request_coalescing_stats() -> dict:
+    """Get started/coalesced counters for the shared fetch path.
+
+    Returns:
+        Dictionary with in_flight, started and coalesced counts
+    """
+    return _http_flights.stats()
@@ -0,0 +1,155 @@
+"""Async Response Cache Utility Module.
+
+This module provides a bounded, asyncio-friendly TTL cache for tool responses.
+
+Unlike the @lru_cache decorators removed in October 2025 (which cached coroutine
+objects instead of awaited results), AsyncTTLCache stores the awaited string
+result, and only once the underlying call has completed successfully. Error
+responses are never cached, so a transient API failure is retried on the next
+tool call.
+
+Each cache is bounded (LRU eviction once maxsize is reached) and every entry
+carries its own expiry, so endpoints with different freshness requirements can
+share the same implementation.
+"""
+
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from .error_utils import is_error_response
+
+# Cache TTL Constants (seconds)
+QUOTE_CACHE_TTL = 5                       # Real-time quotes go stale quickly
+EXPIRATIONS_CACHE_TTL = 4 * 60 * 60       # Expiration lists change at most daily
+HISTORY_OPEN_RANGE_CACHE_TTL = 60         # Ranges that include today's (still forming) bar
+HISTORY_CLOSED_RANGE_CACHE_TTL = math.inf  # Closed sessions never change
+OPTIONS_CHAIN_CACHE_TTL = 30              # Bid/ask and greeks move with the underlying
+OPTIONS_CHAIN_QUIET_CACHE_TTL = 120       # Thinly traded chains during market hours
+OPTIONS_CHAIN_CLOSED_CACHE_TTL = 12 * 60 * 60  # Quotes are frozen until the next open
+
+# Default cache size (entries per cache)
+DEFAULT_CACHE_MAXSIZE = 256
+
+
+class AsyncTTLCache:
+    """Bounded LRU cache with per-entry time-to-live for async tool results.
+
+    Entries expire ``ttl`` seconds after being stored (``math.inf`` never
+    expires). When the cache is full, the least recently used entry is evicted.
+
+    All operations run on the event loop thread without awaiting between the
+    lookup and the store, so no lock is required.
+    """
+
+    def __init__(self, name: str, ttl: float, maxsize: int = DEFAULT_CACHE_MAXSIZE):
+        """Create a cache and register it for stats reporting.
+
+        Args:
+            name: Cache name used in stats output (e.g., "tradier.quote")
+            ttl: Default time-to-live in seconds (math.inf for no expiry)
+            maxsize: Maximum number of entries before LRU eviction
+        """
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        _cache_registry[name] = self
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key, evicting the least recently used entry if full.
+
+        Args:
+            key: Normalized cache key
+            value: Value to store
+            ttl: Entry time-to-live in seconds (defaults to the cache TTL)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[str]],
+        ttl: Optional[float] = None,
+    ) -> str:
+        """Return the cached response for key, fetching and storing it on a miss.
+
+        Args:
+            key: Normalized cache key
+            fetch: Zero-argument callable returning the awaitable to run on a miss
+            ttl: Entry time-to-live in seconds (defaults to the cache TTL)
+
+        Returns:
+            Cached or freshly fetched response string. Error responses are
+            returned to the caller but never stored.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        result = await fetch()
+        if not is_error_response(result):
+            self.set(key, result, ttl)
+        return result
+
+    def clear(self) -> None:
+        """Remove all entries (stats counters are kept)."""
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return hit/miss/eviction counters and current size."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Registry of all caches created in the process (name -> cache)
+_cache_registry: dict[str, AsyncTTLCache] = {}
+
+
+def get_cache_stats() -> dict[str, dict]:
+    """Get stats for every registered cache.
+
+    Returns:
+        Dictionary mapping cache name to its stats() output
+    """
+    return {name: cache.stats() for name, cache in _cache_registry.items()}
+
+
+def clear_all_caches() -> None:
+    """Remove all entries from every registered cache (stats counters are kept)."""
+    for cache in _cache_registry.values():
+        cache.clear()
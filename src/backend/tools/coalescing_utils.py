@@ -0,0 +1,82 @@
+"""Request Coalescing Utility Module.
+
+This module provides single-flight request coalescing for the tool fetch paths.
+
+Gradio serves up to 10 concurrent requests, and several users frequently ask
+about the same ticker at the same time. Without coalescing, every concurrent
+identical call makes its own upstream request. With SingleFlight, the first
+caller for a key starts the work and every concurrent caller with the same key
+awaits that same in-flight task, so upstream calls (and rate-limit usage) no
+longer grow with the number of concurrent users.
+
+Results are shared only while the request is in flight; nothing is retained
+once it completes (see cache_utils.py for response caching).
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """Deduplicate concurrent async calls that share the same key.
+
+    Usage Pattern:
+        ```python
+        flights = SingleFlight("tradier.http")
+        data = await flights.do(key, lambda: fetch(url, params))
+        ```
+    """
+
+    def __init__(self, name: str):
+        """Create a coalescing group.
+
+        Args:
+            name: Group name used in stats output (e.g., "http")
+        """
+        self.name = name
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fn() once per key among concurrent callers and share its result.
+
+        Args:
+            key: Hashable identity of the request (normalized arguments)
+            fn: Zero-argument callable returning the awaitable to run
+
+        Returns:
+            The result of the shared call. Exceptions raised by the shared call
+            are re-raised in every waiting caller.
+
+        Note:
+            The shared task is shielded, so cancelling one waiter (e.g. a
+            Gradio client disconnecting) does not cancel the request for the
+            other waiters.
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+            self.started += 1
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        """Remove a completed task from the in-flight table."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception as retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        """Return started/coalesced counters and the current in-flight count."""
+        return {
+            "in_flight": len(self._in_flight),
+            "started": self.started,
+            "coalesced": self.coalesced,
+        }
@@ -0,0 +1,147 @@
+"""Tool Output Encoding Utility Module.
+
+Tool responses stay in the session history and are re-sent to the model on
+every turn, so whitespace in tool payloads is billed again and again. This
+module lets each tool's output encoding be selected in config:
+
+- "pretty":  Indented JSON (indent=2) and fixed-width, padded markdown tables
+- "compact": JSON without whitespace; markdown tables without padding
+- "table":   Minimal CSV-like table for JSON payloads (header line + one line
+             per record); markdown tables without padding
+
+Configuration (config/app.config.json → backend.tools.outputEncoding):
+    "outputEncoding": {
+      "default": "compact",
+      "get_stock_quote": "table"
+    }
+
+Error responses (see error_utils.py) are always compact JSON, so
+is_error_response() and the agent's error handling rules keep working.
+"""
+
+import json
+from typing import Any
+
+from ..config import settings
+from ..utils.tracing_utils import traced
+from .error_utils import is_error_response
+
+# Output encoding modes
+ENCODING_PRETTY = "pretty"
+ENCODING_COMPACT = "compact"
+ENCODING_TABLE = "table"
+OUTPUT_ENCODINGS = (ENCODING_PRETTY, ENCODING_COMPACT, ENCODING_TABLE)
+
+# Separator for list values inside a table cell (e.g., expiration dates)
+TABLE_LIST_SEPARATOR = " "
+
+
+def get_output_encoding(tool_name: str) -> str:
+    """Get the configured output encoding for a tool.
+
+    Args:
+        tool_name: Public tool name (e.g., "get_stock_quote")
+
+    Returns:
+        "pretty", "compact" or "table" (unknown values fall back to "pretty")
+    """
+    encodings = settings.output_encoding
+    encoding = encodings.get(tool_name, encodings.get("default", ENCODING_PRETTY))
+    return encoding if encoding in OUTPUT_ENCODINGS else ENCODING_PRETTY
+
+
+def _format_cell(value: Any) -> str:
+    """Format one table cell (lists are space-joined, nested dicts as compact JSON)."""
+    if isinstance(value, list):
+        return TABLE_LIST_SEPARATOR.join(_format_cell(item) for item in value)
+    if isinstance(value, dict):
+        return json.dumps(value, separators=(",", ":"))
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    text = str(value)
+    return f'"{text}"' if "," in text or "\n" in text else text
+
+
+def _flatten(record: dict, prefix: str = "") -> dict:
+    """Flatten nested dicts into dotted keys (e.g., exchanges.nyse)."""
+    flat = {}
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{name}."))
+        else:
+            flat[name] = value
+    return flat
+
+
+def encode_table(data: Any) -> str:
+    """Encode a dict or list of dicts as a minimal CSV-like table.
+
+    Args:
+        data: Record dict or list of record dicts
+
+    Returns:
+        Header line of column names followed by one comma-separated line per record
+
+    Examples:
+        >>> encode_table({"ticker": "SPY", "current_price": 671.16})
+        'ticker,current_price\\nSPY,671.16'
+    """
+    records = [_flatten(record) for record in (data if isinstance(data, list) else [data])]
+    columns: list[str] = []
+    for record in records:
+        columns.extend(key for key in record if key not in columns)
+
+    lines = [",".join(columns)]
+    for record in records:
+        lines.append(",".join(_format_cell(record.get(column)) for column in columns))
+    return "\n".join(lines)
+
+
+@traced("format")
+def encode_json_response(data: Any, tool_name: str) -> str:
+    """Encode a JSON-style tool response using the tool's configured encoding.
+
+    Args:
+        data: Response dict or list of dicts
+        tool_name: Public tool name used to look up the encoding
+
+    Returns:
+        Encoded response string
+    """
+    encoding = get_output_encoding(tool_name)
+    if encoding == ENCODING_PRETTY:
+        return json.dumps(data, indent=2)
+    if encoding == ENCODING_TABLE and data:
+        return encode_table(data)
+    return json.dumps(data, separators=(",", ":"))
+
+
+def merge_encoded_responses(results: list[str], tool_name: str) -> str:
+    """Merge per-ticker responses produced by encode_json_response().
+
+    JSON encodings are merged into one JSON array (error objects stay in
+    place). Table encoding keeps a single header line, followed by all rows
+    and then any error responses.
+
+    Args:
+        results: Encoded responses in ticker order
+        tool_name: Public tool name used to look up the encoding
+
+    Returns:
+        Merged response string (a single result is returned unchanged)
+    """
+    if len(results) == 1:
+        return results[0]
+
+    if get_output_encoding(tool_name) != ENCODING_TABLE:
+        return encode_json_response([json.loads(result) for result in results], tool_name)
+
+    tables = [result for result in results if not is_error_response(result)]
+    errors = [result for result in results if is_error_response(result)]
+    lines = tables[0].split("\n")[:1] if tables else []
+    for table in tables:
+        lines.extend(table.split("\n")[1:])
+    return "\n".join(lines + errors)
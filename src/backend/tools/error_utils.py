@@ -56,3 +56,25 @@ def create_error_response(error_type: str, message: str, **extra_fields: Any) ->
         **extra_fields
     }
     return json.dumps(response)
+
+
+def is_error_response(response: str) -> bool:
+    """Check whether a tool response string is an error response.
+
+    Recognizes both the JSON format produced by create_error_response() and the
+    "❌" prefixed markdown errors returned by the formatted (markdown) tools.
+
+    Args:
+        response: Tool response string
+
+    Returns:
+        True if the response represents an error, False otherwise
+
+    Examples:
+        >>> is_error_response(create_error_response("Timeout", "Request timed out"))
+        True
+
+        >>> is_error_response('{"ticker": "SPY", "current_price": 671.16}')
+        False
+    """
+    return response.startswith('{"error": ') or response.startswith("❌")
@@ -0,0 +1,57 @@
+"""Multi-Ticker Fan-Out Utility Module.
+
+This module lets single-ticker tools accept comma-separated tickers (like
+get_stock_quote does natively) by fanning out one call per ticker with bounded
+asyncio concurrency and merging the results into a single tool response.
+
+A 3-ticker comparison then costs one tool round instead of one LLM turn per
+ticker, while the concurrency bound keeps upstream bursts in check (the
+per-provider rate limiters still apply to every request).
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# Maximum concurrent per-ticker calls within one tool invocation
+MAX_FANOUT_CONCURRENCY = 3
+
+# Separator between per-ticker markdown sections in merged responses
+MARKDOWN_SECTION_SEPARATOR = "\n\n"
+
+
+async def fan_out(
+    items: Sequence[T],
+    fn: Callable[[T], Awaitable[str]],
+    max_concurrency: int = MAX_FANOUT_CONCURRENCY,
+) -> list[str]:
+    """Run fn for every item with bounded concurrency, preserving input order.
+
+    Args:
+        items: Items to process (e.g., tickers)
+        fn: Async function called once per item
+        max_concurrency: Maximum number of calls in flight at once
+
+    Returns:
+        List of results in the same order as items
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(item: T) -> str:
+        async with semaphore:
+            return await fn(item)
+
+    return await asyncio.gather(*(run(item) for item in items))
+
+
+def merge_markdown_results(results: list[str]) -> str:
+    """Merge per-ticker markdown responses into one response.
+
+    Args:
+        results: Markdown responses in ticker order
+
+    Returns:
+        Sections joined by a blank line (a single result is returned unchanged)
+    """
+    return MARKDOWN_SECTION_SEPARATOR.join(results)
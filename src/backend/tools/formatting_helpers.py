@@ -5,6 +5,13 @@ into markdown. All tools use these helpers to generate deterministic, standardiz
 markdown output instead of returning raw JSON.
 """
 
+from datetime import datetime
+
+import numpy as np
+
+from ..utils.market_calendar import MARKET_TIMEZONE
+from ..utils.tracing_utils import traced
+
 
 def format_strike_price(strike: float) -> str:
     """Format strike price: always show 2 decimal places for consistent width.
@@ -67,16 +74,18 @@ def format_number_with_commas(value: int) -> str:
     return f"{value:,}"
 
 
+@traced("format")
 def create_options_chain_table(
     ticker: str,
     option_type: str,
     expiration_date: str,
     current_price: float,
     options: list[dict],
+    padded: bool = True,
 ) -> str:
     """Create formatted markdown table for options chain.
 
-    Column Order: Strike ($), Bid ($), Ask ($), Delta, Vol, OI, IV
+    Column Order: Strike ($), Bid ($), Ask ($), Delta, Gamma, Theta, Vega, Vol, OI, IV
 
     Args:
         ticker: Stock ticker symbol (e.g., "SPY", "NVDA")
@@ -84,8 +93,11 @@ def create_options_chain_table(
         expiration_date: Expiration date in YYYY-MM-DD format
         current_price: Current underlying stock price
         options: List of option dicts with required fields:
-                 - strike, bid, ask, delta, implied_volatility,
-                   volume, open_interest
+                 - strike, bid, ask, delta, gamma, theta, vega,
+                   implied_volatility, volume, open_interest
+                 - local_greeks (optional): greeks computed locally (Black-Scholes)
+        padded: Pad columns to fixed widths (False emits a minimal table,
+                e.g. "|$672.00|$1.04|...|", for fewer tokens)
 
     Returns:
         Formatted markdown string with:
@@ -99,9 +111,9 @@ def create_options_chain_table(
         📊 SPY Call Options Chain (Expiring 2025-10-17)
         Current Price: $671.16
 
-        | Strike ($) | Bid ($) | Ask ($) | Delta | Vol     | OI     | IV  | Gamma |
-        |-----------|---------|---------|-------|---------|--------|-----|-------|
-        | 672       | 1.04    | 1.10    | 0.38  | 135,391 | 16,023 | 11% | 0.10  |
+        | Strike ($) | Bid ($) | Ask ($) | Delta | Gamma  | Theta | Vega | Vol     | OI     | IV  |
+        |-----------|---------|---------|-------|--------|-------|------|---------|--------|-----|
+        | $672.00   | $1.04   | $1.10   | 0.38  | 0.0305 | -0.41 | 0.37 | 135,391 | 16,023 | 11% |
         ...
 
         Source: Tradier
@@ -114,6 +126,9 @@ def create_options_chain_table(
         ("Bid ($)", 7, ">"),        # Right-aligned, max "$9.53"
         ("Ask ($)", 7, ">"),        # Right-aligned, max "$9.60"
         ("Delta", 5, ">"),          # Right-aligned, max "0.85"
+        ("Gamma", 6, ">"),          # Right-aligned, max "0.0305"
+        ("Theta", 5, ">"),          # Right-aligned, max "-0.41"
+        ("Vega", 5, ">"),           # Right-aligned, max "0.37"
         ("Vol", 9, ">"),            # Right-aligned, max "135,391" + padding
         ("OI", 9, ">"),             # Right-aligned, max "135,391" + padding
         ("IV", 4, ">"),             # Right-aligned, max "149%"
@@ -130,14 +145,22 @@ def create_options_chain_table(
     lines.append(f"Current Price: ${current_price:.2f}")
     lines.append("")
 
+    # Minimal table: no padding, same columns and values
+    if not padded:
+        columns = [(header, 0, align) for header, _, align in columns]
+    cell_separator = " | " if padded else "|"
+
+    def table_line(parts: list[str]) -> str:
+        return cell_separator.join([""] + parts + [""]).strip()
+
     # Build header line dynamically
     header_parts = [header for header, _, _ in columns]
-    header_line = "| " + " | ".join(f"{h:^{columns[i][1]}}" for i, h in enumerate(header_parts)) + " |"
+    header_line = table_line([f"{h:^{columns[i][1]}}" for i, h in enumerate(header_parts)])
     lines.append(header_line)
 
     # Build separator line dynamically (dashes match column widths, colon REPLACES last dash)
-    separator_parts = ["-" * (width - 1) + ":" for _, width, _ in columns]
-    separator_line = "| " + " | ".join(separator_parts) + " |"
+    separator_parts = ["-" * max(1, width - 1) + ":" for _, width, _ in columns]
+    separator_line = table_line(separator_parts)
     lines.append(separator_line)
 
     # Table rows
@@ -146,22 +169,128 @@ def create_options_chain_table(
         bid = f"${opt['bid']:.2f}"
         ask = f"${opt['ask']:.2f}"
         delta = f"{opt['delta']:.2f}"
+        gamma = f"{opt['gamma']:.4f}"
+        theta = f"{opt['theta']:.2f}"
+        vega = f"{opt['vega']:.2f}"
         vol = format_number_with_commas(opt["volume"])
         oi = format_number_with_commas(opt["open_interest"])
         iv = format_percentage_int(opt["implied_volatility"])
 
         # Format row with proper alignment
-        values = [strike, bid, ask, delta, vol, oi, iv]
+        values = [strike, bid, ask, delta, gamma, theta, vega, vol, oi, iv]
         row_parts = [f"{val:>{columns[i][1]}}" for i, val in enumerate(values)]
-        row_line = "| " + " | ".join(row_parts) + " |"
+        row_line = table_line(row_parts)
         lines.append(row_line)
 
+    lines.append("")
+    if any(opt.get("local_greeks") for opt in options):
+        lines.append("Source: Tradier (greeks: local Black-Scholes)")
+    else:
+        lines.append("Source: Tradier")
+
+    return "\n".join(lines)
+
+
+@traced("format")
+def create_options_surface_table(
+    ticker: str,
+    current_price: float,
+    expirations: list[str],
+    strikes: np.ndarray,
+    implied_volatility: np.ndarray,
+    delta: np.ndarray,
+    atm_implied_volatility: np.ndarray,
+    padded: bool = True,
+) -> str:
+    """Create formatted markdown table for a strike × expiration options surface.
+
+    Each cell shows "IV / Delta" of the out-of-the-money option (call above
+    the current price, put below); "-" where an expiration lists no such
+    strike. The last row is the at-the-money IV per expiration.
+
+    Args:
+        ticker: Stock ticker symbol (e.g., "SPY")
+        current_price: Current underlying stock price
+        expirations: Expiration dates (YYYY-MM-DD), one per column
+        strikes: Strike prices, one per row (descending)
+        implied_volatility: IV percentages, shape (strikes, expirations), NaN if missing
+        delta: Deltas, shape (strikes, expirations), NaN if missing
+        atm_implied_volatility: At-the-money IV percentage per expiration
+        padded: Pad columns to fixed widths (False emits a minimal table)
+
+    Returns:
+        Formatted markdown string with header, table and source attribution
+
+    Example:
+        ```
+        📊 SPY Options Surface (IV / Delta, 2 Expirations)
+        Current Price: $676.01
+        Calls above current price, puts below
+
+        | Strike ($) |  2025-10-20  |  2025-10-24  |
+        | ---------: | -----------: | -----------: |
+        |    $678.00 |   12% / 0.41 |   13% / 0.45 |
+        |    $674.00 |  13% / -0.38 |  14% / -0.42 |
+        |     ATM IV |          12% |          14% |
+
+        Source: Tradier
+        ```
+    """
+    strike_width = 10 if padded else 0
+    cell_width = 12 if padded else 0
+    cell_separator = " | " if padded else "|"
+
+    def table_line(parts: list[str]) -> str:
+        return cell_separator.join([""] + parts + [""]).strip()
+
+    def cell(iv: float, option_delta: float) -> str:
+        if np.isnan(iv):
+            return "-"
+        return f"{format_percentage_int(iv)} / {option_delta:.2f}"
+
+    lines = [
+        f"📊 {ticker} Options Surface (IV / Delta, {len(expirations)} Expirations)",
+        f"Current Price: ${current_price:.2f}",
+        "Calls above current price, puts below",
+        "",
+        table_line(
+            [f"{'Strike ($)':^{strike_width}}"]
+            + [f"{expiration:^{cell_width}}" for expiration in expirations]
+        ),
+        table_line(
+            ["-" * max(1, strike_width - 1) + ":"]
+            + ["-" * max(1, cell_width - 1) + ":" for _ in expirations]
+        ),
+    ]
+
+    for row, strike in enumerate(strikes):
+        cells = [
+            cell(implied_volatility[row, column], delta[row, column])
+            for column in range(len(expirations))
+        ]
+        lines.append(
+            table_line(
+                [f"{format_strike_price(float(strike)):>{strike_width}}"]
+                + [f"{value:>{cell_width}}" for value in cells]
+            )
+        )
+
+    atm_cells = [
+        "-" if np.isnan(iv) else format_percentage_int(iv) for iv in atm_implied_volatility
+    ]
+    lines.append(
+        table_line(
+            [f"{'ATM IV':>{strike_width}}"] + [f"{value:>{cell_width}}" for value in atm_cells]
+        )
+    )
+
     lines.append("")
     lines.append("Source: Tradier")
 
     return "\n".join(lines)
 
 
+@traced("format")
 def create_price_history_summary(
     ticker: str, interval: str, bars: list[dict], start_date: str, end_date: str
 ) -> str:
@@ -197,16 +326,70 @@ def create_price_history_summary(
     if not bars:
         return f"📊 {ticker} Historical Price Data ({interval}, {start_date} to {end_date})\n\nNo data available\n\nSource: Tradier"
 
-    # Calculate summary statistics
-    opening_price = bars[0]["open"]
-    closing_price = bars[-1]["close"]
+    return _format_price_history_summary(
+        ticker,
+        interval,
+        start_date,
+        end_date,
+        opening_price=bars[0]["open"],
+        closing_price=bars[-1]["close"],
+        period_high=max(bar["high"] for bar in bars),
+        period_low=min(bar["low"] for bar in bars),
+        bar_count=len(bars),
+    )
+
+
+@traced("format")
+def create_price_history_summary_from_columns(
+    ticker: str, interval: str, columns, start_date: str, end_date: str
+) -> str:
+    """Create the create_price_history_summary() markdown from OHLCV column arrays.
+
+    Reads the memory-mapped columns of the local bar store (ohlcv_columnar.py)
+    directly: first open, last close and the high/low reductions, with the
+    same 2-decimal rounding as the per-bar path.
+
+    Args:
+        ticker: Stock ticker symbol (e.g., "SPY", "NVDA")
+        interval: "daily", "weekly", or "monthly"
+        columns: OHLCVColumns for the date range (oldest bar first)
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+
+    Returns:
+        Formatted markdown string (see create_price_history_summary())
+    """
+    if len(columns) == 0:
+        return create_price_history_summary(ticker, interval, [], start_date, end_date)
+
+    return _format_price_history_summary(
+        ticker,
+        interval,
+        start_date,
+        end_date,
+        opening_price=round(float(columns.open[0]), 2),
+        closing_price=round(float(columns.close[-1]), 2),
+        period_high=round(float(np.nanmax(columns.high)), 2),
+        period_low=round(float(np.nanmin(columns.low)), 2),
+        bar_count=len(columns),
+    )
+
+
+def _format_price_history_summary(
+    ticker: str,
+    interval: str,
+    start_date: str,
+    end_date: str,
+    opening_price: float,
+    closing_price: float,
+    period_high: float,
+    period_low: float,
+    bar_count: int,
+) -> str:
+    """Render the historical price summary from precomputed statistics."""
     price_change = closing_price - opening_price
     pct_change = (price_change / opening_price) * 100
 
-    # Calculate period high and low
-    period_high = max(bar["high"] for bar in bars)
-    period_low = min(bar["low"] for bar in bars)
-
     # Format dates for display (remove year if same year)
     start_display = start_date[5:].replace("-", "/")  # MM/DD
     end_display = end_date[5:].replace("-", "/")  # MM/DD
@@ -228,8 +411,8 @@ def create_price_history_summary(
     lines.append(f"Period High: ${period_high:.2f}, Low: ${period_low:.2f}")
 
     # Number of bars with proper plural
-    interval_label = interval if len(bars) != 1 else interval.rstrip("ly")  # Remove 'ly' for singular
-    lines.append(f"{len(bars)} {interval} bars")
+    interval_label = interval if bar_count != 1 else interval.rstrip("ly")  # Remove 'ly' for singular
+    lines.append(f"{bar_count} {interval} bars")
 
     lines.append("")
     lines.append("Source: Tradier")
@@ -237,6 +420,24 @@ def create_price_history_summary(
     return "\n".join(lines)
 
 
+def format_indicator_timestamp(timestamp) -> str:
+    """Format an indicator timestamp as its market (US/Eastern) date.
+
+    Args:
+        timestamp: Unix milliseconds (int/float), ISO string, or "N/A"
+
+    Returns:
+        YYYY-MM-DD; bar timestamps are read in market time, so daily bars
+        stamped at midnight ET show their session date on any server timezone
+    """
+    if isinstance(timestamp, (int, float)):
+        return datetime.fromtimestamp(timestamp / 1000, MARKET_TIMEZONE).strftime("%Y-%m-%d")
+    if isinstance(timestamp, str) and "T" in timestamp:
+        return timestamp.split("T")[0]  # Extract date only
+    return timestamp
+
+
+@traced("format")
 def create_ta_indicators_table(ticker: str, indicators: dict) -> str:
     """Create formatted markdown table for technical analysis indicators.
 
@@ -291,8 +492,6 @@ def create_ta_indicators_table(ticker: str, indicators: dict) -> str:
         Source: Polygon.io API
         ```
     """
-    from datetime import datetime
-
     # Get current date for display
     current_date = datetime.now().strftime("%Y-%m-%d")
 
@@ -310,13 +509,7 @@ def create_ta_indicators_table(ticker: str, indicators: dict) -> str:
     if indicators.get("rsi"):
         rsi = indicators["rsi"]
         value = f"{rsi['value']:.2f}" if isinstance(rsi.get("value"), (int, float)) else "N/A"
-        timestamp = rsi.get("timestamp", "N/A")
-        # Convert Unix timestamp (int/float) to date string
-        if isinstance(timestamp, (int, float)):
-            from datetime import datetime
-            timestamp = datetime.fromtimestamp(timestamp / 1000).strftime("%Y-%m-%d")
-        elif isinstance(timestamp, str) and "T" in timestamp:
-            timestamp = timestamp.split("T")[0]  # Extract date only
+        timestamp = format_indicator_timestamp(rsi.get("timestamp", "N/A"))
         lines.append(f"| RSI       | 14     | {value:6} | {timestamp} |")
     else:
         lines.append(f"| RSI       | 14     | N/A    | N/A        |")
@@ -327,13 +520,7 @@ def create_ta_indicators_table(ticker: str, indicators: dict) -> str:
         macd_value = f"{macd['macd']:.2f}" if isinstance(macd.get("macd"), (int, float)) else "N/A"
         signal_value = f"{macd['signal']:.2f}" if isinstance(macd.get("signal"), (int, float)) else "N/A"
         histogram_value = f"{macd['histogram']:.2f}" if isinstance(macd.get("histogram"), (int, float)) else "N/A"
-        timestamp = macd.get("timestamp", "N/A")
-        # Convert Unix timestamp (int/float) to date string
-        if isinstance(timestamp, (int, float)):
-            from datetime import datetime
-            timestamp = datetime.fromtimestamp(timestamp / 1000).strftime("%Y-%m-%d")
-        elif isinstance(timestamp, str) and "T" in timestamp:
-            timestamp = timestamp.split("T")[0]  # Extract date only
+        timestamp = format_indicator_timestamp(macd.get("timestamp", "N/A"))
 
         lines.append(f"| MACD      | 12/26  | {macd_value:6} | {timestamp} |")
         lines.append(f"| Signal    | 9      | {signal_value:6} | {timestamp} |")
@@ -352,13 +539,7 @@ def create_ta_indicators_table(ticker: str, indicators: dict) -> str:
         if window in sma_dict:
             sma = sma_dict[window]
             value = f"{sma['value']:.2f}" if isinstance(sma.get("value"), (int, float)) else "N/A"
-            timestamp = sma.get("timestamp", "N/A")
-            # Convert Unix timestamp (int/float) to date string
-            if isinstance(timestamp, (int, float)):
-                from datetime import datetime
-                timestamp = datetime.fromtimestamp(timestamp / 1000).strftime("%Y-%m-%d")
-            elif isinstance(timestamp, str) and "T" in timestamp:
-                timestamp = timestamp.split("T")[0]  # Extract date only
+            timestamp = format_indicator_timestamp(sma.get("timestamp", "N/A"))
             lines.append(f"| SMA       | {window:<6} | {value:6} | {timestamp} |")
         else:
             lines.append(f"| SMA       | {window:<6} | N/A    | N/A        |")
@@ -372,13 +553,7 @@ def create_ta_indicators_table(ticker: str, indicators: dict) -> str:
         if window in ema_dict:
             ema = ema_dict[window]
             value = f"{ema['value']:.2f}" if isinstance(ema.get("value"), (int, float)) else "N/A"
-            timestamp = ema.get("timestamp", "N/A")
-            # Convert Unix timestamp (int/float) to date string
-            if isinstance(timestamp, (int, float)):
-                from datetime import datetime
-                timestamp = datetime.fromtimestamp(timestamp / 1000).strftime("%Y-%m-%d")
-            elif isinstance(timestamp, str) and "T" in timestamp:
-                timestamp = timestamp.split("T")[0]  # Extract date only
+            timestamp = format_indicator_timestamp(ema.get("timestamp", "N/A"))
             lines.append(f"| EMA       | {window:<6} | {value:6} | {timestamp} |")
         else:
             lines.append(f"| EMA       | {window:<6} | N/A    | N/A        |")
@@ -0,0 +1,209 @@
+"""Local Black-Scholes greeks engine.
+
+This module computes option greeks and implied volatility locally with NumPy
+for a whole options chain at once, so chains can be shown with greeks when
+Tradier returns none (or when chains are requested without greeks=true, see
+the "optionsGreeks" tool config).
+
+Conventions (match Tradier/ORATS greeks):
+- European Black-Scholes, no dividends, continuously compounded risk-free rate
+- Implied volatility: solved from the bid/ask mid price, as a fraction (0.15)
+- Delta: per $1 move of the underlying (calls 0..1, puts -1..0)
+- Gamma: delta change per $1 move
+- Theta: option value change per calendar day
+- Vega: option value change per 1 volatility point (0.01)
+
+The normal CDF uses the Zelen & Severo polynomial approximation (absolute
+error < 7.5e-8, Abramowitz & Stegun 26.2.17), since SciPy is not a dependency.
+
+All functions broadcast over NumPy arrays; options without a solution (mid
+price outside the no-arbitrage bounds, missing quotes) get NaN.
+"""
+
+import math
+
+import numpy as np
+
+from ..utils.tracing_utils import traced
+
+DEFAULT_RISK_FREE_RATE = 0.04
+DAYS_PER_YEAR = 365.0
+
+# Implied volatility search range (fractions) and convergence
+MIN_VOLATILITY = 1e-4
+MAX_VOLATILITY = 5.0
+IV_PRICE_TOLERANCE = 1e-6
+IV_MAX_ITERATIONS = 100
+
+_SQRT_2PI = math.sqrt(2.0 * math.pi)
+_CDF_P = 0.2316419
+_CDF_B = (0.319381530, -0.356563782, 1.781477937, -1.821255978, 1.330274429)
+
+
+def norm_pdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal density."""
+    return np.exp(-0.5 * x * x) / _SQRT_2PI
+
+
+def norm_cdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal cumulative distribution (|error| < 7.5e-8)."""
+    x = np.asarray(x, dtype=np.float64)
+    t = 1.0 / (1.0 + _CDF_P * np.abs(x))
+    # Horner evaluation of b1*t + b2*t^2 + ... + b5*t^5
+    polynomial = np.zeros_like(t)
+    for coefficient in reversed(_CDF_B):
+        polynomial = (polynomial + coefficient) * t
+    upper_tail = norm_pdf(x) * polynomial
+    return np.where(x >= 0, 1.0 - upper_tail, upper_tail)
+
+
+def _d1_d2(spot, strike, years, rate, volatility) -> tuple[np.ndarray, np.ndarray]:
+    """Black-Scholes d1 and d2."""
+    volatility_time = volatility * np.sqrt(years)
+    d1 = (np.log(spot / strike) + (rate + 0.5 * volatility * volatility) * years) / volatility_time
+    return d1, d1 - volatility_time
+
+
+def black_scholes_price(spot, strike, years, rate, volatility, is_call) -> np.ndarray:
+    """Black-Scholes option value.
+
+    Args:
+        spot: Underlying price
+        strike: Strike prices
+        years: Time to expiration in years (> 0)
+        rate: Risk-free rate (continuously compounded)
+        volatility: Volatility as a fraction (> 0)
+        is_call: True for calls, False for puts (scalar or array)
+
+    Returns:
+        Option values
+    """
+    d1, d2 = _d1_d2(spot, strike, years, rate, volatility)
+    discounted_strike = strike * np.exp(-rate * years)
+    call = spot * norm_cdf(d1) - discounted_strike * norm_cdf(d2)
+    put = discounted_strike * norm_cdf(-d2) - spot * norm_cdf(-d1)
+    return np.where(is_call, call, put)
+
+
+def black_scholes_greeks(spot, strike, years, rate, volatility, is_call) -> dict[str, np.ndarray]:
+    """Black-Scholes delta, gamma, theta and vega.
+
+    Args:
+        spot: Underlying price
+        strike: Strike prices
+        years: Time to expiration in years (> 0)
+        rate: Risk-free rate (continuously compounded)
+        volatility: Volatility as a fraction (NaN propagates to every greek)
+        is_call: True for calls, False for puts (scalar or array)
+
+    Returns:
+        Dict with "delta", "gamma", "theta" (per day) and "vega" (per vol point)
+    """
+    d1, d2 = _d1_d2(spot, strike, years, rate, volatility)
+    density = norm_pdf(d1)
+    sqrt_years = np.sqrt(years)
+    discounted_strike = strike * np.exp(-rate * years)
+
+    delta = np.where(is_call, norm_cdf(d1), norm_cdf(d1) - 1.0)
+    gamma = density / (spot * volatility * sqrt_years)
+    time_decay = -spot * density * volatility / (2.0 * sqrt_years)
+    theta = np.where(
+        is_call,
+        time_decay - rate * discounted_strike * norm_cdf(d2),
+        time_decay + rate * discounted_strike * norm_cdf(-d2),
+    )
+    vega = spot * density * sqrt_years
+    return {
+        "delta": delta,
+        "gamma": gamma,
+        "theta": theta / DAYS_PER_YEAR,
+        "vega": vega / 100.0,
+    }
+
+
+def implied_volatility(option_price, spot, strike, years, rate, is_call) -> np.ndarray:
+    """Solve Black-Scholes implied volatility for many options at once.
+
+    Safeguarded Newton iteration: each option keeps a bracket [low, high]
+    around its solution (the value is increasing in volatility) and takes a
+    bisection step whenever the Newton step leaves the bracket.
+
+    Args:
+        option_price: Option prices (e.g., bid/ask mid; NaN for no quote)
+        spot: Underlying price
+        strike: Strike prices
+        years: Time to expiration in years (> 0)
+        rate: Risk-free rate (continuously compounded)
+        is_call: True for calls, False for puts (scalar or array)
+
+    Returns:
+        Volatilities as fractions, NaN where the price has no solution in
+        [MIN_VOLATILITY, MAX_VOLATILITY]
+    """
+    option_price, strike, is_call = np.broadcast_arrays(
+        np.asarray(option_price, dtype=np.float64),
+        np.asarray(strike, dtype=np.float64),
+        np.asarray(is_call, dtype=bool),
+    )
+    discounted_strike = strike * np.exp(-rate * years)
+    lower_bound = np.where(
+        is_call,
+        np.maximum(spot - discounted_strike, 0.0),
+        np.maximum(discounted_strike - spot, 0.0),
+    )
+    upper_bound = np.where(is_call, spot, discounted_strike)
+    with np.errstate(invalid="ignore"):
+        solvable = (option_price > lower_bound) & (option_price < upper_bound)
+
+    low = np.full(option_price.shape, MIN_VOLATILITY)
+    high = np.full(option_price.shape, MAX_VOLATILITY)
+    solvable &= black_scholes_price(spot, strike, years, rate, high, is_call) >= option_price
+
+    # Brenner-Subrahmanyam at-the-money estimate as the starting point
+    volatility = np.clip(np.sqrt(2.0 * math.pi / years) * option_price / spot, 0.05, 1.0)
+    volatility = np.where(solvable, volatility, np.nan)
+
+    for _ in range(IV_MAX_ITERATIONS):
+        value = black_scholes_price(spot, strike, years, rate, volatility, is_call)
+        difference = value - option_price
+        active = solvable & (np.abs(difference) > IV_PRICE_TOLERANCE)
+        if not active.any():
+            break
+        high = np.where(active & (difference > 0), volatility, high)
+        low = np.where(active & (difference < 0), volatility, low)
+
+        d1, _ = _d1_d2(spot, strike, years, rate, volatility)
+        vega = spot * norm_pdf(d1) * np.sqrt(years)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = volatility - difference / vega
+        in_bracket = (newton > low) & (newton < high)
+        step = np.where(in_bracket, newton, 0.5 * (low + high))
+        volatility = np.where(active, step, volatility)
+
+    return volatility
+
+
+@traced("compute")
+def compute_chain_greeks(bid, ask, spot, strike, years, rate, is_call) -> dict[str, np.ndarray]:
+    """Implied volatility and greeks for a chain from bid/ask quotes in one pass.
+
+    Args:
+        bid: Bid prices (0 when there is no bid)
+        ask: Ask prices (0 when there is no ask)
+        spot: Underlying price
+        strike: Strike prices
+        years: Time to expiration in years (> 0)
+        rate: Risk-free rate (continuously compounded)
+        is_call: True for calls, False for puts (scalar or array)
+
+    Returns:
+        Dict with "implied_volatility" (fraction), "delta", "gamma", "theta"
+        and "vega"; NaN for options without an ask or a solvable mid price
+    """
+    bid = np.asarray(bid, dtype=np.float64)
+    ask = np.asarray(ask, dtype=np.float64)
+    mid = np.where(ask > 0, 0.5 * (bid + ask), np.nan)
+    volatility = implied_volatility(mid, spot, strike, years, rate, is_call)
+    greeks = black_scholes_greeks(spot, strike, years, rate, volatility, is_call)
+    greeks["implied_volatility"] = volatility
+    return greeks
@@ -0,0 +1,225 @@
+"""Local technical indicator engine.
+
+This module computes the technical analysis indicators shown by get_ta_indicators
+(RSI-14, MACD 12/26/9, SMA and EMA 5/10/20/50/200) locally with NumPy from a
+single series of closing prices, instead of requesting each indicator from the
+Polygon.io indicator endpoints.
+
+Conventions (match standard charting/TA-Lib definitions):
+- SMA: Simple rolling mean of the last `window` closes
+- EMA: alpha = 2 / (window + 1), seeded with the SMA of the first `window` closes
+- RSI: Wilder smoothing (alpha = 1 / window), seeded with the mean gain/loss of
+  the first `window` changes
+- MACD: EMA(12) - EMA(26); Signal: EMA(9) of MACD; Histogram: MACD - Signal
+
+All series functions return arrays aligned with the input, with NaN where the
+indicator is not yet defined (not enough bars).
+"""
+
+import math
+
+import numpy as np
+
+from ..utils.tracing_utils import traced
+
+# Indicator windows shown in the TA table
+SMA_WINDOWS = (5, 10, 20, 50, 200)
+EMA_WINDOWS = (5, 10, 20, 50, 200)
+RSI_WINDOW = 14
+MACD_SHORT_WINDOW = 12
+MACD_LONG_WINDOW = 26
+MACD_SIGNAL_WINDOW = 9
+
+# Largest growth factor allowed in the closed-form smoothing before re-basing
+_MAX_SMOOTHING_SCALE = 1e100
+
+
+def _exponential_smoothing(values: np.ndarray, alpha: float, seed: float) -> np.ndarray:
+    """Apply y[t] = (1 - alpha) * y[t-1] + alpha * x[t] with y[-1] = seed.
+
+    Vectorized closed form: within a block, y[k] = d^(k+1) * (seed + alpha *
+    sum_{j<=k} x[j] * d^-(j+1)) with d = 1 - alpha, evaluated with cumsum. The
+    series is processed in blocks short enough that d^-k cannot overflow.
+
+    Args:
+        values: Input series (float64)
+        alpha: Smoothing factor in (0, 1]
+        seed: Smoothed value preceding values[0]
+
+    Returns:
+        Smoothed series with the same length as values
+    """
+    decay = 1.0 - alpha
+    result = np.empty_like(values)
+    if decay <= 0.0:
+        result[:] = values
+        return result
+
+    block = max(1, int(math.log(_MAX_SMOOTHING_SCALE) / -math.log(decay)))
+    previous = seed
+    for start in range(0, len(values), block):
+        chunk = values[start:start + block]
+        powers = decay ** np.arange(1, len(chunk) + 1)
+        scaled = np.cumsum(chunk / powers)
+        result[start:start + len(chunk)] = powers * (previous + alpha * scaled)
+        previous = result[start + len(chunk) - 1]
+    return result
+
+
+def compute_sma(close: np.ndarray, window: int) -> np.ndarray:
+    """Compute the simple moving average series.
+
+    Args:
+        close: Closing prices, oldest first
+        window: Averaging window in bars
+
+    Returns:
+        SMA series (NaN for the first window - 1 bars)
+    """
+    result = np.full(len(close), np.nan)
+    if len(close) < window:
+        return result
+
+    cumulative = np.cumsum(np.insert(close, 0, 0.0))
+    result[window - 1:] = (cumulative[window:] - cumulative[:-window]) / window
+    return result
+
+
+def compute_ema(close: np.ndarray, window: int) -> np.ndarray:
+    """Compute the exponential moving average series (SMA-seeded).
+
+    Args:
+        close: Closing prices, oldest first
+        window: EMA window in bars
+
+    Returns:
+        EMA series (NaN for the first window - 1 bars)
+    """
+    result = np.full(len(close), np.nan)
+    if len(close) < window:
+        return result
+
+    seed = float(np.mean(close[:window]))
+    result[window - 1] = seed
+    result[window:] = _exponential_smoothing(close[window:], 2.0 / (window + 1), seed)
+    return result
+
+
+def compute_rsi(close: np.ndarray, window: int = RSI_WINDOW) -> np.ndarray:
+    """Compute the Relative Strength Index series (Wilder smoothing).
+
+    Args:
+        close: Closing prices, oldest first
+        window: RSI window in bars (default: 14)
+
+    Returns:
+        RSI series in the 0-100 range (NaN for the first window bars)
+    """
+    result = np.full(len(close), np.nan)
+    if len(close) <= window:
+        return result
+
+    changes = np.diff(close)
+    gains = np.where(changes > 0, changes, 0.0)
+    losses = np.where(changes < 0, -changes, 0.0)
+
+    alpha = 1.0 / window
+    avg_gain = np.empty(len(changes) - window + 1)
+    avg_loss = np.empty_like(avg_gain)
+    avg_gain[0] = gains[:window].mean()
+    avg_loss[0] = losses[:window].mean()
+    avg_gain[1:] = _exponential_smoothing(gains[window:], alpha, avg_gain[0])
+    avg_loss[1:] = _exponential_smoothing(losses[window:], alpha, avg_loss[0])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = np.where(avg_loss == 0.0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+    result[window:] = rsi
+    return result
+
+
+def compute_macd(
+    close: np.ndarray,
+    short_window: int = MACD_SHORT_WINDOW,
+    long_window: int = MACD_LONG_WINDOW,
+    signal_window: int = MACD_SIGNAL_WINDOW,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute the MACD line, signal line and histogram series.
+
+    Args:
+        close: Closing prices, oldest first
+        short_window: Fast EMA window (default: 12)
+        long_window: Slow EMA window (default: 26)
+        signal_window: Signal EMA window (default: 9)
+
+    Returns:
+        Tuple of (macd, signal, histogram) series
+    """
+    macd = compute_ema(close, short_window) - compute_ema(close, long_window)
+    signal = np.full(len(close), np.nan)
+
+    first_valid = long_window - 1
+    if len(close) > first_valid:
+        signal[first_valid:] = compute_ema(macd[first_valid:], signal_window)
+
+    return macd, signal, macd - signal
+
+
+def _last_value(series: np.ndarray):
+    """Return the last element as a float, or None if it is not defined."""
+    if len(series) == 0 or not np.isfinite(series[-1]):
+        return None
+    return float(series[-1])
+
+
+@traced("compute")
+def compute_ta_indicators(timestamps: np.ndarray, close: np.ndarray) -> dict:
+    """Compute all TA table indicators from one series of bars.
+
+    Args:
+        timestamps: Bar start timestamps (Unix milliseconds), oldest first
+        close: Closing prices aligned with timestamps
+
+    Returns:
+        Indicators dict in the format expected by create_ta_indicators_table():
+        {"rsi": {...} or None, "macd": {...} or None, "sma_values": [...], "ema_values": [...]}
+        Values are taken from the most recent bar; indicators without enough
+        bars are omitted (displayed as N/A).
+    """
+    close = np.asarray(close, dtype=np.float64)
+    if len(close) == 0:
+        return {"rsi": None, "macd": None, "sma_values": [], "ema_values": []}
+
+    timestamp = int(timestamps[-1])
+
+    rsi_value = _last_value(compute_rsi(close))
+    rsi_data = {"value": rsi_value, "timestamp": timestamp} if rsi_value is not None else None
+
+    macd, signal, histogram = compute_macd(close)
+    macd_value = _last_value(macd)
+    macd_data = None
+    if macd_value is not None:
+        macd_data = {
+            "macd": macd_value,
+            "signal": _last_value(signal),
+            "histogram": _last_value(histogram),
+            "timestamp": timestamp,
+        }
+
+    sma_values = []
+    for window in SMA_WINDOWS:
+        value = _last_value(compute_sma(close, window))
+        if value is not None:
+            sma_values.append({"window": window, "value": value, "timestamp": timestamp})
+
+    ema_values = []
+    for window in EMA_WINDOWS:
+        value = _last_value(compute_ema(close, window))
+        if value is not None:
+            ema_values.append({"window": window, "value": value, "timestamp": timestamp})
+
+    return {
+        "rsi": rsi_data,
+        "macd": macd_data,
+        "sma_values": sma_values,
+        "ema_values": ema_values,
+    }
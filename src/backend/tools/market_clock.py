@@ -0,0 +1,165 @@
+"""Cached, Locally Extrapolated Market Clock.
+
+The market state changes only a few times a day at known times, yet every
+get_market_status_and_date_time call requested /v1/markets/clock. MarketClock
+fetches the clock once and keeps it until its next_change time:
+
+- Calls before next_change are answered locally: the cached state, with the
+  timestamp extrapolated from the fetch time (monotonic clock).
+- The first call after next_change fetches a fresh clock, so every new state
+  comes from Tradier.
+- While cached, the clock is revalidated in the background at most every
+  MARKET_CLOCK_REVALIDATE_SECONDS (callers never wait for it), which picks up
+  unscheduled changes such as emergency closures.
+
+next_change is a US/Eastern "HH:MM" without a date. It resolves to the first
+such time after the clock timestamp; a change into a trading state
+(premarket/open/postmarket) is moved to the next session of the NYSE
+calendar when that day has none (weekends, holidays).
+
+The clock is stored in an AsyncTTLCache ("tradier.market_clock"), so hits and
+misses show up in cache stats and /metrics, and clear_all_caches() resets it.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from ..utils.market_calendar import MARKET_TIMEZONE, STATE_CLOSED, get_market_calendar
+from .api_utils import TRADIER_BASE_URL, fetch_json
+from .cache_utils import AsyncTTLCache
+
+# Background revalidation interval while a cached clock is being served
+MARKET_CLOCK_REVALIDATE_SECONDS = 5 * 60
+
+# Bounds for the time a clock is served before the next transition
+MARKET_CLOCK_MIN_TTL = 1
+MARKET_CLOCK_MAX_TTL = 4 * 24 * 60 * 60
+
+_CLOCK_KEY = "clock"
+
+
+class MarketClockError(Exception):
+    """Raised when /v1/markets/clock returns a non-200 status."""
+
+    def __init__(self, status: int):
+        super().__init__(f"Tradier API returned status {status}")
+        self.status = status
+
+
+def seconds_until_next_change(clock: dict) -> Optional[float]:
+    """Seconds from the clock timestamp to its next_change time.
+
+    Args:
+        clock: Tradier clock dict (timestamp, next_change "HH:MM" ET, next_state)
+
+    Returns:
+        Seconds until the transition, or None if the clock has no usable
+        timestamp/next_change
+    """
+    timestamp = clock.get("timestamp")
+    next_change = clock.get("next_change")
+    if not timestamp or not next_change:
+        return None
+    try:
+        change_time = datetime.strptime(next_change, "%H:%M").time()
+    except ValueError:
+        return None
+
+    now = datetime.fromtimestamp(timestamp, MARKET_TIMEZONE)
+    change_date = now.date()
+    if datetime.combine(change_date, change_time, tzinfo=MARKET_TIMEZONE) <= now:
+        change_date += timedelta(days=1)
+
+    # Only a change back to "closed" can happen on a day without a session
+    if clock.get("next_state", STATE_CLOSED) != STATE_CLOSED:
+        try:
+            change_date = get_market_calendar().session_on_or_after(change_date) or change_date
+        except ValueError:
+            pass
+
+    change_at = datetime.combine(change_date, change_time, tzinfo=MARKET_TIMEZONE)
+    return change_at.timestamp() - timestamp
+
+
+class MarketClock:
+    """Tradier market clock served from memory until its next state change."""
+
+    def __init__(self):
+        # Value: (raw clock dict, monotonic fetch time)
+        self._cache = AsyncTTLCache("tradier.market_clock", ttl=MARKET_CLOCK_REVALIDATE_SECONDS)
+        self._revalidate_task: Optional[asyncio.Task] = None
+
+    async def refresh(self, headers: dict) -> dict:
+        """Fetch the clock and cache it until its next change.
+
+        Args:
+            headers: Tradier request headers
+
+        Returns:
+            Raw clock dict (empty if the response had no clock)
+
+        Raises:
+            MarketClockError: Non-200 response
+        """
+        # Concurrent identical requests are coalesced
+        status, data = await fetch_json("tradier", f"{TRADIER_BASE_URL}/v1/markets/clock", headers)
+        if status != 200:
+            raise MarketClockError(status)
+
+        clock = data.get("clock") or {}
+        if clock:
+            ttl = seconds_until_next_change(clock)
+            if ttl is None:
+                ttl = MARKET_CLOCK_REVALIDATE_SECONDS
+            ttl = min(max(ttl, MARKET_CLOCK_MIN_TTL), MARKET_CLOCK_MAX_TTL)
+            self._cache.set(_CLOCK_KEY, (clock, time.monotonic()), ttl)
+        return clock
+
+    async def get_clock(self, headers: dict) -> dict:
+        """Get the current clock, extrapolated from the cached one when possible.
+
+        Args:
+            headers: Tradier request headers (used on a miss or revalidation)
+
+        Returns:
+            Clock dict in Tradier's format; a cached clock has its timestamp
+            advanced by the time elapsed since it was fetched
+
+        Raises:
+            MarketClockError: Non-200 response on a miss
+        """
+        cached = self._cache.get(_CLOCK_KEY)
+        if cached is None:
+            return await self.refresh(headers)
+
+        clock, fetched_at = cached
+        elapsed = time.monotonic() - fetched_at
+        if elapsed >= MARKET_CLOCK_REVALIDATE_SECONDS:
+            self._revalidate_in_background(headers)
+        if not clock.get("timestamp"):
+            return clock
+        return dict(clock, timestamp=int(clock["timestamp"] + elapsed))
+
+    def _revalidate_in_background(self, headers: dict) -> None:
+        """Start one background refresh (no-op while one is running)."""
+        if self._revalidate_task is not None and not self._revalidate_task.done():
+            return
+
+        async def revalidate():
+            try:
+                await self.refresh(headers)
+            except Exception as e:
+                print(f"Warning: Market clock revalidation failed: {e}")
+
+        self._revalidate_task = asyncio.get_running_loop().create_task(revalidate())
+
+
+# Shared market clock
+_market_clock = MarketClock()
+
+
+def get_market_clock() -> MarketClock:
+    """Get the shared market clock."""
+    return _market_clock
@@ -0,0 +1,256 @@
+"""Memory-mapped columnar OHLCV files.
+
+PriceHistoryStore (price_history_store.py) keeps the authoritative bars in
+SQLite, but reading them back still meant a SQL query plus one dict per bar
+for every summary or indicator computation. After each gap fill the store now
+also exports the ticker's bars to one columnar file per ticker/interval, which
+readers map with np.memmap:
+
+- Range reads are two np.searchsorted() calls on the date column and return
+  slices of the mapping (zero-copy, no JSON or row decoding).
+- Files are replaced atomically (write to a temp file, os.replace()), so a
+  reader never sees a partial file. Readers re-map when the file's inode/size/
+  mtime changes; an old mapping stays valid until it is dropped.
+- Several worker processes reading the same file share the OS page cache.
+
+File layout (little-endian, every column 8-byte aligned):
+    header (64 bytes): magic b"OHLCV001", row count (uint64), zero padding
+    date   int64[n]   session date as days since 1970-01-01
+    open   float64[n]
+    high   float64[n]
+    low    float64[n]
+    close  float64[n]
+    volume int64[n]
+
+Usage Pattern:
+    ```python
+    cache = ColumnarOHLCVCache("data/ohlcv")
+    cache.write("SPY", "daily", bars)
+    columns = cache.read_range("SPY", "daily", "2025-07-01", "2025-10-01")
+    columns.close[-1], len(columns)
+    ```
+"""
+
+import os
+import tempfile
+import threading
+from datetime import datetime, timedelta, tzinfo
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+FILE_MAGIC = b"OHLCV001"
+HEADER_SIZE = 64
+FILE_SUFFIX = ".ohlcv"
+
+# Column names and dtypes in file order
+COLUMNS = (
+    ("date", np.dtype("<i8")),
+    ("open", np.dtype("<f8")),
+    ("high", np.dtype("<f8")),
+    ("low", np.dtype("<f8")),
+    ("close", np.dtype("<f8")),
+    ("volume", np.dtype("<i8")),
+)
+
+_MS_PER_DAY = 86_400_000
+_EPOCH = datetime(1970, 1, 1)
+
+
+def date_to_day(value: str) -> int:
+    """Convert a YYYY-MM-DD date to days since the Unix epoch."""
+    return int(np.datetime64(value, "D").astype(np.int64))
+
+
+class OHLCVColumns:
+    """Aligned OHLCV column arrays (views into a mapped file, oldest bar first)."""
+
+    def __init__(self, date, open, high, low, close, volume):
+        self.date = date
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+    def between(self, start_date: str, end_date: str) -> "OHLCVColumns":
+        """Slice the bars dated within [start_date, end_date] (zero-copy).
+
+        Args:
+            start_date: Start date (YYYY-MM-DD, inclusive)
+            end_date: End date (YYYY-MM-DD, inclusive)
+        """
+        lo = int(np.searchsorted(self.date, date_to_day(start_date), side="left"))
+        hi = int(np.searchsorted(self.date, date_to_day(end_date), side="right"))
+        return OHLCVColumns(
+            self.date[lo:hi],
+            self.open[lo:hi],
+            self.high[lo:hi],
+            self.low[lo:hi],
+            self.close[lo:hi],
+            self.volume[lo:hi],
+        )
+
+    def concatenate(self, other: "OHLCVColumns") -> "OHLCVColumns":
+        """Append another set of later bars (copies both into new arrays)."""
+        return OHLCVColumns(
+            *(
+                np.concatenate((getattr(self, name), getattr(other, name)))
+                for name, _ in COLUMNS
+            )
+        )
+
+    def timestamps_ms(self, tz: tzinfo) -> np.ndarray:
+        """Bar dates as Unix milliseconds at midnight in a timezone.
+
+        Matches Polygon daily aggregate timestamps for tz=America/New_York.
+
+        Args:
+            tz: Market timezone
+
+        Returns:
+            int64 array (a new array, not a view)
+        """
+        offsets_ms = np.fromiter(
+            (
+                tz.utcoffset(_EPOCH + timedelta(days=int(day))) // timedelta(milliseconds=1)
+                for day in self.date
+            ),
+            dtype=np.int64,
+            count=len(self.date),
+        )
+        return self.date * _MS_PER_DAY - offsets_ms
+
+
+def columns_from_bars(bars: list[dict]) -> OHLCVColumns:
+    """Build in-memory columns from bar dicts.
+
+    Args:
+        bars: Bar dicts (date, open, high, low, close, volume) sorted by date,
+              one per date; missing prices become NaN, missing volume 0
+
+    Returns:
+        Columns with the file dtypes (new arrays)
+    """
+    rows = len(bars)
+    arrays = [np.fromiter((date_to_day(bar["date"]) for bar in bars), dtype=np.int64, count=rows)]
+    for name, dtype in COLUMNS[1:]:
+        default = 0 if dtype.kind == "i" else np.nan
+        arrays.append(
+            np.fromiter(
+                (default if bar.get(name) is None else bar[name] for bar in bars),
+                dtype=dtype,
+                count=rows,
+            )
+        )
+    return OHLCVColumns(*arrays)
+
+
+def _columns_from_buffer(buffer: np.ndarray, rows: int) -> OHLCVColumns:
+    """Build column views over a mapped file buffer."""
+    arrays = []
+    offset = HEADER_SIZE
+    for _, dtype in COLUMNS:
+        size = rows * dtype.itemsize
+        arrays.append(buffer[offset : offset + size].view(dtype))
+        offset += size
+    return OHLCVColumns(*arrays)
+
+
+class ColumnarOHLCVCache:
+    """Directory of memory-mapped columnar OHLCV files (one per ticker/interval)."""
+
+    def __init__(self, directory: str):
+        """Create the cache.
+
+        Args:
+            directory: Directory for {TICKER}_{interval}.ohlcv files (created on write)
+        """
+        self.directory = Path(directory)
+        # Path → (file signature, mapped columns)
+        self._mapped: dict[Path, tuple[tuple, OHLCVColumns]] = {}
+        self._lock = threading.Lock()
+
+    def path_for(self, ticker: str, interval: str) -> Path:
+        """File path of a ticker/interval."""
+        return self.directory / f"{ticker}_{interval}{FILE_SUFFIX}"
+
+    def write(self, ticker: str, interval: str, bars: list[dict]) -> int:
+        """Replace the ticker's file with the given bars.
+
+        Args:
+            ticker: Normalized ticker symbol
+            interval: Bar interval (e.g., "daily")
+            bars: Bar dicts (date, open, high, low, close, volume) sorted by date,
+                  one per date; missing prices are stored as NaN, missing volume as 0
+
+        Returns:
+            Number of rows written
+        """
+        rows = len(bars)
+        columns = columns_from_bars(bars)
+
+        header = FILE_MAGIC + np.uint64(rows).astype("<u8").tobytes()
+        header = header.ljust(HEADER_SIZE, b"\0")
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(header)
+                for name, _ in COLUMNS:
+                    f.write(getattr(columns, name).tobytes())
+            os.replace(tmp_path, self.path_for(ticker, interval))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        return rows
+
+    def open(self, ticker: str, interval: str) -> Optional[OHLCVColumns]:
+        """Map the ticker's file (re-mapped only when the file was replaced).
+
+        Returns:
+            All bars of the file, or None if there is no (valid) file
+        """
+        path = self.path_for(ticker, interval)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        signature = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            mapped = self._mapped.get(path)
+            if mapped is not None and mapped[0] == signature:
+                return mapped[1]
+
+        if stat.st_size < HEADER_SIZE:
+            return None
+        buffer = np.memmap(path, dtype=np.uint8, mode="r")
+        if bytes(buffer[: len(FILE_MAGIC)]) != FILE_MAGIC:
+            return None
+        rows = int(buffer[len(FILE_MAGIC) : len(FILE_MAGIC) + 8].view("<u8")[0])
+        if len(buffer) < HEADER_SIZE + rows * sum(dtype.itemsize for _, dtype in COLUMNS):
+            return None
+
+        columns = _columns_from_buffer(buffer, rows)
+        with self._lock:
+            self._mapped[path] = (signature, columns)
+        return columns
+
+    def read_range(
+        self, ticker: str, interval: str, start_date: str, end_date: str
+    ) -> Optional[OHLCVColumns]:
+        """Bars dated within [start_date, end_date] as zero-copy column views.
+
+        Returns:
+            Column views (possibly empty), or None if the ticker has no file
+        """
+        columns = self.open(ticker, interval)
+        if columns is None:
+            return None
+        return columns.between(start_date, end_date)
@@ -0,0 +1,407 @@
+"""Strike-Sorted Options Chain Index.
+
+_get_options_chain_both used to filter the raw Tradier option list four times
+per call (type, then above/below the price for calls and again for puts) and
+sort every partition. OptionsChain parses the list once into one
+array-backed OptionSide per option type, sorted by strike (descending, the
+display order), so a strike window around any price is two binary searches
+(np.searchsorted) and a slice.
+
+Window rule (unchanged): up to N strikes strictly above and N strictly below
+the current price; a strike equal to the price is in neither side.
+
+Greeks come from Tradier (greeks=true) when available. Options without
+Tradier greeks, or every option when chains are requested without greeks
+(GREEKS_SOURCE_LOCAL), get IV, delta, gamma, theta and vega from the local
+Black-Scholes engine (greeks_engine.py) in one vectorized pass per chain.
+
+OptionsSurface lines several expirations' chains up on a common strike grid
+(out-of-the-money IV and delta per strike × expiration) for
+get_options_surface.
+
+Parsed chains are cached per (ticker, expiration) and windowed locally for
+every requested price (see get_options_chain_both in tradier_tools.py). The
+cache policy is activity-aware:
+- Regular hours (until OPTIONS_CLOSE_DELAY after the close, when index ETF
+  options stop trading): OPTIONS_CHAIN_CACHE_TTL, or the longer
+  OPTIONS_CHAIN_QUIET_CACHE_TTL for chains with little volume so far.
+- A cached chain is refetched early when the requested price has moved more
+  than OPTIONS_CHAIN_MAX_PRICE_MOVE from the price it was first served for,
+  since bids, asks and deltas move with the underlying.
+- Outside trading hours quotes are frozen: the chain is kept until the next
+  session opens (at most OPTIONS_CHAIN_CLOSED_CACHE_TTL).
+
+Usage Pattern:
+    ```python
+    chain = OptionsChain.from_tradier(data["options"]["option"])
+    rows = chain.calls.window_rows(current_price=671.16, strikes_per_side=10)
+    ```
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+import numpy as np
+
+from ..utils.market_calendar import (
+    MARKET_TIMEZONE,
+    REGULAR_CLOSE,
+    REGULAR_OPEN,
+    get_market_calendar,
+)
+from .cache_utils import (
+    OPTIONS_CHAIN_CACHE_TTL,
+    OPTIONS_CHAIN_CLOSED_CACHE_TTL,
+    OPTIONS_CHAIN_QUIET_CACHE_TTL,
+)
+from .greeks_engine import DAYS_PER_YEAR, DEFAULT_RISK_FREE_RATE, compute_chain_greeks
+
+# Default strikes shown above and below the current price (per option type)
+DEFAULT_STRIKES_PER_SIDE = 10
+
+# Options surface defaults and limits (get_options_surface)
+DEFAULT_SURFACE_EXPIRATIONS = 6
+MAX_SURFACE_EXPIRATIONS = 12
+DEFAULT_SURFACE_STRIKES_PER_SIDE = 5
+
+# Chains with fewer contracts traded today (calls + puts) use the quiet TTL
+OPTIONS_CHAIN_QUIET_VOLUME = 1000
+
+# Relative underlying move after which a cached chain is refetched (market hours)
+OPTIONS_CHAIN_MAX_PRICE_MOVE = 0.005
+
+# Index ETF options (SPY, QQQ, IWM) trade until 16:15 ET
+OPTIONS_CLOSE_DELAY = timedelta(minutes=15)
+
+# Greeks sources ("optionsGreeks.source" tool config)
+GREEKS_SOURCE_TRADIER = "tradier"  # Request greeks=true; compute only missing greeks locally
+GREEKS_SOURCE_LOCAL = "local"      # Request chains without greeks; compute all locally
+
+SECONDS_PER_YEAR = DAYS_PER_YEAR * 24 * 60 * 60
+# Floor for time to expiration (expiring options near and after the close)
+MIN_YEARS_TO_EXPIRATION = 60 / SECONDS_PER_YEAR
+
+
+def _number(value) -> float:
+    """Numeric API field (None/missing → 0)."""
+    return float(value) if value is not None else 0.0
+
+
+class OptionSide:
+    """Options of one type as parallel arrays, sorted by strike descending.
+
+    Equal strikes keep their API order (stable sort).
+    """
+
+    def __init__(self, options: list[dict], is_call: bool):
+        """Parse raw Tradier option dicts of one type.
+
+        Args:
+            options: Option dicts (strike, bid, ask, volume, open_interest, greeks)
+            is_call: True for calls, False for puts
+        """
+        count = len(options)
+        greeks = [opt.get("greeks") or {} for opt in options]
+        strike = np.fromiter((_number(opt.get("strike")) for opt in options), np.float64, count)
+
+        # Descending by strike; searching is done on the ascending negated strikes
+        order = np.argsort(-strike, kind="stable")
+
+        def column(values, dtype=np.float64) -> np.ndarray:
+            return np.fromiter(values, dtype, count)[order]
+
+        self.is_call = is_call
+        self.strike = strike[order]
+        self._negated_strike = -self.strike
+        self.bid = column(_number(opt.get("bid")) for opt in options)
+        self.ask = column(_number(opt.get("ask")) for opt in options)
+        self.delta = column(_number(g.get("delta")) for g in greeks)
+        self.gamma = column(_number(g.get("gamma")) for g in greeks)
+        self.theta = column(_number(g.get("theta")) for g in greeks)
+        self.vega = column(_number(g.get("vega")) for g in greeks)
+        # smv_vol is a fraction; displayed as a percentage
+        self.implied_volatility = column(_number(g.get("smv_vol")) for g in greeks) * 100
+        self.volume = column((int(opt.get("volume") or 0) for opt in options), np.int64)
+        self.open_interest = column(
+            (int(opt.get("open_interest") or 0) for opt in options), np.int64
+        )
+        # Rows without Tradier greeks (none requested, or none computed yet);
+        # fill_missing_greeks() computes them locally
+        self.missing_greeks = column((not g.get("smv_vol") for g in greeks), bool)
+
+    def fill_missing_greeks(self, spot: float, years: float, rate: float) -> int:
+        """Compute IV and greeks locally (Black-Scholes) for rows without Tradier greeks.
+
+        Args:
+            spot: Underlying price
+            years: Time to expiration in years (> 0)
+            rate: Risk-free rate (continuously compounded)
+
+        Returns:
+            Number of rows filled; rows without a solvable bid/ask mid stay 0
+        """
+        missing = self.missing_greeks
+        if not missing.any():
+            return 0
+        greeks = compute_chain_greeks(
+            bid=self.bid[missing],
+            ask=self.ask[missing],
+            spot=spot,
+            strike=self.strike[missing],
+            years=years,
+            rate=rate,
+            is_call=self.is_call,
+        )
+        greeks["implied_volatility"] = greeks["implied_volatility"] * 100
+        for name in ("delta", "gamma", "theta", "vega", "implied_volatility"):
+            getattr(self, name)[missing] = np.nan_to_num(greeks[name])
+        return int(missing.sum())
+
+    def __len__(self) -> int:
+        return len(self.strike)
+
+    def window(self, current_price: float, strikes_per_side: int) -> tuple[int, int, int, int]:
+        """Index ranges of the strikes nearest the price.
+
+        Args:
+            current_price: Underlying price
+            strikes_per_side: Strikes to take strictly above and strictly below
+
+        Returns:
+            (above_start, above_end, below_start, below_end) into the
+            descending arrays; above rows come first
+        """
+        # Strikes > price are the negated strikes < -price (and vice versa)
+        above_end = int(np.searchsorted(self._negated_strike, -current_price, side="left"))
+        below_start = int(np.searchsorted(self._negated_strike, -current_price, side="right"))
+        above_start = max(0, above_end - strikes_per_side)
+        below_end = min(len(self.strike), below_start + strikes_per_side)
+        return above_start, above_end, below_start, below_end
+
+    def lookup(self, strikes: np.ndarray) -> np.ndarray:
+        """Row index of each strike (-1 where this side has no such strike).
+
+        Args:
+            strikes: Strike prices to look up (any order)
+        """
+        if not len(self.strike):
+            return np.full(len(strikes), -1, dtype=np.int64)
+        positions = np.searchsorted(self._negated_strike, -strikes, side="left")
+        clipped = np.minimum(positions, len(self.strike) - 1)
+        return np.where(self.strike[clipped] == strikes, clipped, -1)
+
+    def window_rows(
+        self, current_price: float, strikes_per_side: int = DEFAULT_STRIKES_PER_SIDE
+    ) -> list[dict]:
+        """Rows for create_options_chain_table(), strike descending.
+
+        Args:
+            current_price: Underlying price
+            strikes_per_side: Strikes to take strictly above and strictly below
+
+        Returns:
+            Option dicts (strike, bid, ask, delta, gamma, theta, vega,
+            implied_volatility, volume, open_interest, local_greeks); gamma
+            rounded to 4 decimals, other prices and greeks to 2
+        """
+        above_start, above_end, below_start, below_end = self.window(
+            current_price, strikes_per_side
+        )
+        indices = np.r_[above_start:above_end, below_start:below_end]
+        return [
+            {
+                "strike": round(float(self.strike[i]), 2),
+                "bid": round(float(self.bid[i]), 2),
+                "ask": round(float(self.ask[i]), 2),
+                "delta": round(float(self.delta[i]), 2),
+                "gamma": round(float(self.gamma[i]), 4),
+                "theta": round(float(self.theta[i]), 2),
+                "vega": round(float(self.vega[i]), 2),
+                "implied_volatility": round(float(self.implied_volatility[i]), 2),
+                "volume": int(self.volume[i]),
+                "open_interest": int(self.open_interest[i]),
+                "local_greeks": bool(self.missing_greeks[i]),
+            }
+            for i in indices
+        ]
+
+
+class OptionsChain:
+    """One expiration's chain parsed once into call and put OptionSides."""
+
+    def __init__(self, calls: OptionSide, puts: OptionSide):
+        self.calls = calls
+        self.puts = puts
+        self.total_volume = int(calls.volume.sum() + puts.volume.sum())
+
+    @classmethod
+    def from_tradier(cls, option_list: list[dict]) -> "OptionsChain":
+        """Parse the "option" list of /v1/markets/options/chains.
+
+        Args:
+            option_list: Raw option dicts (a single dict is accepted too)
+        """
+        if isinstance(option_list, dict):
+            option_list = [option_list]
+        calls, puts = [], []
+        for opt in option_list:
+            option_type = opt.get("option_type")
+            if option_type == "call":
+                calls.append(opt)
+            elif option_type == "put":
+                puts.append(opt)
+        return cls(OptionSide(calls, is_call=True), OptionSide(puts, is_call=False))
+
+    def fill_missing_greeks(
+        self,
+        spot: float,
+        expiration_date: str,
+        rate: float = DEFAULT_RISK_FREE_RATE,
+        now: Optional[datetime] = None,
+    ) -> int:
+        """Compute local greeks for every option without Tradier greeks.
+
+        Args:
+            spot: Underlying price
+            expiration_date: Expiration date (YYYY-MM-DD)
+            rate: Risk-free rate (continuously compounded)
+            now: Current time (default: now, US/Eastern)
+
+        Returns:
+            Number of options filled
+        """
+        years = years_to_expiration(expiration_date, now)
+        return self.calls.fill_missing_greeks(spot, years, rate) + self.puts.fill_missing_greeks(
+            spot, years, rate
+        )
+
+
+class OptionsSurface:
+    """Strike × expiration grid of implied volatility and delta.
+
+    Each cell uses the out-of-the-money option: calls for strikes above the
+    current price, puts for strikes below (same strictly-above/below rule as
+    OptionSide.window). Strikes are the union of all expirations' strikes, so
+    a cell is NaN where an expiration does not list that strike.
+    """
+
+    def __init__(
+        self,
+        expirations: list[str],
+        chains: list[OptionsChain],
+        current_price: float,
+        strikes_per_side: int = DEFAULT_SURFACE_STRIKES_PER_SIDE,
+    ):
+        """Build the grid.
+
+        Args:
+            expirations: Expiration dates (YYYY-MM-DD), one per chain
+            chains: Parsed chains in expiration order
+            current_price: Underlying price
+            strikes_per_side: Strikes to take strictly above and strictly below
+        """
+        self.expirations = expirations
+        self.current_price = current_price
+
+        sides = [side for chain in chains for side in (chain.calls, chain.puts)]
+        all_strikes = np.unique(np.concatenate([side.strike for side in sides]))
+        above = all_strikes[all_strikes > current_price][:strikes_per_side]
+        below = all_strikes[all_strikes < current_price][-strikes_per_side:]
+        # Descending, like the chain tables
+        self.strike = np.concatenate([above[::-1], below[::-1]])
+        self.above_count = len(above)
+
+        shape = (len(self.strike), len(chains))
+        self.implied_volatility = np.full(shape, np.nan)
+        self.delta = np.full(shape, np.nan)
+        # At-the-money IV per expiration: mean of the nearest OTM call and put
+        self.atm_implied_volatility = np.full(len(chains), np.nan)
+
+        rows_above = slice(0, self.above_count)
+        rows_below = slice(self.above_count, len(self.strike))
+        for column, chain in enumerate(chains):
+            for side, rows in ((chain.calls, rows_above), (chain.puts, rows_below)):
+                index = side.lookup(self.strike[rows])
+                found = index >= 0
+                self.implied_volatility[rows, column][found] = side.implied_volatility[index[found]]
+                self.delta[rows, column][found] = side.delta[index[found]]
+
+            above_start, above_end, _, _ = chain.calls.window(current_price, 1)
+            _, _, below_start, below_end = chain.puts.window(current_price, 1)
+            nearest = np.concatenate(
+                [
+                    chain.calls.implied_volatility[above_start:above_end],
+                    chain.puts.implied_volatility[below_start:below_end],
+                ]
+            )
+            if len(nearest):
+                self.atm_implied_volatility[column] = nearest.mean()
+
+
+def years_to_expiration(expiration_date: str, now: Optional[datetime] = None) -> float:
+    """Time until the expiration day's close, in years (at least MIN_YEARS_TO_EXPIRATION).
+
+    Args:
+        expiration_date: Expiration date (YYYY-MM-DD)
+        now: Current time (default: now, US/Eastern)
+    """
+    now = (now or datetime.now(MARKET_TIMEZONE)).astimezone(MARKET_TIMEZONE)
+    expiration = datetime.strptime(expiration_date.strip(), "%Y-%m-%d").date()
+    try:
+        close = get_market_calendar().session_close(expiration)
+    except ValueError:
+        close = None
+    if close is None:
+        close = datetime.combine(expiration, REGULAR_CLOSE, tzinfo=MARKET_TIMEZONE)
+    seconds = (close - now).total_seconds()
+    return max(seconds / SECONDS_PER_YEAR, MIN_YEARS_TO_EXPIRATION)
+
+
+def _options_trading(now: datetime) -> bool:
+    """True while option quotes can change (regular session plus OPTIONS_CLOSE_DELAY)."""
+    close = get_market_calendar().session_close(now.date())
+    if close is None:
+        return False
+    open_at = datetime.combine(now.date(), REGULAR_OPEN, tzinfo=MARKET_TIMEZONE)
+    return open_at <= now < close + OPTIONS_CLOSE_DELAY
+
+
+def options_chain_cache_ttl(chain: OptionsChain, now: Optional[datetime] = None) -> float:
+    """Seconds a parsed chain may be served from cache.
+
+    Args:
+        chain: Freshly parsed chain
+        now: Current time (default: now, US/Eastern)
+    """
+    now = (now or datetime.now(MARKET_TIMEZONE)).astimezone(MARKET_TIMEZONE)
+    if _options_trading(now):
+        if chain.total_volume < OPTIONS_CHAIN_QUIET_VOLUME:
+            return OPTIONS_CHAIN_QUIET_CACHE_TTL
+        return OPTIONS_CHAIN_CACHE_TTL
+
+    # Frozen until the next regular open
+    calendar = get_market_calendar()
+    today = now.date()
+    open_day = today
+    if not calendar.is_session(today) or now.time() >= REGULAR_OPEN:
+        open_day = calendar.next_session(today)
+    if open_day is None:
+        return OPTIONS_CHAIN_CLOSED_CACHE_TTL
+    next_open = datetime.combine(open_day, REGULAR_OPEN, tzinfo=MARKET_TIMEZONE)
+    return max(1.0, min((next_open - now).total_seconds(), OPTIONS_CHAIN_CLOSED_CACHE_TTL))
+
+
+def options_chain_is_stale(
+    served_price: float, current_price: float, now: Optional[datetime] = None
+) -> bool:
+    """True if a cached chain should be refetched for a new underlying price.
+
+    Args:
+        served_price: Price the cached chain was fetched for
+        current_price: Price of the current request
+        now: Current time (default: now, US/Eastern)
+    """
+    now = (now or datetime.now(MARKET_TIMEZONE)).astimezone(MARKET_TIMEZONE)
+    if not _options_trading(now):
+        return False
+    return abs(current_price - served_price) > served_price * OPTIONS_CHAIN_MAX_PRICE_MOVE
@@ -0,0 +1,160 @@
+"""Native async Polygon.io REST client.
+
+Replaces the synchronous polygon-api-client RESTClient, which had to run in the
+default thread pool via asyncio.to_thread (up to 5 executor threads per TA
+request). All requests go through fetch_json() in api_utils, so they share the
+APIConnectionPool aiohttp session (keep-alive connections), single-flight
+coalescing and the "polygon" rate limiter with the rest of the tool layer.
+
+Responses are parsed into plain dicts with descriptive keys.
+
+Endpoints covered:
+- Technical indicators: /v1/indicators/{sma,ema,rsi,macd}/{ticker}
+- Aggregate bars:       /v2/aggs/ticker/{ticker}/range/{multiplier}/{timespan}/{from}/{to}
+"""
+
+import os
+from typing import Optional
+
+from .api_utils import POLYGON_BASE_URL, create_polygon_headers, fetch_json
+
+# Indicator endpoints supported by get_indicator()
+POLYGON_INDICATORS = ("sma", "ema", "rsi", "macd")
+
+
+class PolygonAPIError(Exception):
+    """Raised when Polygon.io returns a non-200 response or an error payload."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"Polygon API returned status {status}: {message}")
+        self.status = status
+
+
+def _get_polygon_api_key() -> Optional[str]:
+    """Get Polygon API key from environment.
+
+    Lazy initialization ensures .env is loaded before accessing API key.
+    """
+    return os.getenv("POLYGON_API_KEY")
+
+
+async def _get(path: str, params: Optional[dict] = None) -> dict:
+    """GET a Polygon endpoint and return the parsed JSON body.
+
+    Args:
+        path: Endpoint path starting with "/"
+        params: Optional query parameters
+
+    Returns:
+        Parsed JSON response body
+
+    Raises:
+        PolygonAPIError: Missing API key, non-200 status, or error payload
+    """
+    api_key = _get_polygon_api_key()
+    if not api_key:
+        raise PolygonAPIError(0, "POLYGON_API_KEY not configured in environment")
+
+    status, data = await fetch_json(
+        "polygon", f"{POLYGON_BASE_URL}{path}", create_polygon_headers(api_key), params
+    )
+    if status != 200 or data is None:
+        raise PolygonAPIError(status, path)
+    if data.get("status") == "ERROR":
+        raise PolygonAPIError(status, data.get("error", path))
+    return data
+
+
+def _format_indicator_value(value: dict) -> dict:
+    """Format one indicator value with consistent keys (missing fields are None)."""
+    return {
+        "value": value.get("value"),
+        "signal": value.get("signal"),
+        "histogram": value.get("histogram"),
+        "timestamp": value.get("timestamp", "N/A"),
+    }
+
+
+async def get_indicator(
+    indicator: str,
+    ticker: str,
+    timespan: str = "day",
+    limit: int = 10,
+    **windows: int,
+) -> list[dict]:
+    """Get technical indicator values from Polygon (most recent first).
+
+    Args:
+        indicator: "sma", "ema", "rsi" or "macd"
+        ticker: Stock ticker symbol (e.g., "SPY")
+        timespan: Aggregate window ("day", "minute", "hour", "week", "month")
+        limit: Number of values to return
+        **windows: Indicator windows, e.g. window=20 (sma/ema/rsi) or
+                   short_window=12, long_window=26, signal_window=9 (macd)
+
+    Returns:
+        List of dicts with keys: value, signal, histogram, timestamp (Unix ms)
+
+    Examples:
+        >>> await get_indicator("sma", "SPY", window=50)
+        [{'value': 654.23, 'signal': None, 'histogram': None, 'timestamp': 1760068800000}, ...]
+    """
+    if indicator not in POLYGON_INDICATORS:
+        raise ValueError(f"Unsupported indicator: {indicator}")
+
+    params = {
+        "timespan": timespan,
+        "series_type": "close",
+        "adjusted": "true",
+        "order": "desc",
+        "limit": limit,
+        **windows,
+    }
+    data = await _get(f"/v1/indicators/{indicator}/{ticker}", params)
+    values = data.get("results", {}).get("values", [])
+    return [_format_indicator_value(value) for value in values]
+
+
+async def get_aggregates(
+    ticker: str,
+    multiplier: int,
+    timespan: str,
+    from_date: str,
+    to_date: str,
+    adjusted: bool = True,
+    sort: str = "asc",
+    limit: int = 50000,
+) -> list[dict]:
+    """Get aggregate (OHLCV) bars for a date range.
+
+    Args:
+        ticker: Stock ticker symbol (e.g., "SPY")
+        multiplier: Size of the timespan multiplier (e.g., 1)
+        timespan: "minute", "hour", "day", "week" or "month"
+        from_date: Start date in YYYY-MM-DD format
+        to_date: End date in YYYY-MM-DD format
+        adjusted: Whether results are adjusted for splits
+        sort: "asc" (oldest first) or "desc"
+        limit: Maximum number of base aggregates (max 50000, one page)
+
+    Returns:
+        List of bar dicts with keys: timestamp (Unix ms), open, high, low, close, volume
+    """
+    params = {
+        "adjusted": "true" if adjusted else "false",
+        "sort": sort,
+        "limit": limit,
+    }
+    path = f"/v2/aggs/ticker/{ticker}/range/{multiplier}/{timespan}/{from_date}/{to_date}"
+    data = await _get(path, params)
+    return [
+        {
+            "timestamp": bar.get("t"),
+            "open": bar.get("o"),
+            "high": bar.get("h"),
+            "low": bar.get("l"),
+            "close": bar.get("c"),
+            "volume": bar.get("v"),
+        }
+        for bar in data.get("results", []) or []
+    ]
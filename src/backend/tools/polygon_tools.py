@@ -1,37 +1,234 @@
 """
 Polygon.io custom tools for OpenAI AI Agent.
-Provides direct Polygon Python Library API access for market status, datetime, and technical indicators.
+Provides native async Polygon.io API access for technical indicators (see polygon_client.py).
 """
 
 import asyncio
-import json
-import os
-import time
-from datetime import datetime, timezone
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 
-import requests
+import aiohttp
+import numpy as np
 from agents import function_tool
-from polygon import RESTClient
 
-from .error_utils import create_error_response
+from ..config import settings
+from ..utils.market_calendar import MARKET_TIMEZONE
+from .coalescing_utils import SingleFlight
+from .fanout_utils import fan_out, merge_markdown_results
 from .formatting_helpers import create_ta_indicators_table
+from .indicator_engine import EMA_WINDOWS, SMA_WINDOWS, compute_ta_indicators
+from .ohlcv_columnar import OHLCVColumns
+from .polygon_client import get_aggregates, get_indicator
+from .price_history_store import get_price_history_store
+from .tradier_tools import TradierHistoryError, fetch_daily_history_bars
+from .validation_utils import split_tickers
 
+# Coalescing group for TA requests: concurrent identical requests share one
+# indicator computation (HTTP requests are additionally coalesced in fetch_json)
+_ta_flights = SingleFlight("polygon.ta_indicators")
 
-def _get_polygon_client():
-    """Get Polygon client with API key from environment.
 
-    Lazy initialization ensures .env is loaded before accessing API key.
+# Calendar days of aggregate bars fetched per timespan for local indicator
+# computation (enough bars for SMA/EMA-200 plus EMA warm-up)
+_AGGREGATE_LOOKBACK_DAYS = {
+    "minute": 7,
+    "hour": 90,
+    "day": 1100,
+    "week": 365 * 10,
+    "month": 365 * 40,
+}
+
+# Stored daily bars are used for local indicators only if they cover the longest window
+_MIN_STORED_DAILY_BARS = max(SMA_WINDOWS + EMA_WINDOWS)
+
+# Indicator computation modes (config: backend.tools.taIndicatorMode)
+TA_MODE_LOCAL = "local"    # One aggregates call, indicators computed with NumPy
+TA_MODE_REMOTE = "remote"  # 12 Polygon indicator endpoint calls
+
+
+async def _get_local_ta_indicators(ticker: str, timespan: str) -> dict:
+    """Compute all TA indicators locally from a single aggregate-bars fetch.
+
+    Daily indicators read the local price history store's memory-mapped
+    columns instead (only the uncovered gap, normally today, is fetched);
+    Polygon aggregates are used for other timespans and as the fallback.
+
+    Args:
+        ticker: Sanitized ticker symbol
+        timespan: Aggregate time window ("day", "minute", "hour", "week", "month")
+
+    Returns:
+        Indicators dict for create_ta_indicators_table()
+
+    Raises:
+        ValueError: Unknown timespan or no bars returned
     """
-    api_key = os.getenv("POLYGON_API_KEY")
-    return RESTClient(api_key=api_key)
+    if timespan not in _AGGREGATE_LOOKBACK_DAYS:
+        raise ValueError(f"Unsupported timespan for local indicators: {timespan}")
+
+    end_date = datetime.now(timezone.utc).date()
+    start_date = end_date - timedelta(days=_AGGREGATE_LOOKBACK_DAYS[timespan])
+
+    # Daily bars: read the memory-mapped columns of the local bar store when available
+    if timespan == "day":
+        columns = await _get_stored_daily_columns(
+            ticker, start_date.isoformat(), end_date.isoformat()
+        )
+        if columns is not None and len(columns) >= _MIN_STORED_DAILY_BARS:
+            return compute_ta_indicators(columns.timestamps_ms(MARKET_TIMEZONE), columns.close)
+
+    bars = await get_aggregates(
+        ticker,
+        multiplier=1,
+        timespan=timespan,
+        from_date=start_date.isoformat(),
+        to_date=end_date.isoformat(),
+    )
+    if not bars:
+        raise ValueError(f"No aggregate bars returned for {ticker}")
+
+    timestamps = np.fromiter((bar["timestamp"] for bar in bars), dtype=np.int64, count=len(bars))
+    close = np.fromiter((bar["close"] for bar in bars), dtype=np.float64, count=len(bars))
+    return compute_ta_indicators(timestamps, close)
+
+
+async def _get_stored_daily_columns(
+    ticker: str, start_date: str, end_date: str
+) -> Optional[OHLCVColumns]:
+    """Daily bars from the local price history store (filled from Tradier history).
+
+    Returns:
+        Column views for the range, or None when the store is disabled or the
+        gap fill failed (callers fall back to Polygon aggregates)
+    """
+    store = get_price_history_store()
+    if store is None:
+        return None
+    try:
+        return await store.get_daily_columns(ticker, start_date, end_date, fetch_daily_history_bars)
+    except (
+        TradierHistoryError,
+        ValueError,
+        OSError,
+        sqlite3.Error,
+        asyncio.TimeoutError,
+        aiohttp.ClientError,
+    ) as e:
+        print(f"Warning: Price history store read failed for {ticker}, using Polygon: {e!r}")
+        return None
+
+
+async def _get_remote_ta_indicators(ticker: str, timespan: str) -> dict:
+    """Retrieve all TA indicators from the Polygon indicator endpoints.
+
+    Fallback mode: 12 indicator API calls issued concurrently. Each call
+    acquires a token from the shared Polygon rate limiter, so calls are only
+    spaced out when the configured quota requires it. Requests limit=10 per
+    indicator to ensure LAST AVAILABLE data (even on weekends/holidays).
+
+    Args:
+        ticker: Sanitized ticker symbol
+        timespan: Aggregate time window ("day", "minute", "hour", "week", "month")
+
+    Returns:
+        Indicators dict for create_ta_indicators_table()
+    """
+    # Use limit=10 to ensure we get the most recent available data even on weekends/holidays
+    try:
+        results = await asyncio.gather(
+            # Momentum indicators (RSI + MACD)
+            get_indicator("rsi", ticker, timespan, limit=10, window=14),
+            get_indicator(
+                "macd",
+                ticker,
+                timespan,
+                limit=10,
+                short_window=12,
+                long_window=26,
+                signal_window=9,
+            ),
+            # Simple Moving Averages (5, 10, 20, 50, 200)
+            get_indicator("sma", ticker, timespan, limit=10, window=5),
+            get_indicator("sma", ticker, timespan, limit=10, window=10),
+            get_indicator("sma", ticker, timespan, limit=10, window=20),
+            get_indicator("sma", ticker, timespan, limit=10, window=50),
+            get_indicator("sma", ticker, timespan, limit=10, window=200),
+            # Exponential Moving Averages (5, 10, 20, 50, 200)
+            get_indicator("ema", ticker, timespan, limit=10, window=5),
+            get_indicator("ema", ticker, timespan, limit=10, window=10),
+            get_indicator("ema", ticker, timespan, limit=10, window=20),
+            get_indicator("ema", ticker, timespan, limit=10, window=50),
+            get_indicator("ema", ticker, timespan, limit=10, window=200),
+            return_exceptions=True
+        )
+        (
+            rsi_result, macd_result,
+            sma_5, sma_10, sma_20, sma_50, sma_200,
+            ema_5, ema_10, ema_20, ema_50, ema_200,
+        ) = results
+    except Exception as e:
+        rsi_result = macd_result = e
+        sma_5 = sma_10 = sma_20 = sma_50 = sma_200 = e
+        ema_5 = ema_10 = ema_20 = ema_50 = ema_200 = e
+
+    # Process RSI result
+    rsi_data = None
+    if not isinstance(rsi_result, Exception) and rsi_result:
+        result = rsi_result[0]
+        rsi_data = {
+            "value": result["value"],
+            "timestamp": result["timestamp"]
+        }
+
+    # Process MACD result
+    macd_data = None
+    if not isinstance(macd_result, Exception) and macd_result:
+        result = macd_result[0]
+        macd_data = {
+            "macd": result["value"],
+            "signal": result["signal"],
+            "histogram": result["histogram"],
+            "timestamp": result["timestamp"]
+        }
+
+    # Process SMA results
+    sma_values = []
+    for window, sma_result in [(5, sma_5), (10, sma_10), (20, sma_20), (50, sma_50), (200, sma_200)]:
+        if not isinstance(sma_result, Exception) and sma_result:
+            result = sma_result[0]
+            sma_values.append({
+                "window": window,
+                "value": result["value"],
+                "timestamp": result["timestamp"]
+            })
+
+    # Process EMA results
+    ema_values = []
+    for window, ema_result in [(5, ema_5), (10, ema_10), (20, ema_20), (50, ema_50), (200, ema_200)]:
+        if not isinstance(ema_result, Exception) and ema_result:
+            result = ema_result[0]
+            ema_values.append({
+                "window": window,
+                "value": result["value"],
+                "timestamp": result["timestamp"]
+            })
+
+    # Build indicators dict for formatter
+    return {
+        "rsi": rsi_data,
+        "macd": macd_data,
+        "sma_values": sma_values,
+        "ema_values": ema_values
+    }
 
 
 async def _get_ta_indicators(ticker: str, timespan: str = "day") -> str:
     """Get comprehensive technical analysis indicators in a single call.
 
-    This consolidated tool retrieves ALL TA indicators with optimized batched API calls
-    and returns a formatted markdown table. Replaces individual get_ta_sma, get_ta_ema,
-    get_ta_rsi, and get_ta_macd tools.
+    This consolidated tool retrieves ALL TA indicators and returns a formatted
+    markdown table. Replaces individual get_ta_sma, get_ta_ema, get_ta_rsi, and
+    get_ta_macd tools.
 
     Indicators Retrieved:
     - RSI-14 (Relative Strength Index)
@@ -40,13 +237,13 @@ async def _get_ta_indicators(ticker: str, timespan: str = "day") -> str:
     - EMA (Exponential Moving Averages): 5, 10, 20, 50, 200-period
 
     Performance Optimization:
-    - Batched API calls with rate limit protection
-    - Batch 1: RSI + MACD (2 parallel calls)
-    - Batch 2: SMA 5/10/20/50/200 (5 parallel calls)
-    - Batch 3: EMA 5/10/20/50/200 (5 parallel calls)
-    - 1-second delays between batches prevent rate limiting
-    - Total: 12 API calls in ~2-3 seconds
-    - Requests limit=10 per indicator to ensure LAST AVAILABLE data (even on weekends/holidays)
+    - Local mode (default): ONE Polygon aggregates call, all 14 values computed
+      locally with NumPy (see indicator_engine.py) - no built-in delays
+    - Remote mode (fallback): 12 Polygon indicator calls issued concurrently
+    - All Polygon calls acquire from the shared rate limiter (no fixed sleeps)
+    - Local mode falls back to remote mode if the aggregates fetch or the
+      local computation fails
+    - Mode is selected by backend.tools.taIndicatorMode in config/app.config.json
 
     Args:
         ticker: Stock ticker symbol (e.g., "SPY", "AAPL", "NVDA")
@@ -72,10 +269,8 @@ async def _get_ta_indicators(ticker: str, timespan: str = "day") -> str:
 
     Note:
         - ALWAYS returns last available data (even on weekends/holidays/market closures)
-        - Uses limit=10 to fetch recent historical data, returns most recent value
         - Gracefully handles partial failures (displays N/A only if indicator genuinely unavailable)
         - Single tool call from agent perspective (all complexity in Python)
-        - Rate limit safe with batched calls and delays
         - Formatted output ready for display
 
     Examples:
@@ -92,114 +287,20 @@ async def _get_ta_indicators(ticker: str, timespan: str = "day") -> str:
         if not timespan or timespan in ["", "None", "null"]:
             timespan = "day"
 
-        client = _get_polygon_client()
-
-        # Batch 1: Momentum indicators (RSI + MACD)
-        # Use limit=10 to ensure we get the most recent available data even on weekends/holidays
-        try:
-            batch1_results = await asyncio.gather(
-                asyncio.to_thread(client.get_rsi, ticker=ticker, timespan=timespan, window=14, limit=10),
-                asyncio.to_thread(
-                    client.get_macd,
-                    ticker=ticker,
-                    timespan=timespan,
-                    short_window=12,
-                    long_window=26,
-                    signal_window=9,
-                    limit=10
-                ),
-                return_exceptions=True
-            )
-            rsi_result, macd_result = batch1_results
-        except Exception as e:
-            rsi_result = e
-            macd_result = e
-
-        # Rate limit protection
-        await asyncio.sleep(1)
-
-        # Batch 2: Simple Moving Averages (5, 10, 20, 50, 200)
-        # Use limit=10 to ensure we get the most recent available data even on weekends/holidays
-        try:
-            batch2_results = await asyncio.gather(
-                asyncio.to_thread(client.get_sma, ticker=ticker, timespan=timespan, window=5, limit=10),
-                asyncio.to_thread(client.get_sma, ticker=ticker, timespan=timespan, window=10, limit=10),
-                asyncio.to_thread(client.get_sma, ticker=ticker, timespan=timespan, window=20, limit=10),
-                asyncio.to_thread(client.get_sma, ticker=ticker, timespan=timespan, window=50, limit=10),
-                asyncio.to_thread(client.get_sma, ticker=ticker, timespan=timespan, window=200, limit=10),
-                return_exceptions=True
-            )
-            sma_5, sma_10, sma_20, sma_50, sma_200 = batch2_results
-        except Exception as e:
-            sma_5 = sma_10 = sma_20 = sma_50 = sma_200 = e
-
-        # Rate limit protection
-        await asyncio.sleep(1)
-
-        # Batch 3: Exponential Moving Averages (5, 10, 20, 50, 200)
-        # Use limit=10 to ensure we get the most recent available data even on weekends/holidays
-        try:
-            batch3_results = await asyncio.gather(
-                asyncio.to_thread(client.get_ema, ticker=ticker, timespan=timespan, window=5, limit=10),
-                asyncio.to_thread(client.get_ema, ticker=ticker, timespan=timespan, window=10, limit=10),
-                asyncio.to_thread(client.get_ema, ticker=ticker, timespan=timespan, window=20, limit=10),
-                asyncio.to_thread(client.get_ema, ticker=ticker, timespan=timespan, window=50, limit=10),
-                asyncio.to_thread(client.get_ema, ticker=ticker, timespan=timespan, window=200, limit=10),
-                return_exceptions=True
-            )
-            ema_5, ema_10, ema_20, ema_50, ema_200 = batch3_results
-        except Exception as e:
-            ema_5 = ema_10 = ema_20 = ema_50 = ema_200 = e
-
-        # Process RSI result
-        rsi_data = None
-        if not isinstance(rsi_result, Exception) and rsi_result and hasattr(rsi_result, "values") and rsi_result.values:
-            result = rsi_result.values[0]
-            rsi_data = {
-                "value": getattr(result, "value", None),
-                "timestamp": getattr(result, "timestamp", "N/A")
-            }
-
-        # Process MACD result
-        macd_data = None
-        if not isinstance(macd_result, Exception) and macd_result and hasattr(macd_result, "values") and macd_result.values:
-            result = macd_result.values[0]
-            macd_data = {
-                "macd": getattr(result, "value", None),
-                "signal": getattr(result, "signal", None),
-                "histogram": getattr(result, "histogram", None),
-                "timestamp": getattr(result, "timestamp", "N/A")
-            }
-
-        # Process SMA results
-        sma_values = []
-        for window, sma_result in [(5, sma_5), (10, sma_10), (20, sma_20), (50, sma_50), (200, sma_200)]:
-            if not isinstance(sma_result, Exception) and sma_result and hasattr(sma_result, "values") and sma_result.values:
-                result = sma_result.values[0]
-                sma_values.append({
-                    "window": window,
-                    "value": getattr(result, "value", None),
-                    "timestamp": getattr(result, "timestamp", "N/A")
-                })
-
-        # Process EMA results
-        ema_values = []
-        for window, ema_result in [(5, ema_5), (10, ema_10), (20, ema_20), (50, ema_50), (200, ema_200)]:
-            if not isinstance(ema_result, Exception) and ema_result and hasattr(ema_result, "values") and ema_result.values:
-                result = ema_result.values[0]
-                ema_values.append({
-                    "window": window,
-                    "value": getattr(result, "value", None),
-                    "timestamp": getattr(result, "timestamp", "N/A")
-                })
-
-        # Build indicators dict for formatter
-        indicators = {
-            "rsi": rsi_data,
-            "macd": macd_data,
-            "sma_values": sma_values,
-            "ema_values": ema_values
-        }
+        indicators = None
+        if settings.ta_indicator_mode == TA_MODE_LOCAL:
+            try:
+                indicators = await _get_local_ta_indicators(ticker, timespan)
+            except Exception as e:
+                # Fall back to the remote indicator endpoints below
+                print(
+                    f"Warning: Local TA indicators failed for {ticker}, "
+                    f"using remote endpoints: {e!r}"
+                )
+                indicators = None
+
+        if indicators is None:
+            indicators = await _get_remote_ta_indicators(ticker, timespan)
 
         # Return formatted markdown table
         return create_ta_indicators_table(ticker, indicators)
@@ -212,19 +313,25 @@ async def _get_ta_indicators(ticker: str, timespan: str = "day") -> str:
 async def get_ta_indicators(ticker: str, timespan: str = "day") -> str:
     """Get comprehensive technical analysis indicators (RSI, MACD, SMA, EMA) in a single call.
 
-    Consolidated tool retrieves all 14 TA indicators with optimized batched API calls and returns formatted markdown table.
+    Consolidated tool computes all 14 TA indicators from a single Polygon aggregates call and returns formatted markdown table.
 
     Indicators: RSI-14, MACD (12/26/9), SMA (5/10/20/50/200), EMA (5/10/20/50/200).
 
     Args:
-        ticker: Stock ticker symbol (e.g., "SPY", "AAPL").
+        ticker: Single "SPY" or multiple "SPY,QQQ,IWM" (see Common Formats).
         timespan: Aggregate window - "day", "minute", "hour", "week", "month" (default: "day").
 
     Returns:
         Markdown table with all 14 indicators (indicator, period, value, timestamp).
+        Multiple tickers return one table per ticker.
 
-    Note: 12 API calls in ~2-3 seconds with rate limit protection. Always returns last available data (even on weekends/holidays).
+    Note: Single API call per ticker (no built-in delays). Always returns last available data (even on weekends/holidays).
     """
-    return await _get_ta_indicators(ticker, timespan)
+    def fetch_indicators(symbol: str):
+        flight_key = (symbol, str(timespan).strip())
+        return _ta_flights.do(flight_key, lambda: _get_ta_indicators(symbol, timespan))
+
+    results = await fan_out(split_tickers(ticker), fetch_indicators)
+    return merge_markdown_results(results)
 
 
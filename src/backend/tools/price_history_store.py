@@ -0,0 +1,582 @@
+"""Incremental Price History Store.
+
+_get_stock_price_history used to request the full start–end range from
+/v1/markets/history on every call, although bars for closed sessions never
+change. PriceHistoryStore keeps daily bars in a local SQLite database and
+records which date ranges are covered, so only the missing gaps are fetched —
+normally just today's bar — and "last 3 months" on a hot ticker becomes a
+local read.
+
+Coverage rules:
+- A fetched range is recorded as covered only through the last closed session
+  date: today counts as closed after the end-of-day refresh time (US/Eastern)
+  or when it is not a trading session (NYSE calendar); earlier days always
+  do. Today's still-forming bar is never stored: it is served from the fetch
+  result and refetched until the session has settled.
+- Within a fetched range, days that are not sessions (weekends, holidays) and
+  sessions that returned a bar become covered. Sessions without a bar stay
+  uncovered and are requested again (e.g., upstream has not published the
+  bar yet), unless they precede the ticker's first bar (before its listing).
+  Gaps separated only by non-session days are fetched in one request, so a
+  ticker without recent bars costs one request instead of one per week.
+- Only the daily interval is stored; weekly and monthly bars are aggregated
+  upstream and keep using the direct request path.
+
+Revalidation:
+    Each gap fetch also requests the stored session just before the gap. If
+    its close differs from the stored close, upstream has re-adjusted the
+    history (e.g., a stock split): the ticker's stored bars and coverage are
+    dropped and the requested range is fetched again.
+
+Reads:
+    After every gap fill the ticker's bars are exported to a memory-mapped
+    columnar file (ohlcv_columnar.py). get_daily_columns() slices that mapping
+    without copying, so repeated summaries and indicator computations neither
+    query SQLite nor build per-bar dicts.
+
+End-of-day refresh:
+    A background task (started on first use in a running event loop) wakes up
+    at the configured refresh time of every trading session and fills the gap
+    up to today for every ticker read within the last trackedTickerDays days.
+
+Configuration (config/app.config.json → backend.tools.priceHistoryStore):
+    "priceHistoryStore": {
+      "enabled": true,
+      "path": "data/price_history.db",
+      "columnarDirectory": "data/ohlcv",
+      "eodRefreshTime": "16:30",
+      "trackedTickerDays": 7
+    }
+"""
+
+import asyncio
+import math
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+from ..config import settings
+from ..utils.market_calendar import MARKET_TIMEZONE, get_market_calendar
+from .ohlcv_columnar import ColumnarOHLCVCache, OHLCVColumns, columns_from_bars
+
+# Defaults for keys missing from backend.tools.priceHistoryStore
+DEFAULT_STORE_PATH = "data/price_history.db"
+DEFAULT_COLUMNAR_DIRECTORY = "data/ohlcv"
+DEFAULT_EOD_REFRESH_TIME = "16:30"
+DEFAULT_TRACKED_TICKER_DAYS = 7
+
+# Interval stored locally (weekly/monthly pass through to the API)
+STORED_INTERVAL = "daily"
+
+# Relative close difference on a revalidation bar that drops the stored history
+REVALIDATION_TOLERANCE = 1e-4
+
+# Fetches raw Tradier bars (dicts with date/open/high/low/close/volume) for a date range
+BarFetcher = Callable[[str, str, str], Awaitable[list[dict]]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bars (
+    ticker TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    date TEXT NOT NULL,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL,
+    volume INTEGER,
+    PRIMARY KEY (ticker, interval, date)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS coverage (
+    ticker TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    PRIMARY KEY (ticker, interval, start_date)
+) WITHOUT ROWID;
+"""
+
+
+def _parse_date(value: str) -> date:
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def _is_session(day: date) -> bool:
+    """True for NYSE sessions (weekdays outside the calendar's year range)."""
+    try:
+        return get_market_calendar().is_session(day)
+    except ValueError:
+        return day.weekday() < 5
+
+
+def _previous_session(day: date) -> Optional[date]:
+    """Last NYSE session before day (None outside the calendar's year range)."""
+    try:
+        return get_market_calendar().previous_session(day)
+    except ValueError:
+        return None
+
+
+def merge_ranges(ranges: list[tuple[date, date]]) -> list[tuple[date, date]]:
+    """Merge overlapping or adjacent (next-day) date ranges.
+
+    Args:
+        ranges: Inclusive (start, end) date pairs
+
+    Returns:
+        Sorted, non-overlapping ranges
+    """
+    merged: list[tuple[date, date]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def missing_ranges(
+    start: date, end: date, covered: list[tuple[date, date]]
+) -> list[tuple[date, date]]:
+    """Return the parts of [start, end] not inside any covered range.
+
+    Args:
+        start: Requested start date (inclusive)
+        end: Requested end date (inclusive)
+        covered: Sorted, merged covered ranges
+
+    Returns:
+        Inclusive gap ranges in date order
+    """
+    gaps = []
+    cursor = start
+    for covered_start, covered_end in covered:
+        if covered_end < cursor:
+            continue
+        if covered_start > end:
+            break
+        if covered_start > cursor:
+            gaps.append((cursor, covered_start - timedelta(days=1)))
+        cursor = max(cursor, covered_end + timedelta(days=1))
+        if cursor > end:
+            break
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def join_session_gaps(gaps: list[tuple[date, date]]) -> list[tuple[date, date]]:
+    """Join consecutive gaps separated only by non-session days (one request each).
+
+    Args:
+        gaps: Inclusive gap ranges in date order (from missing_ranges())
+
+    Returns:
+        Inclusive request ranges in date order
+    """
+    joined: list[tuple[date, date]] = []
+    for start, end in gaps:
+        if joined:
+            day = joined[-1][1] + timedelta(days=1)
+            while day < start and not _is_session(day):
+                day += timedelta(days=1)
+            if day == start:
+                joined[-1] = (joined[-1][0], end)
+                continue
+        joined.append((start, end))
+    return joined
+
+
+class PriceHistoryStore:
+    """SQLite-backed daily bar store with covered-range bookkeeping."""
+
+    def __init__(
+        self,
+        db_path: str,
+        columnar_directory: str,
+        eod_refresh_time: str,
+        tracked_ticker_days: int,
+    ):
+        """Open (or create) the store.
+
+        Args:
+            db_path: SQLite database file
+            columnar_directory: Directory for the memory-mapped columnar bar files
+            eod_refresh_time: "HH:MM" US/Eastern after which today's bar is final
+            tracked_ticker_days: Tickers read within this many days are refreshed at EOD
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        hour, minute = (int(part) for part in eod_refresh_time.split(":"))
+        self.eod_refresh_hour = hour
+        self.eod_refresh_minute = minute
+        self.tracked_ticker_seconds = tracked_ticker_days * 24 * 60 * 60
+
+        self._connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._db_lock = threading.Lock()
+        self.columns = ColumnarOHLCVCache(columnar_directory)
+
+        self._ticker_locks: dict[str, asyncio.Lock] = {}
+        self._last_read: dict[str, float] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._fetcher: Optional[BarFetcher] = None
+
+        self.local_reads = 0
+        self.gap_fetches = 0
+
+    # ------------------------------------------------------------------
+    # Dates
+    # ------------------------------------------------------------------
+
+    def last_closed_date(self, now: Optional[datetime] = None) -> date:
+        """Latest date whose daily bar is final.
+
+        Today counts as closed after the EOD refresh time, or all day when it
+        is not a trading session (weekends and holidays never get a bar).
+        """
+        now = now or datetime.now(MARKET_TIMEZONE)
+        eod = now.replace(
+            hour=self.eod_refresh_hour, minute=self.eod_refresh_minute, second=0, microsecond=0
+        )
+        if now >= eod or not get_market_calendar().is_session(now.date()):
+            return now.date()
+        return now.date() - timedelta(days=1)
+
+    # ------------------------------------------------------------------
+    # SQLite access (run in worker threads)
+    # ------------------------------------------------------------------
+
+    def _covered_sync(self, ticker: str, interval: str) -> list[tuple[date, date]]:
+        with self._db_lock:
+            rows = self._connection.execute(
+                "SELECT start_date, end_date FROM coverage WHERE ticker = ? AND interval = ?",
+                (ticker, interval),
+            ).fetchall()
+        return merge_ranges([(_parse_date(start), _parse_date(end)) for start, end in rows])
+
+    def _stored_bars_sync(
+        self, ticker: str, interval: str, dates: list[str]
+    ) -> tuple[dict[str, float], Optional[str]]:
+        """Stored closes of the given dates and the ticker's first bar date."""
+        with self._db_lock:
+            first = self._connection.execute(
+                "SELECT MIN(date) FROM bars WHERE ticker = ? AND interval = ?",
+                (ticker, interval),
+            ).fetchone()[0]
+            closes = {
+                bar_date: close
+                for bar_date, close in self._connection.execute(
+                    "SELECT date, close FROM bars WHERE ticker = ? AND interval = ? "
+                    f"AND date IN ({', '.join('?' * len(dates))})",
+                    (ticker, interval, *dates),
+                )
+            }
+        return closes, first
+
+    def _clear_sync(self, ticker: str, interval: str) -> None:
+        """Delete the ticker's bars and coverage."""
+        with self._db_lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM bars WHERE ticker = ? AND interval = ?", (ticker, interval)
+            )
+            self._connection.execute(
+                "DELETE FROM coverage WHERE ticker = ? AND interval = ?", (ticker, interval)
+            )
+
+    def _save_sync(
+        self,
+        ticker: str,
+        interval: str,
+        bars: list[dict],
+        covered: list[tuple[date, date]],
+    ) -> None:
+        """Upsert bars and replace the ticker's coverage with the merged ranges."""
+        rows = [
+            (
+                ticker,
+                interval,
+                bar["date"],
+                bar.get("open"),
+                bar.get("high"),
+                bar.get("low"),
+                bar.get("close"),
+                bar.get("volume"),
+            )
+            for bar in bars
+            if bar.get("date")
+        ]
+        with self._db_lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO bars VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._connection.execute(
+                "DELETE FROM coverage WHERE ticker = ? AND interval = ?", (ticker, interval)
+            )
+            self._connection.executemany(
+                "INSERT INTO coverage VALUES (?, ?, ?, ?)",
+                [
+                    (ticker, interval, start.isoformat(), end.isoformat())
+                    for start, end in covered
+                ],
+            )
+
+    def _export_columns_sync(self, ticker: str, interval: str) -> None:
+        """Rewrite the ticker's columnar file from all of its stored bars."""
+        with self._db_lock:
+            rows = self._connection.execute(
+                "SELECT date, open, high, low, close, volume FROM bars "
+                "WHERE ticker = ? AND interval = ? ORDER BY date",
+                (ticker, interval),
+            ).fetchall()
+        self.columns.write(
+            ticker,
+            interval,
+            [
+                {"date": d, "open": o, "high": h, "low": low, "close": c, "volume": v}
+                for d, o, h, low, c, v in rows
+            ],
+        )
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def get_daily_columns(
+        self, ticker: str, start_date: str, end_date: str, fetcher: BarFetcher
+    ) -> OHLCVColumns:
+        """Get daily bars for a date range, fetching only the uncovered gaps.
+
+        Args:
+            ticker: Normalized ticker symbol
+            start_date: Start date (YYYY-MM-DD, inclusive)
+            end_date: End date (YYYY-MM-DD, inclusive)
+            fetcher: Coroutine fetching raw bars for (ticker, start, end);
+                     raises on upstream errors (nothing is recorded then)
+
+        Returns:
+            Column views (date, open, high, low, close, volume) in date order;
+            zero-copy slices of the ticker's memory-mapped file (a copy when
+            today's unsettled bar is appended)
+
+        Raises:
+            ValueError: Dates are not in YYYY-MM-DD format
+        """
+        start, end = _parse_date(start_date), _parse_date(end_date)
+        self._fetcher = fetcher
+        self._last_read[ticker] = time.monotonic()
+        self._ensure_refresh_task()
+
+        lock = self._ticker_locks.setdefault(ticker, asyncio.Lock())
+        async with lock:
+            unsettled_bars = await self._fill_gaps(ticker, start, end, fetcher)
+            columns = self.columns.read_range(ticker, STORED_INTERVAL, start_date, end_date)
+            if columns is None:
+                # Bars stored before the columnar files existed (or a deleted file)
+                await asyncio.to_thread(self._export_columns_sync, ticker, STORED_INTERVAL)
+                columns = self.columns.read_range(ticker, STORED_INTERVAL, start_date, end_date)
+        if unsettled_bars:
+            # Today's bar is served from the fetch result, after the stored (closed) bars
+            before_unsettled = _parse_date(unsettled_bars[0]["date"]) - timedelta(days=1)
+            columns = columns.between(start_date, before_unsettled.isoformat()).concatenate(
+                columns_from_bars(unsettled_bars)
+            )
+        return columns
+
+    async def _fill_gaps(
+        self, ticker: str, start: date, end: date, fetcher: BarFetcher
+    ) -> list[dict]:
+        """Fetch and store the uncovered parts of [start, end] (caller holds the ticker lock).
+
+        Returns:
+            Fetched bars after the last closed session (not stored), in date order
+        """
+        covered = await asyncio.to_thread(self._covered_sync, ticker, STORED_INTERVAL)
+        gaps = missing_ranges(start, end, covered)
+        if not gaps:
+            self.local_reads += 1
+            return []
+
+        fetch_ranges = join_session_gaps(gaps)
+
+        # The stored session before each request is fetched again to detect re-adjusted history
+        anchors: dict[date, date] = {}
+        for gap_start, _ in fetch_ranges:
+            anchor = _previous_session(gap_start)
+            if anchor is not None and any(
+                covered_start <= anchor <= covered_end for covered_start, covered_end in covered
+            ):
+                anchors[gap_start] = anchor
+        stored_closes, first_stored = await asyncio.to_thread(
+            self._stored_bars_sync,
+            ticker,
+            STORED_INTERVAL,
+            [anchor.isoformat() for anchor in anchors.values()],
+        )
+
+        results = await asyncio.gather(
+            *(
+                fetcher(ticker, anchors.get(gap_start, gap_start).isoformat(), gap_end.isoformat())
+                for gap_start, gap_end in fetch_ranges
+            )
+        )
+        self.gap_fetches += len(fetch_ranges)
+
+        fetched = {bar["date"]: bar for result in results for bar in result if bar.get("date")}
+        for anchor in anchors.values():
+            stored = stored_closes.get(anchor.isoformat())
+            refetched = fetched.get(anchor.isoformat(), {}).get("close")
+            if (
+                stored is not None
+                and refetched is not None
+                and not math.isclose(stored, refetched, rel_tol=REVALIDATION_TOLERANCE)
+            ):
+                print(
+                    f"Warning: Stored {ticker} close on {anchor} changed "
+                    f"({stored} -> {refetched}), refetching history"
+                )
+                await asyncio.to_thread(self._clear_sync, ticker, STORED_INTERVAL)
+                return await self._fill_gaps(ticker, start, end, fetcher)
+
+        last_closed = self.last_closed_date()
+        in_gaps = sorted(
+            bar_date
+            for bar_date in fetched
+            if any(
+                gap_start.isoformat() <= bar_date <= gap_end.isoformat()
+                for gap_start, gap_end in gaps
+            )
+        )
+        closed_until = last_closed.isoformat()
+        closed_bars = [fetched[bar_date] for bar_date in in_gaps if bar_date <= closed_until]
+        unsettled_bars = [fetched[bar_date] for bar_date in in_gaps if bar_date > closed_until]
+
+        first_bar = min(filter(None, (first_stored, in_gaps[0] if in_gaps else None)), default=None)
+        newly_covered = self._settled_ranges(gaps, last_closed, set(in_gaps), first_bar)
+        if closed_bars or newly_covered:
+            await asyncio.to_thread(
+                self._save_sync,
+                ticker,
+                STORED_INTERVAL,
+                closed_bars,
+                merge_ranges(covered + newly_covered),
+            )
+        # Only today's unsettled bar changed: the stored bars (and their export) are unchanged
+        if closed_bars:
+            await asyncio.to_thread(self._export_columns_sync, ticker, STORED_INTERVAL)
+        return unsettled_bars
+
+    @staticmethod
+    def _settled_ranges(
+        gaps: list[tuple[date, date]],
+        last_closed: date,
+        bar_dates: set[str],
+        first_bar: Optional[str],
+    ) -> list[tuple[date, date]]:
+        """Parts of fetched gaps that need no further request.
+
+        A day through last_closed is settled when it is not a session, has a
+        bar, or precedes the ticker's first bar; sessions without a bar are
+        left uncovered so they are fetched again.
+        """
+        settled = []
+        for gap_start, gap_end in gaps:
+            day = gap_start
+            while day <= min(gap_end, last_closed):
+                key = day.isoformat()
+                if key in bar_dates or not _is_session(day) or (first_bar and key < first_bar):
+                    settled.append((day, day))
+                day += timedelta(days=1)
+        return merge_ranges(settled)
+
+    async def refresh_tracked_tickers(self) -> int:
+        """Fill every recently read ticker up to the last closed session.
+
+        Returns:
+            Number of tickers refreshed
+        """
+        if self._fetcher is None:
+            return 0
+        cutoff = time.monotonic() - self.tracked_ticker_seconds
+        tickers = [ticker for ticker, read_at in self._last_read.items() if read_at >= cutoff]
+        last_closed = self.last_closed_date()
+
+        for ticker in tickers:
+            covered = await asyncio.to_thread(self._covered_sync, ticker, STORED_INTERVAL)
+            if not covered or covered[-1][1] >= last_closed:
+                continue
+            lock = self._ticker_locks.setdefault(ticker, asyncio.Lock())
+            try:
+                async with lock:
+                    await self._fill_gaps(
+                        ticker, covered[-1][1] + timedelta(days=1), last_closed, self._fetcher
+                    )
+            except Exception as e:
+                print(f"Warning: End-of-day refresh failed for {ticker}: {e}")
+        return len(tickers)
+
+    def _ensure_refresh_task(self) -> None:
+        """Start the end-of-day refresh task on the running event loop (once)."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._refresh_task = loop.create_task(self._refresh_loop())
+
+    def _seconds_until_next_refresh(self) -> float:
+        """Seconds until the refresh time of the next trading session (US/Eastern)."""
+        now = datetime.now(MARKET_TIMEZONE)
+        target = now.replace(
+            hour=self.eod_refresh_hour, minute=self.eod_refresh_minute, second=0, microsecond=0
+        )
+        calendar = get_market_calendar()
+        while target <= now or not calendar.is_session(target.date()):
+            target += timedelta(days=1)
+        return (target - now).total_seconds()
+
+    async def _refresh_loop(self) -> None:
+        """Run refresh_tracked_tickers() at every end-of-day refresh time."""
+        while True:
+            await asyncio.sleep(self._seconds_until_next_refresh())
+            try:
+                await self.refresh_tracked_tickers()
+            except Exception as e:
+                print(f"Warning: End-of-day price history refresh failed: {e}")
+
+    def stats(self) -> dict:
+        """Return local-read / gap-fetch counters and tracked ticker count."""
+        return {
+            "local_reads": self.local_reads,
+            "gap_fetches": self.gap_fetches,
+            "tracked_tickers": len(self._last_read),
+        }
+
+
+# Shared store (created on first use; None when disabled in config)
+_price_history_store: Optional[PriceHistoryStore] = None
+
+
+def get_price_history_store() -> Optional[PriceHistoryStore]:
+    """Get the shared price history store, or None when it is disabled.
+
+    Returns:
+        PriceHistoryStore configured from backend.tools.priceHistoryStore
+    """
+    global _price_history_store
+    config = settings.price_history_store
+    if not config.get("enabled", False):
+        return None
+    if _price_history_store is None:
+        _price_history_store = PriceHistoryStore(
+            db_path=config.get("path", DEFAULT_STORE_PATH),
+            columnar_directory=config.get("columnarDirectory", DEFAULT_COLUMNAR_DIRECTORY),
+            eod_refresh_time=config.get("eodRefreshTime", DEFAULT_EOD_REFRESH_TIME),
+            tracked_ticker_days=config.get("trackedTickerDays", DEFAULT_TRACKED_TICKER_DAYS),
+        )
+    return _price_history_store
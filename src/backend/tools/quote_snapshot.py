@@ -0,0 +1,273 @@
+"""Background Quote Snapshots for Hot Tickers.
+
+get_stock_quote used to request /v1/markets/quotes on demand, so every user
+waited for a Tradier round-trip even for the few tickers (SPY, QQQ, NVDA)
+that dominate traffic. QuoteSnapshotService keeps an in-memory snapshot of
+those tickers instead:
+
+- During regular market hours (NYSE calendar) a background task requests
+  ONE multi-symbol /v1/markets/quotes call every refreshSeconds for the
+  configured watchlist plus the symbols learned from recent requests.
+- Learned symbols: every get_stock_quote request is recorded; symbols
+  requested at least learnMinRequests times within the last
+  learnWindowMinutes join the poll (at most learnedSymbols, most requested
+  first). Symbols drop out again once their requests age out of the window.
+- get_stock_quote answers from the snapshot when every requested symbol has a
+  quote no older than maxAgeSeconds, and adds staleness metadata (as_of,
+  age_seconds) to each quote. Anything else falls back to the on-demand
+  request path.
+
+Outside market hours nothing is polled; the last snapshot keeps being served
+until it is older than maxAgeSeconds.
+
+The poll shares the Tradier connection pool and rate limiter (fetch_json). It
+starts with the Gradio server (quote_snapshot_lifespan) or, in the CLI, on
+the first get_stock_quote call.
+
+Configuration (config/app.config.json → backend.tools.quoteSnapshots):
+    "quoteSnapshots": {
+      "enabled": true,
+      "watchlist": ["SPY", "QQQ", "NVDA"],
+      "refreshSeconds": 5,
+      "maxAgeSeconds": 15,
+      "learnedSymbols": 20,
+      "learnMinRequests": 2,
+      "learnWindowMinutes": 30
+    }
+"""
+
+import asyncio
+import contextlib
+import os
+import time
+from collections import Counter, deque
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from ..config import settings
+from ..utils.market_calendar import MARKET_TIMEZONE, STATE_OPEN, get_market_calendar
+from .api_utils import TRADIER_BASE_URL, create_tradier_headers, fetch_json
+
+# Defaults for keys missing from backend.tools.quoteSnapshots
+DEFAULT_WATCHLIST = ["SPY", "QQQ", "NVDA"]
+DEFAULT_REFRESH_SECONDS = 5
+DEFAULT_MAX_AGE_SECONDS = 15
+DEFAULT_LEARNED_SYMBOLS = 20
+DEFAULT_LEARN_MIN_REQUESTS = 2
+DEFAULT_LEARN_WINDOW_MINUTES = 30
+
+# How often the poll loop re-checks the market state while it is closed
+CLOSED_CHECK_SECONDS = 60
+
+
+class QuoteSnapshotService:
+    """In-memory quote snapshot for a watchlist and frequently requested symbols."""
+
+    def __init__(
+        self,
+        watchlist: list[str],
+        refresh_seconds: float,
+        max_age_seconds: float,
+        learned_symbols: int,
+        learn_min_requests: int,
+        learn_window_minutes: float,
+    ):
+        """Create the service (the poll task starts on start() or first use).
+
+        Args:
+            watchlist: Symbols always polled during market hours
+            refresh_seconds: Seconds between polls
+            max_age_seconds: Oldest snapshot quote served instead of a request
+            learned_symbols: Maximum number of learned symbols polled
+            learn_min_requests: Requests within the window before a symbol is polled
+            learn_window_minutes: Window for counting symbol requests
+        """
+        self.watchlist = [symbol.strip().upper() for symbol in watchlist if symbol.strip()]
+        self.refresh_seconds = refresh_seconds
+        self.max_age_seconds = max_age_seconds
+        self.learned_symbols = learned_symbols
+        self.learn_min_requests = learn_min_requests
+        self.learn_window_seconds = learn_window_minutes * 60
+
+        # Symbol → (raw Tradier quote, wall-clock fetch time, monotonic fetch time)
+        self._quotes: dict[str, tuple[dict, float, float]] = {}
+        # (monotonic time, symbol) of recent requests, oldest first
+        self._requests: deque[tuple[float, str]] = deque()
+        self._request_counts: Counter = Counter()
+        self._poll_task: Optional[asyncio.Task] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.polls = 0
+
+    def record_request(self, symbols: list[str]) -> None:
+        """Count a get_stock_quote request for learning hot symbols."""
+        now = time.monotonic()
+        for symbol in symbols:
+            if symbol:
+                self._requests.append((now, symbol))
+                self._request_counts[symbol] += 1
+        self._expire_requests(now)
+
+    def _expire_requests(self, now: float) -> None:
+        cutoff = now - self.learn_window_seconds
+        while self._requests and self._requests[0][0] < cutoff:
+            _, symbol = self._requests.popleft()
+            self._request_counts[symbol] -= 1
+            if self._request_counts[symbol] <= 0:
+                del self._request_counts[symbol]
+
+    def symbols(self) -> list[str]:
+        """Symbols of the next poll: the watchlist, then learned symbols."""
+        self._expire_requests(time.monotonic())
+        learned = [
+            symbol
+            for symbol, count in self._request_counts.most_common()
+            if count >= self.learn_min_requests and symbol not in self.watchlist
+        ]
+        return self.watchlist + learned[: self.learned_symbols]
+
+    def get_quotes(self, symbols: list[str]) -> Optional[list[tuple[dict, float, float]]]:
+        """Snapshot quotes for all symbols, or None if any is missing or too old.
+
+        Args:
+            symbols: Normalized ticker symbols
+
+        Returns:
+            (raw quote, wall-clock fetch time, age in seconds) per symbol, in order
+        """
+        self._ensure_poll_task()
+        now = time.monotonic()
+        quotes = []
+        for symbol in symbols:
+            snapshot = self._quotes.get(symbol)
+            if snapshot is None or now - snapshot[2] > self.max_age_seconds:
+                self.misses += 1
+                return None
+            quote, fetched_at, fetched_monotonic = snapshot
+            quotes.append((quote, fetched_at, now - fetched_monotonic))
+        self.hits += 1
+        return quotes
+
+    async def refresh(self, headers: dict) -> int:
+        """Poll all snapshot symbols with one multi-symbol quotes request.
+
+        Args:
+            headers: Tradier request headers
+
+        Returns:
+            Number of quotes stored (0 when there is nothing to poll or the request failed)
+        """
+        symbols = self.symbols()
+        if not symbols:
+            return 0
+
+        status, data = await fetch_json(
+            "tradier",
+            f"{TRADIER_BASE_URL}/v1/markets/quotes",
+            headers,
+            {"symbols": ",".join(symbols)},
+        )
+        self.polls += 1
+        if status != 200:
+            print(f"Warning: Quote snapshot poll returned status {status}")
+            return 0
+
+        quotes = (data.get("quotes") or {}).get("quote") or []
+        # Single symbol: a dict instead of a list
+        if isinstance(quotes, dict):
+            quotes = [quotes]
+        fetched_at, fetched_monotonic = time.time(), time.monotonic()
+        for quote in quotes:
+            symbol = quote.get("symbol")
+            if symbol:
+                self._quotes[symbol] = (quote, fetched_at, fetched_monotonic)
+        return len(quotes)
+
+    def start(self) -> None:
+        """Start the poll task on the running event loop (no-op if running)."""
+        self._ensure_poll_task()
+
+    async def stop(self) -> None:
+        """Cancel the poll task."""
+        task, self._poll_task = self._poll_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def _ensure_poll_task(self) -> None:
+        """Start the poll task on the running event loop (once)."""
+        if self._poll_task is not None and not self._poll_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._poll_task = loop.create_task(self._poll_loop())
+
+    async def _poll_loop(self) -> None:
+        """Poll every refresh_seconds while the market is open."""
+        while True:
+            market_state = get_market_calendar().market_state(datetime.now(MARKET_TIMEZONE))
+            api_key = os.getenv("TRADIER_API_KEY")
+            if market_state != STATE_OPEN or not api_key:
+                await asyncio.sleep(CLOSED_CHECK_SECONDS)
+                continue
+            try:
+                await self.refresh(create_tradier_headers(api_key))
+            except Exception as e:
+                print(f"Warning: Quote snapshot poll failed: {e}")
+            await asyncio.sleep(self.refresh_seconds)
+
+    def stats(self) -> dict:
+        """Return snapshot hit/miss/poll counters and polled symbol count."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "polls": self.polls,
+            "symbols": len(self.symbols()),
+        }
+
+
+# Shared service (created on first use; None when disabled in config)
+_quote_snapshot_service: Optional[QuoteSnapshotService] = None
+
+
+def get_quote_snapshot_service() -> Optional[QuoteSnapshotService]:
+    """Get the shared quote snapshot service, or None when it is disabled.
+
+    Returns:
+        QuoteSnapshotService configured from backend.tools.quoteSnapshots
+    """
+    global _quote_snapshot_service
+    config = settings.quote_snapshots
+    if not config.get("enabled", False):
+        return None
+    if _quote_snapshot_service is None:
+        _quote_snapshot_service = QuoteSnapshotService(
+            watchlist=config.get("watchlist", DEFAULT_WATCHLIST),
+            refresh_seconds=config.get("refreshSeconds", DEFAULT_REFRESH_SECONDS),
+            max_age_seconds=config.get("maxAgeSeconds", DEFAULT_MAX_AGE_SECONDS),
+            learned_symbols=config.get("learnedSymbols", DEFAULT_LEARNED_SYMBOLS),
+            learn_min_requests=config.get("learnMinRequests", DEFAULT_LEARN_MIN_REQUESTS),
+            learn_window_minutes=config.get("learnWindowMinutes", DEFAULT_LEARN_WINDOW_MINUTES),
+        )
+    return _quote_snapshot_service
+
+
+@contextlib.asynccontextmanager
+async def quote_snapshot_lifespan(app) -> AsyncIterator[None]:
+    """Gradio/FastAPI lifespan hook that starts and stops the quote snapshot poll.
+
+    Usage:
+        demo.launch(app_kwargs={"lifespan": quote_snapshot_lifespan})
+    """
+    service = get_quote_snapshot_service()
+    if service is not None:
+        service.start()
+    try:
+        yield
+    finally:
+        if service is not None:
+            await service.stop()
@@ -0,0 +1,201 @@
+"""Rate Limiting Utility Module.
+
+This module provides shared, per-provider async token-bucket rate limiters for
+upstream API calls (Tradier and Polygon.io).
+
+Every upstream request acquires a token from its provider's bucket before it is
+sent. While the process is under quota, tokens are available immediately and
+requests are not delayed at all; only bursts beyond the configured rate wait,
+and only as long as needed for a token to refill. This replaces the fixed
+1-second sleeps previously used between Polygon indicator batches.
+
+The buckets adapt to upstream feedback:
+- HTTP 429 responses halve the effective rate (down to a floor) and honor the
+  Retry-After header by pausing the bucket until the given time
+- Successful responses gradually restore the configured rate
+
+Configuration (config/app.config.json → backend.tools.rateLimits):
+    "rateLimits": {
+      "tradier": {"requestsPerSecond": 2, "burst": 10},
+      "polygon": {"requestsPerSecond": 5, "burst": 10}
+    }
+"""
+
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from ..config import settings
+
+# Fallback limits for providers missing from the config file
+DEFAULT_REQUESTS_PER_SECOND = 5.0
+DEFAULT_BURST = 10
+
+# Adaptive behavior constants
+RATE_LIMITED_BACKOFF_FACTOR = 0.5   # Multiply rate by this on each 429
+MIN_RATE_FRACTION = 0.1             # Never drop below 10% of the configured rate
+RECOVERY_PER_SUCCESS_FRACTION = 0.05  # Restore 5% of the configured rate per success
+DEFAULT_RETRY_AFTER_SECONDS = 1.0   # Pause used when a 429 has no Retry-After header
+
+
+class AdaptiveTokenBucket:
+    """Async token bucket whose refill rate adapts to 429 responses.
+
+    Waiters are served in FIFO order: acquire() holds an internal lock while
+    waiting for a token, so a burst of callers is spaced at the current rate.
+    """
+
+    def __init__(self, name: str, requests_per_second: float, burst: int):
+        """Create a token bucket.
+
+        Args:
+            name: Provider name used in stats output (e.g., "tradier")
+            requests_per_second: Configured steady-state request rate
+            burst: Maximum number of tokens (requests allowed back-to-back)
+        """
+        self.name = name
+        self.configured_rate = float(requests_per_second)
+        self.rate = self.configured_rate
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+        self.acquired = 0
+        self.rate_limited = 0
+        self.total_wait_seconds = 0.0
+
+    def _refill(self, now: float) -> None:
+        """Add tokens earned since the last update (capped at burst)."""
+        elapsed = now - self._updated_at
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> float:
+        """Wait until a token is available and consume it.
+
+        Returns:
+            Seconds spent waiting (0.0 when a token was immediately available)
+        """
+        started_at = time.monotonic()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    break
+
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+        waited = time.monotonic() - started_at
+        self.acquired += 1
+        self.total_wait_seconds += waited
+        return waited
+
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """Back off after an HTTP 429 response.
+
+        Args:
+            retry_after: Seconds to pause from the Retry-After header, if any
+        """
+        now = time.monotonic()
+        self._refill(now)
+        self.rate_limited += 1
+        self.rate = max(
+            self.configured_rate * MIN_RATE_FRACTION,
+            self.rate * RATE_LIMITED_BACKOFF_FACTOR,
+        )
+        pause = retry_after if retry_after is not None else DEFAULT_RETRY_AFTER_SECONDS
+        self._blocked_until = max(self._blocked_until, now + pause)
+        self._tokens = 0.0
+
+    def on_success(self) -> None:
+        """Gradually restore the configured rate after successful responses."""
+        if self.rate < self.configured_rate:
+            self._refill(time.monotonic())
+            self.rate = min(
+                self.configured_rate,
+                self.rate + self.configured_rate * RECOVERY_PER_SUCCESS_FRACTION,
+            )
+
+    def stats(self) -> dict:
+        """Return rate, acquisition and back-off counters."""
+        return {
+            "configured_rate": self.configured_rate,
+            "current_rate": round(self.rate, 3),
+            "burst": self.burst,
+            "acquired": self.acquired,
+            "rate_limited": self.rate_limited,
+            "total_wait_seconds": round(self.total_wait_seconds, 3),
+        }
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header value into seconds.
+
+    Args:
+        value: Header value, either delta-seconds ("5") or an HTTP date
+
+    Returns:
+        Seconds to wait (>= 0), or None if the header is missing or invalid
+
+    Examples:
+        >>> parse_retry_after("5")
+        5.0
+        >>> parse_retry_after(None) is None
+        True
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+# Shared limiters (provider name -> bucket)
+_rate_limiters: dict[str, AdaptiveTokenBucket] = {}
+
+
+def get_rate_limiter(provider: str) -> AdaptiveTokenBucket:
+    """Get the shared rate limiter for a provider, creating it from config.
+
+    Args:
+        provider: Provider name ("tradier" or "polygon")
+
+    Returns:
+        AdaptiveTokenBucket shared by all callers for that provider
+    """
+    limiter = _rate_limiters.get(provider)
+    if limiter is None:
+        limits = settings.rate_limits.get(provider, {})
+        limiter = AdaptiveTokenBucket(
+            provider,
+            requests_per_second=limits.get("requestsPerSecond", DEFAULT_REQUESTS_PER_SECOND),
+            burst=limits.get("burst", DEFAULT_BURST),
+        )
+        _rate_limiters[provider] = limiter
+    return limiter
+
+
+def get_rate_limiter_stats() -> dict[str, dict]:
+    """Get stats for every provider rate limiter created so far.
+
+    Returns:
+        Dictionary mapping provider name to its stats() output
+    """
+    return {name: limiter.stats() for name, limiter in _rate_limiters.items()}
@@ -4,18 +4,67 @@ Provides options expiration dates via Tradier API.
 """
 
 import asyncio
-import json
 import os
 import time
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
+from typing import Optional
 
 import requests
 from agents import function_tool
 
-from .api_utils import TRADIER_TIMEOUT, create_tradier_headers
-from .error_utils import create_error_response
-from .formatting_helpers import create_options_chain_table, create_price_history_summary
-from .validation_utils import validate_and_sanitize_ticker
+from ..config import settings
+from ..utils.market_calendar import MARKET_TIMEZONE, get_market_calendar
+from .api_utils import TRADIER_BASE_URL, TRADIER_TIMEOUT, create_tradier_headers, fetch_json
+from .cache_utils import (
+    EXPIRATIONS_CACHE_TTL,
+    HISTORY_CLOSED_RANGE_CACHE_TTL,
+    HISTORY_OPEN_RANGE_CACHE_TTL,
+    OPTIONS_CHAIN_CACHE_TTL,
+    QUOTE_CACHE_TTL,
+    AsyncTTLCache,
+)
+from .coalescing_utils import SingleFlight
+from .encoding_utils import (
+    ENCODING_PRETTY,
+    encode_json_response,
+    get_output_encoding,
+    merge_encoded_responses,
+)
+from .error_utils import create_error_response, is_error_response
+from .fanout_utils import fan_out, merge_markdown_results
+from .formatting_helpers import (
+    create_options_chain_table,
+    create_options_surface_table,
+    create_price_history_summary,
+    create_price_history_summary_from_columns,
+)
+from .greeks_engine import DEFAULT_RISK_FREE_RATE
+from .market_clock import MarketClockError, get_market_clock
+from .options_chain import (
+    DEFAULT_STRIKES_PER_SIDE,
+    DEFAULT_SURFACE_EXPIRATIONS,
+    DEFAULT_SURFACE_STRIKES_PER_SIDE,
+    GREEKS_SOURCE_LOCAL,
+    GREEKS_SOURCE_TRADIER,
+    MAX_SURFACE_EXPIRATIONS,
+    OptionsChain,
+    OptionsSurface,
+    options_chain_cache_ttl,
+    options_chain_is_stale,
+)
+from .price_history_store import STORED_INTERVAL, get_price_history_store
+from .quote_snapshot import get_quote_snapshot_service
+from .validation_utils import normalize_ticker_key, split_tickers, validate_and_sanitize_ticker
+
+# Response caches backing the @function_tool wrappers (one per endpoint)
+_quote_cache = AsyncTTLCache("tradier.quote", ttl=QUOTE_CACHE_TTL)
+_expirations_cache = AsyncTTLCache("tradier.expirations", ttl=EXPIRATIONS_CACHE_TTL)
+# Parsed expiration date lists per ticker (expirations tool and options surface)
+_expiration_dates_cache = AsyncTTLCache("tradier.expiration_dates", ttl=EXPIRATIONS_CACHE_TTL)
+_price_history_cache = AsyncTTLCache("tradier.price_history", ttl=HISTORY_OPEN_RANGE_CACHE_TTL)
+# Parsed options chains per (ticker, expiration); see options_chain.py for the policy
+_options_chain_cache = AsyncTTLCache("tradier.options_chain", ttl=OPTIONS_CHAIN_CACHE_TTL)
+_options_chain_flights = SingleFlight("tradier.options_chain")
 
 
 def _get_tradier_api_key():
@@ -48,6 +97,25 @@ def _format_tradier_quote(quote: dict) -> dict:
     }
 
 
+def _format_snapshot_quote(quote: dict, fetched_at: float, age_seconds: float) -> dict:
+    """Format a snapshot quote like _format_tradier_quote() plus staleness metadata.
+
+    Args:
+        quote: Raw quote data from the snapshot poll
+        fetched_at: Unix time of the poll that returned the quote
+        age_seconds: Seconds since that poll
+
+    Returns:
+        Formatted quote with as_of (ISO time, US/Eastern) and age_seconds
+    """
+    formatted = _format_tradier_quote(quote)
+    formatted["as_of"] = datetime.fromtimestamp(fetched_at, MARKET_TIMEZONE).isoformat(
+        timespec="seconds"
+    )
+    formatted["age_seconds"] = round(age_seconds, 1)
+    return formatted
+
+
 async def _get_stock_quote(ticker: str) -> str:
     """Get real-time stock quote from Tradier API (uncached implementation).
 
@@ -70,19 +138,18 @@ async def _get_stock_quote(ticker: str) -> str:
             )
 
         # Build request to Tradier API
-        url = "https://api.tradier.com/v1/markets/quotes"
+        url = f"{TRADIER_BASE_URL}/v1/markets/quotes"
         headers = create_tradier_headers(api_key)
         params = {"symbols": ticker}
 
-        # Get aiohttp session from connection pool
-        from .api_utils import get_connection_pool
-        pool = get_connection_pool()
-        session = await pool.get_session()
-
-        # Make async API request with timeout
-        async with session.get(url, headers=headers, params=params) as response:
-            response.raise_for_status()
-            data = await response.json()
+        # Make async API request (concurrent identical requests are coalesced)
+        status, data = await fetch_json("tradier", url, headers, params)
+        if status != 200:
+            return create_error_response(
+                "API request failed",
+                f"Tradier API returned status {status}",
+                ticker=ticker,
+            )
 
         quotes_data = data.get("quotes", {}).get("quote")
 
@@ -100,10 +167,10 @@ async def _get_stock_quote(ticker: str) -> str:
             results = []
             for quote in quotes_data:
                 results.append(_format_tradier_quote(quote))
-            return json.dumps(results, indent=2)
+            return encode_json_response(results, "get_stock_quote")
         else:
             # Single ticker response - return single formatted quote
-            return json.dumps(_format_tradier_quote(quotes_data), indent=2)
+            return encode_json_response(_format_tradier_quote(quotes_data), "get_stock_quote")
 
     except asyncio.TimeoutError:
         return create_error_response(
@@ -131,14 +198,80 @@ async def get_stock_quote(ticker: str) -> str:
         Multiple tickers return array of quote objects.
 
     Note: Handles up to 10 tickers. Real-time updates during market hours.
+    Hot tickers are served from a background snapshot and include as_of and
+    age_seconds (snapshot staleness).
+    """
+    symbols = split_tickers(ticker)
+    snapshots = get_quote_snapshot_service()
+    if snapshots is not None:
+        quotes = snapshots.get_quotes(symbols)
+        if quotes is not None:
+            snapshots.record_request(symbols)
+            formatted = [_format_snapshot_quote(*snapshot) for snapshot in quotes]
+            return encode_json_response(
+                formatted if len(formatted) > 1 else formatted[0], "get_stock_quote"
+            )
+
+    result = await _quote_cache.get_or_fetch(
+        normalize_ticker_key(ticker),
+        lambda: _get_stock_quote(ticker),
+    )
+    # Only symbols that returned quotes are learned for the snapshot poll
+    if snapshots is not None and not is_error_response(result):
+        snapshots.record_request(symbols)
+    return result
+
+
+class TradierExpirationsError(Exception):
+    """Raised when /v1/markets/options/expirations returns a non-200 status."""
+
+    def __init__(self, status: int):
+        super().__init__(f"Tradier API returned status {status}")
+        self.status = status
+
+
+async def _fetch_expiration_dates(ticker: str, headers: dict) -> list[str]:
+    """Request a ticker's options expiration dates.
+
+    Returns:
+        Dates (YYYY-MM-DD) in chronological order (empty if none)
+
+    Raises:
+        TradierExpirationsError: Non-200 response
+    """
+    url = f"{TRADIER_BASE_URL}/v1/markets/options/expirations?symbol={ticker}"
+
+    # Concurrent identical requests are coalesced
+    status, data = await fetch_json("tradier", url, headers)
+    if status != 200:
+        raise TradierExpirationsError(status)
+
+    dates = (data.get("expirations") or {}).get("date", [])
+    # API returns a single string if only 1 date
+    if isinstance(dates, str):
+        dates = [dates]
+    return dates
+
+
+async def _get_expiration_dates(ticker: str, headers: dict) -> list[str]:
+    """Get a ticker's expiration dates from cache (empty lists are not cached).
+
+    Raises:
+        TradierExpirationsError: Non-200 response
     """
-    return await _get_stock_quote(ticker)
+    dates = _expiration_dates_cache.get(ticker)
+    if dates is None:
+        dates = await _fetch_expiration_dates(ticker, headers)
+        if dates:
+            _expiration_dates_cache.set(ticker, dates)
+    return dates
 
 
 async def _get_options_expiration_dates(ticker: str) -> str:
-    """Get valid options expiration dates for a ticker from Tradier API (uncached implementation).
+    """Get valid options expiration dates for a ticker from Tradier API (uncached response).
 
-    Internal function that performs the actual API call without caching.
+    Internal function that builds the response without the response cache
+    (the parsed date list is cached and shared with get_options_surface).
     Use get_options_expiration_dates() instead for cached access.
     """
     try:
@@ -156,31 +289,16 @@ async def _get_options_expiration_dates(ticker: str) -> str:
                 ticker=ticker,
             )
 
-        # Call Tradier API
-        url = f"https://api.tradier.com/v1/markets/options/expirations?symbol={ticker}"
+        # Expiration dates (parsed list shared with get_options_surface)
         headers = create_tradier_headers(api_key)
-
-        # Get aiohttp session from connection pool
-        from .api_utils import get_connection_pool
-        pool = get_connection_pool()
-        session = await pool.get_session()
-
-        # Make async API request
-        async with session.get(url, headers=headers) as response:
-            # Check HTTP status
-            if response.status != 200:
-                return create_error_response(
-                    "API request failed",
-                    f"Tradier API returned status {response.status}",
-                    ticker=ticker,
-                )
-
-            # Parse response
-            data = await response.json()
-
-        # Extract expiration dates
-        expirations = data.get("expirations", {})
-        dates = expirations.get("date", [])
+        try:
+            dates = await _get_expiration_dates(ticker, headers)
+        except TradierExpirationsError as e:
+            return create_error_response(
+                "API request failed",
+                f"Tradier API returned status {e.status}",
+                ticker=ticker,
+            )
 
         # Check if we got valid data
         if not dates:
@@ -190,18 +308,15 @@ async def _get_options_expiration_dates(ticker: str) -> str:
                 ticker=ticker,
             )
 
-        # Ensure dates is a list (API returns single string if only 1 date)
-        if isinstance(dates, str):
-            dates = [dates]
-
         # Format response
-        return json.dumps(
+        return encode_json_response(
             {
                 "ticker": ticker,
                 "expiration_dates": dates,
                 "count": len(dates),
                 "source": "Tradier",
-            }
+            },
+            "get_options_expiration_dates",
         )
 
     except asyncio.TimeoutError:
@@ -220,18 +335,25 @@ async def _get_options_expiration_dates(ticker: str) -> str:
 
 @function_tool
 async def get_options_expiration_dates(ticker: str) -> str:
-    """Get available options expiration dates for a ticker from Tradier API.
+    """Get available options expiration dates for one or more tickers from Tradier API.
 
     Args:
-        ticker: Stock ticker symbol (e.g., "AAPL", "SPY").
+        ticker: Single "SPY" or multiple "SPY,QQQ,IWM" (see Common Formats).
 
     Returns:
         JSON string with expiration dates array (ticker, expiration_dates[], count, source).
+        Multiple tickers return a JSON array with one object per ticker.
         Dates sorted chronologically (see Common Formats).
 
     Note: Includes weekly and monthly expirations.
     """
-    return await _get_options_expiration_dates(ticker)
+    results = await fan_out(
+        split_tickers(ticker),
+        lambda symbol: _expirations_cache.get_or_fetch(
+            symbol, lambda: _get_options_expiration_dates(symbol)
+        ),
+    )
+    return merge_encoded_responses(results, "get_options_expiration_dates")
 
 
 async def _get_stock_price_history(
@@ -327,30 +449,22 @@ async def _get_stock_price_history(
                 ticker=ticker,
             )
 
-        # Weekend detection and date adjustment
-        # Adjust dates if they fall on Saturday or Sunday to previous Friday
+        # Trading-calendar date adjustment: dates on weekends or market holidays
+        # move to the previous session, so holiday ranges still return bars
         try:
-            start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-            end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-
-            # Adjust start_date if weekend (Saturday=5, Sunday=6)
-            if start_dt.weekday() == 5:  # Saturday
-                start_dt = start_dt - timedelta(days=1)  # Move to Friday
-            elif start_dt.weekday() == 6:  # Sunday
-                start_dt = start_dt - timedelta(days=2)  # Move to Friday
-
-            # Adjust end_date if weekend
-            if end_dt.weekday() == 5:  # Saturday
-                end_dt = end_dt - timedelta(days=1)  # Move to Friday
-            elif end_dt.weekday() == 6:  # Sunday
-                end_dt = end_dt - timedelta(days=2)  # Move to Friday
-
-            # Convert back to string format
-            start_date = start_dt.strftime("%Y-%m-%d")
-            end_date = end_dt.strftime("%Y-%m-%d")
+            calendar = get_market_calendar()
+            start_session = calendar.session_on_or_before(
+                datetime.strptime(start_date, "%Y-%m-%d").date()
+            )
+            end_session = calendar.session_on_or_before(
+                datetime.strptime(end_date, "%Y-%m-%d").date()
+            )
+            if start_session and end_session:
+                start_date = start_session.isoformat()
+                end_date = end_session.isoformat()
         except ValueError:
-            # If date parsing fails, continue with original dates
-            # API will return appropriate error
+            # Unparseable or out-of-calendar dates: continue with the original dates
+            # (API will return appropriate error)
             pass
 
         # Get API key
@@ -362,43 +476,31 @@ async def _get_stock_price_history(
                 ticker=ticker,
             )
 
-        # Build request to Tradier API
-        url = "https://api.tradier.com/v1/markets/history"
         headers = create_tradier_headers(api_key)
-        params = {
-            "symbol": ticker,
-            "interval": interval,
-            "start": start_date,
-            "end": end_date,
-        }
-
-        # Get aiohttp session from connection pool
-        from .api_utils import get_connection_pool
-        pool = get_connection_pool()
-        session = await pool.get_session()
-
-        # Make async API request
-        async with session.get(url, headers=headers, params=params) as response:
-            # Check HTTP status
-            if response.status != 200:
-                return create_error_response(
-                    "API request failed",
-                    f"Tradier API returned status {response.status}",
-                    ticker=ticker,
-                    interval=interval,
-                )
 
-            # Parse response
-            data = await response.json()
+        async def fetch_bars(symbol: str, start: str, end: str) -> list[dict]:
+            return await _fetch_tradier_history_bars(symbol, interval, start, end, headers)
 
-        history_data = data.get("history", {})
-        bars_data = history_data.get("day", [])
-        # Handle weekly/monthly: single dict vs daily: array of dicts
-        if isinstance(bars_data, dict):
-            bars_data = [bars_data]
+        try:
+            # Daily bars are served from the local store (only uncovered gaps are fetched)
+            store = get_price_history_store() if interval == STORED_INTERVAL else None
+            if store is not None:
+                columns = await store.get_daily_columns(ticker, start_date, end_date, fetch_bars)
+                bar_count = len(columns)
+            else:
+                columns = None
+                bars_data = await fetch_bars(ticker, start_date, end_date)
+                bar_count = len(bars_data)
+        except TradierHistoryError as e:
+            return create_error_response(
+                "API request failed",
+                f"Tradier API returned status {e.status}",
+                ticker=ticker,
+                interval=interval,
+            )
 
         # Check if API returned data
-        if not bars_data:
+        if bar_count == 0:
             return create_error_response(
                 "No data",
                 f"No historical data available for {ticker} from {start_date} to {end_date}. Verify ticker symbol and date range.",
@@ -408,6 +510,16 @@ async def _get_stock_price_history(
                 end_date=end_date,
             )
 
+        # Stored bars: summarize the memory-mapped columns directly
+        if columns is not None:
+            return create_price_history_summary_from_columns(
+                ticker=ticker,
+                interval=interval,
+                columns=columns,
+                start_date=start_date,
+                end_date=end_date,
+            )
+
         # Format response with bars
         formatted_bars = []
         for bar in bars_data:
@@ -446,7 +558,7 @@ async def get_stock_price_history(
     """Get historical stock price data (OHLC bars) from Tradier API.
 
     Args:
-        ticker: Stock ticker symbol (e.g., "SPY", "AAPL").
+        ticker: Single "SPY" or multiple "SPY,QQQ,IWM" (see Common Formats).
         start_date: Start date (see Common Formats).
         end_date: End date (see Common Formats).
         interval: "daily", "weekly", or "monthly". See RULE #3 for selection logic.
@@ -454,10 +566,109 @@ async def get_stock_price_history(
     Returns:
         JSON string with historical OHLC data (ticker, interval, start_date, end_date, bars[], count, source).
         Each bar includes date, open, high, low, close, volume.
+        Multiple tickers return one summary per ticker (same date range and interval).
+
+    Note: Date range inclusive. Tool auto-adjusts weekend and market holiday dates to the previous trading session.
+    """
+    ttl = _price_history_cache_ttl(end_date)
+
+    async def fetch_history(symbol: str) -> str:
+        cache_key = (symbol, start_date.strip(), end_date.strip(), interval)
+        return await _price_history_cache.get_or_fetch(
+            cache_key,
+            lambda: _get_stock_price_history(symbol, start_date, end_date, interval),
+            ttl=ttl,
+        )
+
+    results = await fan_out(split_tickers(ticker), fetch_history)
+    return merge_markdown_results(results)
+
+
+def _price_history_cache_ttl(end_date: str) -> float:
+    """Select the cache TTL for a price history range.
+
+    Ranges ending before today (US/Eastern) only contain closed sessions, so
+    their bars never change and can be cached indefinitely. Ranges that include
+    today may still receive updates to the current bar.
 
-    Note: Date range inclusive. Tool auto-adjusts weekend dates to previous Friday.
+    Args:
+        end_date: Requested end date in YYYY-MM-DD format
+
+    Returns:
+        TTL in seconds
+    """
+    try:
+        end_dt = datetime.strptime(end_date.strip(), "%Y-%m-%d").date()
+    except ValueError:
+        return HISTORY_OPEN_RANGE_CACHE_TTL
+
+    today = datetime.now(MARKET_TIMEZONE).date()
+    if end_dt < today:
+        return HISTORY_CLOSED_RANGE_CACHE_TTL
+    return HISTORY_OPEN_RANGE_CACHE_TTL
+
+
+class TradierHistoryError(Exception):
+    """Raised when /v1/markets/history returns a non-200 status."""
+
+    def __init__(self, status: int):
+        super().__init__(f"Tradier API returned status {status}")
+        self.status = status
+
+
+async def _fetch_tradier_history_bars(
+    ticker: str, interval: str, start_date: str, end_date: str, headers: dict
+) -> list[dict]:
+    """Request raw OHLCV bars from /v1/markets/history.
+
+    Args:
+        ticker: Normalized ticker symbol
+        interval: "daily", "weekly" or "monthly"
+        start_date: Start date (YYYY-MM-DD, inclusive)
+        end_date: End date (YYYY-MM-DD, inclusive)
+        headers: Tradier request headers
+
+    Returns:
+        Raw bar dicts (empty when the range has no sessions)
+
+    Raises:
+        TradierHistoryError: Non-200 response
     """
-    return await _get_stock_price_history(ticker, start_date, end_date, interval)
+    params = {
+        "symbol": ticker,
+        "interval": interval,
+        "start": start_date,
+        "end": end_date,
+    }
+
+    # Concurrent identical requests are coalesced
+    status, data = await fetch_json(
+        "tradier", f"{TRADIER_BASE_URL}/v1/markets/history", headers, params
+    )
+    if status != 200:
+        raise TradierHistoryError(status)
+
+    # "history" is null when the range contains no sessions
+    bars_data = (data.get("history") or {}).get("day", [])
+    # Handle weekly/monthly: single dict vs daily: array of dicts
+    if isinstance(bars_data, dict):
+        bars_data = [bars_data]
+    return bars_data
+
+
+async def fetch_daily_history_bars(ticker: str, start_date: str, end_date: str) -> list[dict]:
+    """Request raw daily bars for the price history store outside the history tool.
+
+    Raises:
+        ValueError: TRADIER_API_KEY is not set
+        TradierHistoryError: Non-200 response
+    """
+    api_key = _get_tradier_api_key()
+    if not api_key:
+        raise ValueError("TRADIER_API_KEY not found in environment")
+    return await _fetch_tradier_history_bars(
+        ticker, STORED_INTERVAL, start_date, end_date, create_tradier_headers(api_key)
+    )
 
 
 def _format_tradier_history_bar(bar: dict) -> dict:
@@ -484,16 +695,102 @@ def _format_tradier_history_bar(bar: dict) -> dict:
 
 
 
+class TradierOptionsChainError(Exception):
+    """Raised when /v1/markets/options/chains returns a non-200 status."""
+
+    def __init__(self, status: int):
+        super().__init__(f"Tradier API returned status {status}")
+        self.status = status
+
+
+def _options_greeks_config() -> tuple[str, float]:
+    """Greeks source and risk-free rate from the "optionsGreeks" tool config."""
+    config = settings.options_greeks
+    source = config.get("source", GREEKS_SOURCE_TRADIER)
+    if source not in (GREEKS_SOURCE_TRADIER, GREEKS_SOURCE_LOCAL):
+        source = GREEKS_SOURCE_TRADIER
+    return source, float(config.get("riskFreeRate", DEFAULT_RISK_FREE_RATE))
+
+
+async def _fetch_options_chain(
+    ticker: str, expiration_date: str, current_price: float, headers: dict
+) -> Optional[OptionsChain]:
+    """Request one expiration's chain and parse it.
+
+    Greeks are requested from Tradier unless the configured source is
+    "local"; options without Tradier greeks get local Black-Scholes greeks
+    computed at current_price.
+
+    Returns:
+        Parsed chain, or None when the expiration has no options
+
+    Raises:
+        TradierOptionsChainError: Non-200 response
+    """
+    greeks_source, risk_free_rate = _options_greeks_config()
+    params = {
+        "symbol": ticker,
+        "expiration": expiration_date,
+        # Tradier greeks (slower responses); computed locally otherwise
+        "greeks": "true" if greeks_source == GREEKS_SOURCE_TRADIER else "false",
+    }
+
+    # SINGLE call fetches both calls and puts (concurrent identical requests are coalesced)
+    status, data = await fetch_json(
+        "tradier", f"{TRADIER_BASE_URL}/v1/markets/options/chains", headers, params
+    )
+    if status != 200:
+        raise TradierOptionsChainError(status)
+
+    option_list = (data.get("options") or {}).get("option", [])
+    if not option_list:
+        return None
+    chain = OptionsChain.from_tradier(option_list)
+    chain.fill_missing_greeks(current_price, expiration_date, risk_free_rate)
+    return chain
+
+
+async def _get_parsed_options_chain(
+    ticker: str, expiration_date: str, current_price: float, headers: dict
+) -> Optional[OptionsChain]:
+    """Get the parsed chain from cache, refetching when expired or stale for the price.
+
+    Returns:
+        Parsed chain, or None when the expiration has no options (not cached)
+
+    Raises:
+        TradierOptionsChainError: Non-200 response
+    """
+    key = (ticker, expiration_date.strip())
+    cached = _options_chain_cache.get(key)
+    if cached is not None:
+        chain, served_price = cached
+        if not options_chain_is_stale(served_price, current_price):
+            return chain
+
+    chain = await _options_chain_flights.do(
+        key, lambda: _fetch_options_chain(ticker, expiration_date, current_price, headers)
+    )
+    if chain is not None:
+        _options_chain_cache.set(key, (chain, current_price), options_chain_cache_ttl(chain))
+    return chain
+
+
 async def _get_options_chain_both(
-    ticker: str, current_price: float, expiration_date: str
+    ticker: str,
+    current_price: float,
+    expiration_date: str,
+    strikes_per_side: int = DEFAULT_STRIKES_PER_SIDE,
 ) -> str:
-    """Get both Call and Put Options Chains with 20 strikes each centered around current price (uncached implementation).
+    """Get both Call and Put Options Chains centered around current price.
 
-    Internal function that performs the actual API call without caching.
-    Use get_options_chain_both() instead for cached access.
+    Internal implementation of get_options_chain_both(). The parsed chain is
+    cached per (ticker, expiration) (see options_chain.py for the TTL and
+    invalidation policy); only the strike window and tables are built per call.
 
     Returns both call and put options chains in a single response with separate tables.
-    Each chain shows 20 strikes (10 above + 10 below current price), sorted descending.
+    Each chain shows up to strikes_per_side strikes above and below the current
+    price (default 10 + 10), sorted descending.
     """
     try:
         # Validate and sanitize ticker input
@@ -508,6 +805,13 @@ async def _get_options_chain_both(
                 ticker=ticker,
             )
 
+        if strikes_per_side < 1:
+            return create_error_response(
+                "Invalid strikes per side",
+                f"strikes_per_side {strikes_per_side} must be at least 1",
+                ticker=ticker,
+            )
+
         if not expiration_date:
             return create_error_response(
                 "Invalid expiration date",
@@ -524,151 +828,46 @@ async def _get_options_chain_both(
                 ticker=ticker,
             )
 
-        # Build Tradier API request
-        url = "https://api.tradier.com/v1/markets/options/chains"
+        # Parsed chain for (ticker, expiration), cached and windowed per price
         headers = create_tradier_headers(api_key)
-        params = {
-            "symbol": ticker,
-            "expiration": expiration_date,
-            "greeks": "true",  # Required for delta and other greek values
-        }
-
-        # Get aiohttp session from connection pool
-        from .api_utils import get_connection_pool
-        pool = get_connection_pool()
-        session = await pool.get_session()
-
-        # Make async API request (SINGLE call fetches both calls and puts)
-        async with session.get(url, headers=headers, params=params) as response:
-            if response.status != 200:
-                return create_error_response(
-                    "API request failed",
-                    f"Tradier API returned status {response.status}",
-                    ticker=ticker,
-                )
-
-            # Parse response
-            data = await response.json()
-
-        options_data = data.get("options", {})
-        option_list = options_data.get("option", [])
+        try:
+            chain = await _get_parsed_options_chain(
+                ticker, expiration_date, current_price, headers
+            )
+        except TradierOptionsChainError as e:
+            return create_error_response(
+                "API request failed",
+                f"Tradier API returned status {e.status}",
+                ticker=ticker,
+            )
 
-        if not option_list:
+        if chain is None:
             return create_error_response(
                 "No data",
                 f"No options data found for {ticker} expiring {expiration_date}",
                 ticker=ticker,
             )
 
-        # Filter for CALL options and apply 20-strike centering
-        call_options = [
-            opt
-            for opt in option_list
-            if opt.get("option_type") == "call"
-        ]
-
-        if not call_options:
+        if not len(chain.calls):
             return create_error_response(
                 "No call options found",
                 f"No call options found for {ticker}",
                 ticker=ticker,
             )
 
-        # Split call strikes above and below current price
-        call_strikes_above = [opt for opt in call_options if opt.get("strike", 0) > current_price]
-        call_strikes_below = [opt for opt in call_options if opt.get("strike", 0) < current_price]
-
-        # Sort and select 10 from each side for calls
-        call_strikes_above.sort(key=lambda x: x.get("strike", 0))  # Ascending
-        call_strikes_above = call_strikes_above[:10]  # First 10 above
-
-        call_strikes_below.sort(key=lambda x: x.get("strike", 0), reverse=True)  # Descending
-        call_strikes_below = call_strikes_below[:10]  # First 10 below
-
-        # Combine and sort DESCENDING for call options
-        call_options = call_strikes_above + call_strikes_below
-        call_options.sort(key=lambda x: x.get("strike", 0), reverse=True)
-
-        # Filter for PUT options and apply 20-strike centering
-        put_options = [
-            opt
-            for opt in option_list
-            if opt.get("option_type") == "put"
-        ]
-
-        if not put_options:
+        if not len(chain.puts):
             return create_error_response(
                 "No put options found",
                 f"No put options found for {ticker}",
                 ticker=ticker,
             )
 
-        # Split put strikes above and below current price
-        put_strikes_above = [opt for opt in put_options if opt.get("strike", 0) > current_price]
-        put_strikes_below = [opt for opt in put_options if opt.get("strike", 0) < current_price]
-
-        # Sort and select 10 from each side for puts
-        put_strikes_above.sort(key=lambda x: x.get("strike", 0))  # Ascending
-        put_strikes_above = put_strikes_above[:10]  # First 10 above
-
-        put_strikes_below.sort(key=lambda x: x.get("strike", 0), reverse=True)  # Descending
-        put_strikes_below = put_strikes_below[:10]  # First 10 below
-
-        # Combine and sort DESCENDING for put options
-        put_options = put_strikes_above + put_strikes_below
-        put_options.sort(key=lambda x: x.get("strike", 0), reverse=True)
-
-        # Format call options data
-        formatted_call_options = []
-        for opt in call_options:
-            strike = opt.get("strike", 0)
-            bid = opt.get("bid", 0)
-            ask = opt.get("ask", 0)
+        # Strikes nearest the current price (N above + N below), sorted descending
+        formatted_call_options = chain.calls.window_rows(current_price, strikes_per_side)
+        formatted_put_options = chain.puts.window_rows(current_price, strikes_per_side)
 
-            greeks = opt.get("greeks", {})
-            delta = greeks.get("delta", 0)
-            implied_vol = greeks.get("smv_vol", 0) * 100  # Convert to percentage
-
-            volume = opt.get("volume", 0) or 0  # Handle None
-            open_interest = opt.get("open_interest", 0) or 0  # Handle None
-
-            formatted_call_options.append(
-                {
-                    "strike": round(strike, 2),
-                    "bid": round(bid, 2),
-                    "ask": round(ask, 2),
-                    "delta": round(delta, 2),
-                    "implied_volatility": round(implied_vol, 2),
-                    "volume": volume,
-                    "open_interest": open_interest,
-                }
-            )
-
-        # Format put options data
-        formatted_put_options = []
-        for opt in put_options:
-            strike = opt.get("strike", 0)
-            bid = opt.get("bid", 0)
-            ask = opt.get("ask", 0)
-
-            greeks = opt.get("greeks", {})
-            delta = greeks.get("delta", 0)
-            implied_vol = greeks.get("smv_vol", 0) * 100  # Convert to percentage
-
-            volume = opt.get("volume", 0) or 0  # Handle None
-            open_interest = opt.get("open_interest", 0) or 0  # Handle None
-
-            formatted_put_options.append(
-                {
-                    "strike": round(strike, 2),
-                    "bid": round(bid, 2),
-                    "ask": round(ask, 2),
-                    "delta": round(delta, 2),
-                    "implied_volatility": round(implied_vol, 2),
-                    "volume": volume,
-                    "open_interest": open_interest,
-                }
-            )
+        # Pad table columns only in "pretty" output encoding
+        table_padded = get_output_encoding("get_options_chain_both") == ENCODING_PRETTY
 
         # Format call options chain table
         call_table = create_options_chain_table(
@@ -677,6 +876,7 @@ async def _get_options_chain_both(
             expiration_date=expiration_date,
             current_price=current_price,
             options=formatted_call_options,
+            padded=table_padded,
         )
 
         # Format put options chain table
@@ -686,6 +886,7 @@ async def _get_options_chain_both(
             expiration_date=expiration_date,
             current_price=current_price,
             options=formatted_put_options,
+            padded=table_padded,
         )
 
         # Combine both tables with separator
@@ -707,25 +908,221 @@ async def _get_options_chain_both(
 
 @function_tool
 async def get_options_chain_both(
-    ticker: str, current_price: float, expiration_date: str
+    ticker: str,
+    current_price: str,
+    expiration_date: str,
+    strikes_per_side: int = DEFAULT_STRIKES_PER_SIDE,
 ) -> str:
-    """Get both Call and Put Options Chains (20 strikes each, centered around current price).
+    """Get both Call and Put Options Chains (strikes centered around current price).
 
     Use for comprehensive options analysis. Returns both chains in single API call.
 
     Args:
-        ticker: Stock ticker symbol (e.g., "SPY", "AAPL").
-        current_price: Current price of underlying stock (must be > 0).
+        ticker: Single "SPY" or multiple "SPY,QQQ,IWM" (see Common Formats).
+        current_price: Current price of each underlying (must be > 0), comma-separated
+            in the same order as ticker (e.g., "671.16,604.12,245.80").
         expiration_date: Options expiration date (see Common Formats). Get from get_options_expiration_dates() first.
+            One date applies to all tickers, or pass one comma-separated date per ticker.
+        strikes_per_side: Strikes shown above and below the current price (default 10).
+
+    Returns:
+        String with two markdown tables per ticker (Call and Put chains).
+        Strikes centered around current price (strikes_per_side above and below).
+        Columns: Strike, Bid, Ask, Delta, Gamma, Theta, Vega, Vol, OI, IV.
+
+    Note: Single API call per ticker fetches both chains. See RULE #5 for usage guidance.
+    """
+    tickers = split_tickers(ticker)
+    prices = [part.strip() for part in str(current_price).split(",")]
+    expirations = [part.strip() for part in str(expiration_date).split(",")]
+    if len(expirations) == 1:
+        expirations = expirations * len(tickers)
+
+    if len(prices) != len(tickers) or len(expirations) != len(tickers):
+        return create_error_response(
+            "Invalid parameters",
+            f"Expected {len(tickers)} current price(s) and expiration date(s) "
+            f"matching tickers {','.join(tickers)}",
+            ticker=ticker,
+        )
+
+    try:
+        prices = [float(price) for price in prices]
+    except ValueError:
+        return create_error_response(
+            "Invalid current price",
+            f"Current price '{current_price}' must be numeric",
+            ticker=ticker,
+        )
+
+    async def fetch_chain(index: int) -> str:
+        # Parsed chains are cached per (ticker, expiration) inside _get_options_chain_both
+        return await _get_options_chain_both(
+            tickers[index], prices[index], expirations[index], strikes_per_side
+        )
+
+    results = await fan_out(range(len(tickers)), fetch_chain)
+    return merge_markdown_results(results)
+
+
+async def _get_options_surface(
+    ticker: str,
+    current_price: float,
+    expiration_count: int = DEFAULT_SURFACE_EXPIRATIONS,
+    strikes_per_side: int = DEFAULT_SURFACE_STRIKES_PER_SIDE,
+) -> str:
+    """Get a strike × expiration IV/delta grid for the nearest expirations.
+
+    Internal implementation of get_options_surface(). The expiration chains
+    are fetched concurrently (same parsed-chain cache, HTTP coalescing and
+    rate limiter as get_options_chain_both); expirations without options are
+    left out of the grid.
+    """
+    try:
+        # Validate and sanitize ticker input
+        ticker, error = validate_and_sanitize_ticker(ticker)
+        if error:
+            return error
+
+        if current_price <= 0:
+            return create_error_response(
+                "Invalid current price",
+                f"Current price {current_price} must be positive",
+                ticker=ticker,
+            )
+
+        if not 1 <= expiration_count <= MAX_SURFACE_EXPIRATIONS:
+            return create_error_response(
+                "Invalid expiration count",
+                f"expiration_count {expiration_count} must be between 1 and "
+                f"{MAX_SURFACE_EXPIRATIONS}",
+                ticker=ticker,
+            )
+
+        if strikes_per_side < 1:
+            return create_error_response(
+                "Invalid strikes per side",
+                f"strikes_per_side {strikes_per_side} must be at least 1",
+                ticker=ticker,
+            )
+
+        # Get API key
+        api_key = _get_tradier_api_key()
+        if not api_key:
+            return create_error_response(
+                "Configuration error",
+                "TRADIER_API_KEY not found in environment",
+                ticker=ticker,
+            )
+
+        headers = create_tradier_headers(api_key)
+        try:
+            expirations = (await _get_expiration_dates(ticker, headers))[:expiration_count]
+            chains = await asyncio.gather(
+                *(
+                    _get_parsed_options_chain(ticker, expiration, current_price, headers)
+                    for expiration in expirations
+                )
+            )
+        except (TradierExpirationsError, TradierOptionsChainError) as e:
+            return create_error_response(
+                "API request failed",
+                f"Tradier API returned status {e.status}",
+                ticker=ticker,
+            )
+
+        available = [(expiration, chain) for expiration, chain in zip(expirations, chains) if chain]
+        if not available:
+            return create_error_response(
+                "No data",
+                f"No options data found for {ticker}. Verify ticker symbol is valid.",
+                ticker=ticker,
+            )
+
+        surface = OptionsSurface(
+            expirations=[expiration for expiration, _ in available],
+            chains=[chain for _, chain in available],
+            current_price=current_price,
+            strikes_per_side=strikes_per_side,
+        )
+
+        return create_options_surface_table(
+            ticker=ticker,
+            current_price=current_price,
+            expirations=surface.expirations,
+            strikes=surface.strike,
+            implied_volatility=surface.implied_volatility,
+            delta=surface.delta,
+            atm_implied_volatility=surface.atm_implied_volatility,
+            # Pad table columns only in "pretty" output encoding
+            padded=get_output_encoding("get_options_surface") == ENCODING_PRETTY,
+        )
+
+    except asyncio.TimeoutError:
+        return create_error_response(
+            "Timeout",
+            f"Tradier API request timed out for {ticker}",
+            ticker=ticker,
+        )
+    except Exception as e:
+        return create_error_response(
+            "API request failed",
+            f"Failed to retrieve options surface for {ticker}: {str(e)}",
+            ticker=ticker,
+        )
+
+
+@function_tool
+async def get_options_surface(
+    ticker: str,
+    current_price: str,
+    expiration_count: int = DEFAULT_SURFACE_EXPIRATIONS,
+    strikes_per_side: int = DEFAULT_SURFACE_STRIKES_PER_SIDE,
+) -> str:
+    """Get an options IV/delta surface (strikes × nearest expirations) in one call.
+
+    Use for term structure, skew and cross-expiration comparisons instead of
+    calling get_options_chain_both once per expiration.
+
+    Args:
+        ticker: Single "SPY" or multiple "SPY,QQQ,IWM" (see Common Formats).
+        current_price: Current price of each underlying (must be > 0), comma-separated
+            in the same order as ticker (e.g., "671.16,604.12,245.80").
+        expiration_count: Nearest expirations to include (default 6, max 12).
+        strikes_per_side: Strikes shown above and below the current price (default 5).
 
     Returns:
-        String with two markdown tables (Call and Put chains, 20 strikes each).
-        Strikes centered around current price (10 above, 10 below).
-        Columns: Strike, Bid, Ask, Delta, Volume, OI, IV, Gamma.
+        String with one markdown table per ticker: rows are strikes (descending),
+        columns are expirations, cells are "IV / Delta" of the out-of-the-money
+        option (calls above current price, puts below). Last row: ATM IV per expiration.
 
-    Note: Single API call fetches both chains. See RULE #5 for usage guidance.
+    Note: Expiration dates are looked up automatically. See RULE #5 for usage guidance.
     """
-    return await _get_options_chain_both(ticker, current_price, expiration_date)
+    tickers = split_tickers(ticker)
+    prices = [part.strip() for part in str(current_price).split(",")]
+    if len(prices) != len(tickers):
+        return create_error_response(
+            "Invalid parameters",
+            f"Expected {len(tickers)} current price(s) matching tickers {','.join(tickers)}",
+            ticker=ticker,
+        )
+
+    try:
+        prices = [float(price) for price in prices]
+    except ValueError:
+        return create_error_response(
+            "Invalid current price",
+            f"Current price '{current_price}' must be numeric",
+            ticker=ticker,
+        )
+
+    async def fetch_surface(index: int) -> str:
+        return await _get_options_surface(
+            tickers[index], prices[index], expiration_count, strikes_per_side
+        )
+
+    results = await fan_out(range(len(tickers)), fetch_surface)
+    return merge_markdown_results(results)
 
 
 
@@ -792,7 +1189,8 @@ async def _get_market_status_and_date_time() -> str:
         - Data updates in real-time from Tradier servers
         - Includes pre-market (early_hours) and after-market (after_hours) status
         - Server time is in UTC timezone
-        - This is a direct API call via HTTP
+        - The clock is fetched once and served locally until its next state
+          change (see market_clock.py)
 
     Examples:
         - "Is the market open?"
@@ -811,24 +1209,16 @@ async def _get_market_status_and_date_time() -> str:
                 source="Tradier"
             )
 
-        # Build request to Tradier API
-        url = "https://api.tradier.com/v1/markets/clock"
-        headers = {
-            "Accept": "application/json",
-            "Authorization": f"Bearer {api_key}"
-        }
-
-        # Get aiohttp session from connection pool
-        from .api_utils import get_connection_pool
-        pool = get_connection_pool()
-        session = await pool.get_session()
-
-        # Make async API request
-        async with session.get(url, headers=headers) as response:
-            response.raise_for_status()
-            data = await response.json()
-
-        clock_data = data.get("clock", {})
+        # Served from the cached clock until its next state change
+        headers = create_tradier_headers(api_key)
+        try:
+            clock_data = await get_market_clock().get_clock(headers)
+        except MarketClockError as e:
+            return create_error_response(
+                "API request failed",
+                f"Tradier API returned status {e.status}",
+                source="Tradier"
+            )
 
         # Check if API returned valid data
         if not clock_data:
@@ -854,7 +1244,7 @@ async def _get_market_status_and_date_time() -> str:
         # Build response with exchange status (use overall state for all exchanges)
         exchange_status = market_status
 
-        return json.dumps(
+        return encode_json_response(
             {
                 "market_status": market_status,
                 "after_hours": after_hours,
@@ -869,7 +1259,7 @@ async def _get_market_status_and_date_time() -> str:
                 "time": time_str,
                 "source": "Tradier",
             },
-            indent=2
+            "get_market_status_and_date_time",
         )
 
     except asyncio.TimeoutError:
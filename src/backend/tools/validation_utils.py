@@ -55,3 +55,43 @@ def validate_and_sanitize_ticker(ticker: str) -> tuple[str, Optional[str]]:
         )
 
     return ticker.strip().upper(), None
+
+
+def normalize_ticker_key(ticker: str) -> str:
+    """Normalize a single or comma-separated ticker argument for use as a cache key.
+
+    Args:
+        ticker: Raw ticker argument (e.g., "spy", " SPY, qqq ")
+
+    Returns:
+        Uppercase tickers joined by commas with whitespace removed
+
+    Examples:
+        >>> normalize_ticker_key(" spy, qqq ")
+        'SPY,QQQ'
+
+        >>> normalize_ticker_key("NVDA")
+        'NVDA'
+    """
+    return ",".join(part.strip() for part in str(ticker).upper().split(","))
+
+
+def split_tickers(ticker: str) -> list[str]:
+    """Split a comma-separated ticker argument into individual ticker symbols.
+
+    Args:
+        ticker: Single "SPY" or multiple "SPY,QQQ,IWM" (see Common Formats)
+
+    Returns:
+        List of normalized ticker symbols with empty entries removed. Returns
+        [""] for an empty argument so the per-ticker validation can report it.
+
+    Examples:
+        >>> split_tickers("wdc, amd,SOUN")
+        ['WDC', 'AMD', 'SOUN']
+
+        >>> split_tickers("SPY")
+        ['SPY']
+    """
+    tickers = [part for part in normalize_ticker_key(ticker or "").split(",") if part]
+    return tickers or [""]
@@ -1,6 +1,6 @@
 """Utils package for the Market Parser application."""
 
 from .datetime_utils import get_current_datetime_context
-from .response_utils import print_error, print_response
+from .response_utils import print_error, print_response, print_response_stream
 
-__all__ = ["print_response", "print_error", "get_current_datetime_context"]
+__all__ = ["print_response", "print_response_stream", "print_error", "get_current_datetime_context"]
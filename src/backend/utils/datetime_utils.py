@@ -1,17 +1,85 @@
 """DateTime utilities for the Market Parser application."""
 
-from datetime import datetime
+from datetime import date, datetime
+from typing import Optional
+
+from .market_calendar import (
+    REGULAR_OPEN,
+    STATE_CLOSED,
+    STATE_OPEN,
+    STATE_POSTMARKET,
+    STATE_PREMARKET,
+    get_market_calendar,
+    market_now,
+)
+
+# Display text per market state (NYSE calendar, US/Eastern)
+_MARKET_STATE_LABELS = {
+    STATE_PREMARKET: "Pre-market",
+    STATE_OPEN: "Open",
+    STATE_POSTMARKET: "After-hours",
+    STATE_CLOSED: "Closed",
+}
+
+# Shown for a session date outside the calendar's year range
+UNKNOWN_SESSION = "unknown"
+
+
+def get_market_status_context(now: Optional[datetime] = None) -> str:
+    """Describe the market status from the local NYSE calendar (no API call).
+
+    Args:
+        now: Timezone-aware datetime (default: current time)
+
+    Returns:
+        Status text, e.g. "Open (closes 1:00 PM ET, early close)",
+        "After-hours (closed 4:00 PM ET)" or "Closed (Good Friday)"
+    """
+    now = now or market_now()
+    calendar = get_market_calendar()
+    today = now.date()
+    status = _MARKET_STATE_LABELS[calendar.market_state(now)]
+
+    holiday = calendar.holiday_name(today)
+    if holiday:
+        return f"{status} ({holiday})"
+    close = calendar.session_close(today)
+    if close is None:
+        return f"{status} (weekend)"
+
+    close_text = close.strftime("%I:%M %p").lstrip("0") + " ET"
+    early = ", early close" if calendar.is_early_close(today) else ""
+    if now.time() < REGULAR_OPEN:
+        return f"{status} (opens 9:30 AM ET, closes {close_text}{early})"
+    if now < close:
+        return f"{status} (closes {close_text}{early})"
+    return f"{status} (closed {close_text}{early})"
+
+
+def _format_session(day: Optional[date]) -> str:
+    """Session date as "Friday, 2025-10-17" (UNKNOWN_SESSION when there is none)."""
+    return f"{day:%A, %Y-%m-%d}" if day is not None else UNKNOWN_SESSION
 
 
 def get_current_datetime_context():
     """Generate current date/time context for AI agent prompts."""
     now = datetime.now()
+    market_time = market_now()
+    calendar = get_market_calendar()
+    today = market_time.date()
+    last_session = calendar.session_on_or_before(today)
+    previous_session = calendar.previous_session(today)
+    next_session = calendar.next_session(today)
     return f"""
 CURRENT DATE AND TIME CONTEXT:
 - Today's date: {now.strftime('%A, %B %d, %Y')}
 - Current time: {now.strftime('%I:%M %p %Z')}
 - ISO format: {now.strftime('%Y-%m-%d %H:%M:%S')}
-- Market status: {'Open' if now.weekday() < 5 and 9 <= now.hour < 16 else 'Closed'}
+- Market time (ET): {market_time.strftime('%Y-%m-%d %I:%M %p')}
+- Market status: {get_market_status_context(market_time)}
+- Latest trading session: {_format_session(last_session)}
+- Previous trading session: {_format_session(previous_session)}
+- Next trading session: {_format_session(next_session)}
 
 IMPORTANT: Always use the current date and time above for all financial analysis.
 Do NOT use training data cutoff dates or outdated information.
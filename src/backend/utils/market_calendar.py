@@ -0,0 +1,272 @@
+"""NYSE trading calendar for the Market Parser application.
+
+Precomputes every regular-hours session between CALENDAR_START_YEAR and
+CALENDAR_END_YEAR from the NYSE holiday rules, so date questions never need
+an API call and every lookup is O(1) (array indexing by date ordinal):
+
+- is_session(), session_on_or_before(), session_on_or_after()
+- previous_session() / next_session() (strictly before / after a date)
+- sessions_between() (inclusive session count)
+- session_close() / market_state() (half days close at 13:00 ET)
+
+Holiday rules:
+- New Year's Day, Juneteenth (from 2022), Independence Day, Christmas:
+  Saturday → observed Friday, Sunday → observed Monday (a Saturday New
+  Year's Day is not observed, since Friday Dec 31 ends the fiscal year)
+- MLK Day (3rd Monday of January, from 1998), Presidents' Day (3rd Monday of
+  February), Memorial Day (last Monday of May), Labor Day (1st Monday of
+  September), Thanksgiving (4th Thursday of November)
+- Good Friday (Friday before Easter Sunday)
+- One-off closures in SPECIAL_CLOSURES (national days of mourning, storms)
+
+Half days (13:00 ET close): July 3 (Monday–Thursday), the day after
+Thanksgiving, and December 24 (Monday–Thursday).
+
+All times are America/New_York; callers pass dates already in market time
+(see market_now()).
+"""
+
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+# Market timezone for session dates and trading hours
+MARKET_TIMEZONE = ZoneInfo("America/New_York")
+
+# Years covered by the precomputed index
+CALENDAR_START_YEAR = 1990
+CALENDAR_END_YEAR = 2100
+
+# Trading hours (ET)
+PREMARKET_OPEN = time(4, 0)
+REGULAR_OPEN = time(9, 30)
+REGULAR_CLOSE = time(16, 0)
+EARLY_CLOSE = time(13, 0)
+POSTMARKET_HOURS = timedelta(hours=4)
+
+# Market states (same names as Tradier /v1/markets/clock)
+STATE_PREMARKET = "premarket"
+STATE_OPEN = "open"
+STATE_POSTMARKET = "postmarket"
+STATE_CLOSED = "closed"
+
+# Unscheduled full-day closures
+SPECIAL_CLOSURES = {
+    date(1994, 4, 27): "Day of Mourning for President Nixon",
+    date(2001, 9, 11): "September 11 attacks",
+    date(2001, 9, 12): "September 11 attacks",
+    date(2001, 9, 13): "September 11 attacks",
+    date(2001, 9, 14): "September 11 attacks",
+    date(2004, 6, 11): "Day of Mourning for President Reagan",
+    date(2007, 1, 2): "Day of Mourning for President Ford",
+    date(2012, 10, 29): "Hurricane Sandy",
+    date(2012, 10, 30): "Hurricane Sandy",
+    date(2018, 12, 5): "Day of Mourning for President George H.W. Bush",
+    date(2025, 1, 9): "Day of Mourning for President Carter",
+}
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """n-th weekday (Monday=0) of a month; n=-1 for the last one."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter_sunday(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous Gregorian algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7  # noqa: E741
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _observed(holiday: date) -> date:
+    """Weekend fixed-date holidays move to the nearest weekday."""
+    if holiday.weekday() == 5:
+        return holiday - timedelta(days=1)
+    if holiday.weekday() == 6:
+        return holiday + timedelta(days=1)
+    return holiday
+
+
+def nyse_holidays(year: int) -> dict[date, str]:
+    """Full-day NYSE holidays of a year (observed dates → name)."""
+    holidays = {}
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays[_observed(new_year)] = "New Year's Day"
+    if year >= 1998:
+        holidays[_nth_weekday(year, 1, 0, 3)] = "Martin Luther King Jr. Day"
+    holidays[_nth_weekday(year, 2, 0, 3)] = "Presidents' Day"
+    holidays[_easter_sunday(year) - timedelta(days=2)] = "Good Friday"
+    holidays[_nth_weekday(year, 5, 0, -1)] = "Memorial Day"
+    if year >= 2022:
+        holidays[_observed(date(year, 6, 19))] = "Juneteenth"
+    holidays[_observed(date(year, 7, 4))] = "Independence Day"
+    holidays[_nth_weekday(year, 9, 0, 1)] = "Labor Day"
+    holidays[_nth_weekday(year, 11, 3, 4)] = "Thanksgiving Day"
+    holidays[_observed(date(year, 12, 25))] = "Christmas Day"
+    holidays.update({day: name for day, name in SPECIAL_CLOSURES.items() if day.year == year})
+    return holidays
+
+
+def nyse_early_closes(year: int) -> set[date]:
+    """Scheduled 13:00 ET closes of a year."""
+    candidates = {
+        date(year, 7, 3),
+        _nth_weekday(year, 11, 3, 4) + timedelta(days=1),
+        date(year, 12, 24),
+    }
+    holidays = nyse_holidays(year)
+    return {
+        day
+        for day in candidates
+        if day.weekday() < 5 and day not in holidays
+        # July 3 / December 24 only when the holiday itself falls Tuesday–Friday
+        and (day.month == 11 or day.weekday() <= 3)
+    }
+
+
+class MarketCalendar:
+    """Precomputed NYSE session index with O(1) date lookups."""
+
+    def __init__(self, start_year: int = CALENDAR_START_YEAR, end_year: int = CALENDAR_END_YEAR):
+        """Build the index for [start_year, end_year].
+
+        Args:
+            start_year: First calendar year covered
+            end_year: Last calendar year covered
+        """
+        self.first_date = date(start_year, 1, 1)
+        self.last_date = date(end_year, 12, 31)
+        self._base = self.first_date.toordinal()
+        days = self.last_date.toordinal() - self._base + 1
+
+        self.holidays: dict[date, str] = {}
+        self.early_closes: set[date] = set()
+        for year in range(start_year, end_year + 1):
+            self.holidays.update(nyse_holidays(year))
+            self.early_closes |= nyse_early_closes(year)
+
+        ordinals = np.arange(self._base, self._base + days)
+        # date.toordinal() 1 (0001-01-01) is a Monday
+        is_session = (ordinals - 1) % 7 < 5
+        for holiday in self.holidays:
+            is_session[holiday.toordinal() - self._base] = False
+        self._is_session = is_session
+
+        # Sessions up to and including each day; count[i] - 1 indexes the
+        # last session on or before day i
+        self._count = np.cumsum(is_session, dtype=np.int64)
+        self._sessions = ordinals[is_session]
+
+    def _index(self, day: date) -> int:
+        index = day.toordinal() - self._base
+        if not 0 <= index < len(self._is_session):
+            raise ValueError(
+                f"{day.isoformat()} is outside the trading calendar "
+                f"({self.first_date.isoformat()} to {self.last_date.isoformat()})"
+            )
+        return index
+
+    def _session(self, position: int) -> Optional[date]:
+        """Session at a position in the session list (None outside the index)."""
+        if not 0 <= position < len(self._sessions):
+            return None
+        return date.fromordinal(int(self._sessions[position]))
+
+    def is_session(self, day: date) -> bool:
+        """True if the market has a regular session on day."""
+        return bool(self._is_session[self._index(day)])
+
+    def holiday_name(self, day: date) -> Optional[str]:
+        """Name of the holiday/closure on day (None for sessions and weekends)."""
+        return self.holidays.get(day)
+
+    def is_early_close(self, day: date) -> bool:
+        """True if day is a half day (13:00 ET close)."""
+        return day in self.early_closes
+
+    def session_on_or_before(self, day: date) -> Optional[date]:
+        """day if it is a session, else the previous session."""
+        return self._session(int(self._count[self._index(day)]) - 1)
+
+    def session_on_or_after(self, day: date) -> Optional[date]:
+        """day if it is a session, else the next session."""
+        index = self._index(day)
+        return self._session(int(self._count[index]) - int(self._is_session[index]))
+
+    def previous_session(self, day: date) -> Optional[date]:
+        """Last session strictly before day."""
+        index = self._index(day)
+        return self._session(int(self._count[index]) - int(self._is_session[index]) - 1)
+
+    def next_session(self, day: date) -> Optional[date]:
+        """First session strictly after day."""
+        return self._session(int(self._count[self._index(day)]))
+
+    def sessions_between(self, start: date, end: date) -> int:
+        """Number of sessions in [start, end] (0 if end is before start)."""
+        if end < start:
+            return 0
+        start_index = self._index(start)
+        return int(self._count[self._index(end)] - self._count[start_index]) + int(
+            self._is_session[start_index]
+        )
+
+    def session_close(self, day: date) -> Optional[datetime]:
+        """Regular-session close (ET) of day, or None if it is not a session."""
+        if not self.is_session(day):
+            return None
+        close = EARLY_CLOSE if day in self.early_closes else REGULAR_CLOSE
+        return datetime.combine(day, close, tzinfo=MARKET_TIMEZONE)
+
+    def market_state(self, now: Optional[datetime] = None) -> str:
+        """Market state at a moment: premarket, open, postmarket or closed.
+
+        Args:
+            now: Timezone-aware datetime (default: current time)
+        """
+        now = (now or datetime.now(MARKET_TIMEZONE)).astimezone(MARKET_TIMEZONE)
+        close = self.session_close(now.date())
+        if close is None:
+            return STATE_CLOSED
+        clock = now.timetz().replace(tzinfo=None)
+        if clock < PREMARKET_OPEN:
+            return STATE_CLOSED
+        if clock < REGULAR_OPEN:
+            return STATE_PREMARKET
+        if now < close:
+            return STATE_OPEN
+        if now < close + POSTMARKET_HOURS:
+            return STATE_POSTMARKET
+        return STATE_CLOSED
+
+
+def market_now() -> datetime:
+    """Current time in the market timezone."""
+    return datetime.now(MARKET_TIMEZONE)
+
+
+# Shared calendar (built on first use)
+_market_calendar: Optional[MarketCalendar] = None
+
+
+def get_market_calendar() -> MarketCalendar:
+    """Get the shared NYSE calendar."""
+    global _market_calendar
+    if _market_calendar is None:
+        _market_calendar = MarketCalendar()
+    return _market_calendar
@@ -0,0 +1,259 @@
+"""In-process metrics primitives for the Market Parser application.
+
+Minimal Prometheus-style counters and histograms (no client library needed),
+plus the recording functions called from the hot path:
+
+- record_request():          One completed agent query (latency, status)
+- record_token_usage():      Tokens and estimated cost (backend.ai.pricing)
+- record_tool_call():        One tool invocation (latency, error response or not)
+- record_upstream_request(): One Tradier/Polygon HTTP request (status or "error")
+
+Recording is skipped when backend.monitoring.enablePerformanceMonitoring is
+off. The registry is rendered in the Prometheus text exposition format by
+services/metrics_service.py, which also adds scrape-time gauges (cache hit
+ratios, sessions, queue depth, process RSS).
+"""
+
+import os
+import sys
+from bisect import bisect_left
+from typing import Optional
+
+from ..config import settings
+
+# Prefix for every exported metric name
+METRIC_PREFIX = "market_parser"
+
+# Histogram buckets (seconds): agent queries take seconds, tool calls milliseconds
+REQUEST_LATENCY_BUCKETS = (0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+TOOL_LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _label_key(labelnames: tuple, labels: dict) -> tuple:
+    """Ordered label values for a sample (missing labels are empty)."""
+    return tuple(str(labels.get(name, "")) for name in labelnames)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(labels: dict) -> str:
+    """Render labels as {name="value",...} ("" when there are none)."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value (integers without a decimal point)."""
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self.values: dict[tuple, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        """Increase the counter for a label set."""
+        key = _label_key(self.labelnames, labels)
+        self.values[key] = self.values.get(key, 0.0) + amount
+
+    def render(self) -> list[str]:
+        """Render HELP/TYPE lines and one sample per label set."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for key, value in sorted(self.values.items()):
+            labels = format_labels(dict(zip(self.labelnames, key)))
+            lines.append(f"{self.name}{labels} {_format_value(value)}")
+        return lines
+
+    def snapshot(self) -> dict:
+        """Label values joined by "," → value (for JSONL snapshots)."""
+        return {",".join(key): value for key, value in self.values.items()}
+
+
+class Histogram:
+    """Cumulative-bucket histogram with optional labels."""
+
+    def __init__(self, name: str, help_text: str, buckets: tuple, labelnames: tuple = ()):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        self.labelnames = labelnames
+        # Label set → [per-bucket counts (+Inf last), sum, count]
+        self.values: dict[tuple, list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        """Record one observation."""
+        key = _label_key(self.labelnames, labels)
+        entry = self.values.get(key)
+        if entry is None:
+            entry = self.values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        entry[0][bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+        entry[2] += 1
+
+    def render(self) -> list[str]:
+        """Render cumulative _bucket samples plus _sum and _count."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for key, (counts, total, count) in sorted(self.values.items()):
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                bucket_labels = format_labels({**labels, "le": _format_value(bound)})
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{format_labels(labels)} {_format_value(round(total, 6))}")
+            lines.append(f"{self.name}_count{format_labels(labels)} {count}")
+        return lines
+
+    def snapshot(self) -> dict:
+        """Label values joined by "," → {"count", "sum"} (for JSONL snapshots)."""
+        return {
+            ",".join(key): {"count": count, "sum": round(total, 6)}
+            for key, (_, total, count) in self.values.items()
+        }
+
+
+class MetricsRegistry:
+    """All counters and histograms recorded by this process."""
+
+    def __init__(self):
+        self.requests = Counter(
+            f"{METRIC_PREFIX}_requests_total", "Agent queries by status.", ("status",)
+        )
+        self.request_latency = Histogram(
+            f"{METRIC_PREFIX}_request_duration_seconds",
+            "Agent query latency (model, tools and session I/O).",
+            REQUEST_LATENCY_BUCKETS,
+        )
+        self.tool_calls = Counter(
+            f"{METRIC_PREFIX}_tool_calls_total",
+            "Tool invocations by tool and outcome.",
+            ("tool", "outcome"),
+        )
+        self.tool_latency = Histogram(
+            f"{METRIC_PREFIX}_tool_duration_seconds",
+            "Tool invocation latency.",
+            TOOL_LATENCY_BUCKETS,
+            ("tool",),
+        )
+        self.upstream_requests = Counter(
+            f"{METRIC_PREFIX}_upstream_requests_total",
+            "Tradier/Polygon HTTP requests by provider and status.",
+            ("provider", "status"),
+        )
+        self.tokens = Counter(
+            f"{METRIC_PREFIX}_tokens_total", "Model tokens by model and type.", ("model", "type")
+        )
+        self.cost = Counter(
+            f"{METRIC_PREFIX}_cost_usd_total",
+            "Estimated model cost from backend.ai.pricing.",
+            ("model",),
+        )
+        self.in_progress = 0
+
+    def metrics(self) -> list:
+        """All registered metrics in exposition order."""
+        return [
+            self.requests,
+            self.request_latency,
+            self.tool_calls,
+            self.tool_latency,
+            self.upstream_requests,
+            self.tokens,
+            self.cost,
+        ]
+
+    def render(self) -> list[str]:
+        """Render every metric in the text exposition format."""
+        lines = []
+        for metric in self.metrics():
+            lines.extend(metric.render())
+        return lines
+
+    def snapshot(self) -> dict:
+        """Compact dict of all recorded values (for JSONL snapshots)."""
+        return {metric.name: metric.snapshot() for metric in self.metrics()}
+
+
+# Process-wide registry
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return _registry
+
+
+def record_request(seconds: Optional[float], status: str = "ok") -> None:
+    """Record one agent query (seconds is None for failed queries)."""
+    if not settings.enable_performance_monitoring:
+        return
+    _registry.requests.inc(status=status)
+    if seconds is not None:
+        _registry.request_latency.observe(seconds)
+
+
+def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+    """Estimate model cost in USD from backend.ai.pricing (0.0 for unknown models)."""
+    pricing = settings.ai_pricing.get(model, {})
+    return (
+        input_tokens * pricing.get("inputPer1M", 0.0) + output_tokens * pricing.get("outputPer1M", 0.0)
+    ) / 1_000_000
+
+
+def record_token_usage(model: str, token_usage: Optional[dict]) -> None:
+    """Record token usage and estimated cost of one agent query.
+
+    Args:
+        model: Model name (key in backend.ai.pricing)
+        token_usage: Dict from extract_token_usage_from_context_wrapper() (None is ignored)
+    """
+    if not settings.enable_performance_monitoring or not token_usage:
+        return
+    input_tokens = token_usage.get("input_tokens") or 0
+    output_tokens = token_usage.get("output_tokens") or 0
+    _registry.tokens.inc(input_tokens, model=model, type="input")
+    _registry.tokens.inc(output_tokens, model=model, type="output")
+    _registry.tokens.inc(token_usage.get("cached_input_tokens") or 0, model=model, type="cached_input")
+    _registry.cost.inc(estimate_cost(model, input_tokens, output_tokens), model=model)
+
+
+def record_tool_call(tool: str, seconds: float, error: bool) -> None:
+    """Record one tool invocation."""
+    if not settings.enable_performance_monitoring:
+        return
+    _registry.tool_calls.inc(tool=tool, outcome="error" if error else "ok")
+    _registry.tool_latency.observe(seconds, tool=tool)
+
+
+def record_upstream_request(provider: str, status) -> None:
+    """Record one upstream HTTP request (status code, or "error" for network failures)."""
+    if not settings.enable_performance_monitoring:
+        return
+    _registry.upstream_requests.inc(provider=provider, status=status)
+
+
+def get_process_rss_bytes() -> int:
+    """Current resident set size of this process (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource  # Unix only
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:
+        return 0
@@ -1,5 +1,7 @@
 """Response formatting utilities for the Market Parser application."""
 
+from typing import AsyncIterator
+
 from rich.console import Console
 
 console = Console()
@@ -26,6 +28,29 @@ def print_response(response_text: str):
     console.print("\n[dim]" + "─" * 50 + "[/dim]\n")
 
 
+async def print_response_stream(chunks: AsyncIterator[str]):
+    """Display a streaming agent response incrementally as chunks arrive.
+
+    Streaming counterpart of print_response(). Chunks come from
+    stream_query_with_footer(), so markdown tables arrive whole and the
+    performance metrics footer arrives last.
+
+    Args:
+        chunks: Async iterator of response text chunks (footer included)
+    """
+    console.print("\n[bold]Agent Response:[/bold]\n")
+
+    # Plain text output (no markup parsing): chunks may split Rich markup tags
+    async for chunk in chunks:
+        console.print(chunk, end="", markup=False, highlight=False, soft_wrap=True)
+        console.file.flush()
+
+    console.print("\n[bold green]✅ Query processed successfully![/bold green]")
+
+    # Separator
+    console.print("\n[dim]" + "─" * 50 + "[/dim]\n")
+
+
 def print_error(error, error_type="Error"):
     """Display errors in a consistent, readable format for the CLI."""
     console.print(f"\n[bold red]!!! {error_type} !!![/bold red]")
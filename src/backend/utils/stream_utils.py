@@ -0,0 +1,74 @@
+"""Streaming text utilities for the Market Parser application."""
+
+
+class MarkdownStreamBuffer:
+    """Re-chunk streamed text deltas so markdown tables are emitted whole.
+
+    Prose is passed through as soon as it arrives. Lines that belong to a
+    markdown table (lines starting with "|") are held back until the table
+    ends, so a renderer never sees a half-written table. This replaces the old
+    sentence-based streaming, which split on "|" and destroyed tables.
+
+    Usage Pattern:
+        ```python
+        buffer = MarkdownStreamBuffer()
+        for delta in deltas:
+            text = buffer.feed(delta)
+            if text:
+                emit(text)
+        emit(buffer.flush())
+        ```
+    """
+
+    def __init__(self):
+        self._pending_line = ""  # Current line (not yet terminated by "\n")
+        self._table_lines = ""   # Completed table lines held until the table ends
+        self._line_emitted = 0   # Characters of the pending line already emitted
+
+    @staticmethod
+    def _is_table_line(line: str) -> bool:
+        """Return True if a (possibly partial) line starts a markdown table row."""
+        return line.lstrip().startswith("|")
+
+    def feed(self, delta: str) -> str:
+        """Add a text delta and return the text that is safe to emit now.
+
+        Args:
+            delta: Text delta from the model stream
+
+        Returns:
+            Text to emit (may be empty while a table is being buffered)
+        """
+        output = []
+        self._pending_line += delta
+
+        # Process every completed line
+        while "\n" in self._pending_line:
+            line, self._pending_line = self._pending_line.split("\n", 1)
+            emitted, self._line_emitted = self._line_emitted, 0
+
+            if self._is_table_line(line):
+                self._table_lines += line + "\n"
+                continue
+
+            output.append(self._table_lines)
+            self._table_lines = ""
+            output.append(line[emitted:] + "\n")
+
+        # Stream the partial line once it is clearly not a table row
+        line = self._pending_line
+        if line.strip() and not self._is_table_line(line):
+            output.append(self._table_lines)
+            self._table_lines = ""
+            output.append(line[self._line_emitted:])
+            self._line_emitted = len(line)
+
+        return "".join(output)
+
+    def flush(self) -> str:
+        """Return all remaining buffered text (call once the stream has ended)."""
+        remaining = self._table_lines + self._pending_line[self._line_emitted:]
+        self._pending_line = ""
+        self._table_lines = ""
+        self._line_emitted = 0
+        return remaining
@@ -77,3 +77,18 @@ def extract_token_usage_from_context_wrapper(result: Any) -> Optional[Dict[str,
         # Graceful fallback if context_wrapper is not available
         pass
     return None
+
+
+def calculate_cached_input_ratio(token_usage: Optional[Dict[str, int]]) -> Optional[float]:
+    """Calculate the fraction of input tokens served from the OpenAI prompt cache.
+
+    Args:
+        token_usage: Dict from extract_token_usage_from_context_wrapper()
+
+    Returns:
+        float or None: cached_input_tokens / input_tokens (0.0-1.0), or None
+                       if input token counts are unavailable
+    """
+    if not token_usage or not token_usage.get("input_tokens"):
+        return None
+    return token_usage.get("cached_input_tokens", 0) / token_usage["input_tokens"]
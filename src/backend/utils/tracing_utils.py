@@ -0,0 +1,339 @@
+"""Hot-path tracing utilities for the Market Parser application.
+
+The Agents SDK already traces every run: agent turns, model calls (response
+spans) and tool invocations (function spans). This module adds custom spans for
+the work inside the tools and exports everything through the SDK trace
+processor interface (add_trace_processor):
+
+Custom spans (phases):
+- "http":    One upstream Tradier/Polygon request (rate limiting + retries included)
+- "parse":   Reading and decoding a JSON response body
+- "format":  Building a tool response (markdown tables, JSON encoding)
+- "compute": Local indicator computation (NumPy engine)
+
+Processors (registered by setup_tracing(), see backend.monitoring config):
+- JsonlTraceProcessor: Appends every finished trace/span to a local JSONL file
+  (one file per UTC day in traceDirectory) from a background writer thread
+- PhaseTimingProcessor: Aggregates per-phase wall time per trace for the
+  optional CLI footer breakdown (showPhaseBreakdown)
+
+Spans are only recorded inside an active trace (a Runner run); calling the
+tool layer directly (benchmarks, scripts) records nothing.
+
+Usage Pattern:
+    ```python
+    with trace_span("http", provider="tradier", path="/v1/markets/quotes") as span_data:
+        status, data = ...
+        span_data["status"] = status
+
+    @traced("format")
+    def create_options_chain_table(...): ...
+    ```
+"""
+
+import functools
+import json
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from agents import add_trace_processor, custom_span, get_current_trace
+from agents.tracing import TracingProcessor
+
+from ..config import settings
+
+# Phase of each span: SDK span types map to "llm"/"tools", custom spans to their name
+PHASE_BY_SPAN_TYPE = {"response": "llm", "generation": "llm", "function": "tools"}
+CUSTOM_PHASES = ("http", "parse", "format", "compute")
+PHASE_ORDER = ("llm", "tools") + CUSTOM_PHASES
+
+# Traces kept by PhaseTimingProcessor before the oldest are dropped (never popped)
+MAX_TRACKED_TRACES = 256
+
+# JsonlTraceProcessor writer: records per write, seconds a batch waits to fill,
+# and queued records kept before new ones are dropped (writer stalled)
+JSONL_BATCH_SIZE = 512
+JSONL_FLUSH_SECONDS = 1.0
+JSONL_QUEUE_SIZE = 10_000
+
+# Queue marker that makes the writer thread write its current batch
+_FLUSH = object()
+
+
+@contextmanager
+def trace_span(name: str, **data: Any) -> Iterator[dict]:
+    """Record a custom span around a block, if a trace is active.
+
+    Args:
+        name: Span name / phase (e.g., "http", "format")
+        **data: Span data (must be JSON-serializable)
+
+    Yields:
+        The span data dict; keys added inside the block are exported with the span
+    """
+    if get_current_trace() is None:
+        yield data
+        return
+    with custom_span(name, data):
+        yield data
+
+
+def traced(name: str, **data: Any):
+    """Decorator recording a custom span around each call of a sync function.
+
+    Args:
+        name: Span name / phase (e.g., "format")
+        **data: Extra span data (the function name is added as "step")
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with trace_span(name, step=func.__name__, **data):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _span_phase(span: Any) -> Optional[str]:
+    """Map a span to its phase (None for spans not shown in the breakdown)."""
+    span_type = span.span_data.type
+    if span_type == "custom":
+        name = span.span_data.name
+        return name if name in CUSTOM_PHASES else None
+    return PHASE_BY_SPAN_TYPE.get(span_type)
+
+
+def _union_seconds(intervals: list[tuple[float, float]]) -> float:
+    """Total wall time covered by (start, end) intervals (overlaps counted once)."""
+    total = 0.0
+    current_start = current_end = None
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        total += current_end - current_start
+    return total
+
+
+class PhaseTimingProcessor(TracingProcessor):
+    """Collect per-phase span intervals per trace for the footer breakdown.
+
+    Parallel tool calls and concurrent HTTP requests overlap, so each phase
+    reports wall time (union of its span intervals), not the sum of spans.
+    """
+
+    def __init__(self):
+        self._intervals: dict[str, dict[str, list[tuple[float, float]]]] = {}
+        self._lock = threading.Lock()
+
+    def on_trace_start(self, trace) -> None:
+        pass
+
+    def on_trace_end(self, trace) -> None:
+        pass
+
+    def on_span_start(self, span) -> None:
+        pass
+
+    def on_span_end(self, span) -> None:
+        phase = _span_phase(span)
+        if phase is None or not span.started_at or not span.ended_at:
+            return
+        start = datetime.fromisoformat(span.started_at).timestamp()
+        end = datetime.fromisoformat(span.ended_at).timestamp()
+        with self._lock:
+            phases = self._intervals.setdefault(span.trace_id, {})
+            phases.setdefault(phase, []).append((start, end))
+            while len(self._intervals) > MAX_TRACKED_TRACES:
+                del self._intervals[next(iter(self._intervals))]
+
+    def pop_breakdown(self, trace_id: str) -> dict[str, float]:
+        """Return and forget the per-phase wall time (seconds) of a trace.
+
+        Returns:
+            Dict of phase → seconds in PHASE_ORDER (phases without spans omitted)
+        """
+        with self._lock:
+            phases = self._intervals.pop(trace_id, {})
+        return {
+            phase: _union_seconds(phases[phase]) for phase in PHASE_ORDER if phase in phases
+        }
+
+    def shutdown(self) -> None:
+        pass
+
+    def force_flush(self) -> None:
+        pass
+
+
+class JsonlTraceProcessor(TracingProcessor):
+    """Append finished traces and spans to a local JSONL file (one file per UTC day).
+
+    Span callbacks run on the event loop thread, so they only export the span
+    and enqueue it; a background writer thread appends queued records in
+    batches (one write and flush per batch, at most every JSONL_FLUSH_SECONDS
+    while records are arriving).
+    """
+
+    def __init__(self, directory: str):
+        """Create the processor (the writer thread starts with the first record).
+
+        Args:
+            directory: Directory for agent_traces_YYYY-MM-DD.jsonl files
+        """
+        self.directory = Path(directory)
+        self._file = None
+        self._file_day: Optional[str] = None
+        self._queue: queue.Queue = queue.Queue(maxsize=JSONL_QUEUE_SIZE)
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self.dropped = 0
+
+    def _enqueue(self, item: Any) -> None:
+        """Queue one exported trace/span for the writer thread."""
+        exported = item.export()
+        if not exported:
+            return
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait(exported)
+        except queue.Full:
+            self.dropped += 1
+
+    def _ensure_writer(self) -> None:
+        """Start the writer thread (once)."""
+        if self._writer is not None:
+            return
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_loop, name="jsonl-trace-writer", daemon=True
+                )
+                self._writer.start()
+
+    def _write_loop(self) -> None:
+        """Writer thread: drain the queue in batches until shutdown."""
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + JSONL_FLUSH_SECONDS
+            # Fill the batch until it is full, the wait is over, or a flush/stop marker arrives
+            while len(batch) < JSONL_BATCH_SIZE and batch[-1] not in (_FLUSH, None):
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            stopping = batch[-1] is None
+            records = [record for record in batch if record is not _FLUSH and record is not None]
+            try:
+                self._write_batch(records)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write_batch(self, records: list[dict]) -> None:
+        """Append records as JSON lines to today's file and flush."""
+        if not records:
+            return
+        lines = "".join(
+            json.dumps(record, default=str, ensure_ascii=False) + "\n" for record in records
+        )
+        day = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        try:
+            if self._file is None or self._file_day != day:
+                if self._file is not None:
+                    self._file.close()
+                self.directory.mkdir(parents=True, exist_ok=True)
+                path = self.directory / f"agent_traces_{day}.jsonl"
+                self._file = open(path, "a", encoding="utf-8")
+                self._file_day = day
+            self._file.write(lines)
+            self._file.flush()
+        except OSError as e:
+            print(f"Warning: Failed to write trace JSONL: {e}")
+
+    def on_trace_start(self, trace) -> None:
+        pass
+
+    def on_trace_end(self, trace) -> None:
+        self._enqueue(trace)
+
+    def on_span_start(self, span) -> None:
+        pass
+
+    def on_span_end(self, span) -> None:
+        self._enqueue(span)
+
+    def shutdown(self) -> None:
+        """Write all queued records, then stop the writer thread and close the file."""
+        writer = self._writer
+        if writer is None:
+            return
+        self._queue.put(None)
+        writer.join()
+        self._writer = None
+
+    def force_flush(self) -> None:
+        """Block until every queued record has been written."""
+        if self._writer is not None:
+            self._queue.put(_FLUSH)
+            self._queue.join()
+
+
+# Processors registered by setup_tracing() (None until set up / when disabled)
+_phase_processor: Optional[PhaseTimingProcessor] = None
+_tracing_configured = False
+
+
+def setup_tracing() -> None:
+    """Register the local trace processors from settings (idempotent).
+
+    The SDK's default OpenAI exporter stays registered; these processors are
+    added next to it.
+    """
+    global _phase_processor, _tracing_configured
+    if _tracing_configured:
+        return
+    _tracing_configured = True
+
+    if not settings.enable_tracing:
+        return
+    if settings.trace_directory:
+        add_trace_processor(JsonlTraceProcessor(settings.trace_directory))
+    if settings.show_phase_breakdown:
+        _phase_processor = PhaseTimingProcessor()
+        add_trace_processor(_phase_processor)
+
+
+def pop_phase_breakdown(trace_id: str) -> dict[str, float]:
+    """Return and forget the per-phase wall time of a finished run.
+
+    Args:
+        trace_id: Trace ID passed to the run (RunConfig.trace_id)
+
+    Returns:
+        Dict of phase → seconds; empty if the breakdown is disabled or the
+        run was not traced
+    """
+    if _phase_processor is None:
+        return {}
+    return _phase_processor.pop_breakdown(trace_id)
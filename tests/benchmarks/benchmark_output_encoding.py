@@ -0,0 +1,133 @@
+"""
+Output encoding benchmark for Market Parser
+
+Runs the CLI regression prompts (test_cli_regression.sh) once per tool output
+encoding ("pretty", "compact", "table") and reports input tokens, cached input
+tokens, tool output size and response time per mode.
+
+Each mode runs all prompts in one session, like the CLI regression suite, so
+the measured input tokens include replayed tool outputs from earlier turns.
+
+Requires live API keys (OpenAI, Tradier, Polygon) in .env.
+
+Usage:
+    uv run python tests/benchmarks/benchmark_output_encoding.py
+    uv run python tests/benchmarks/benchmark_output_encoding.py --modes compact table --limit 10
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from agents import ItemHelpers, Runner, SQLiteSession  # noqa: E402
+
+from backend.config import settings  # noqa: E402
+from backend.services import CompactingSession, create_agent  # noqa: E402
+from backend.services.history_compaction import CHARS_PER_TOKEN  # noqa: E402
+from backend.tools.cache_utils import clear_all_caches  # noqa: E402
+from backend.tools.encoding_utils import OUTPUT_ENCODINGS  # noqa: E402
+from backend.utils.token_utils import extract_token_usage_from_context_wrapper  # noqa: E402
+from regression_prompts import load_regression_prompts  # noqa: E402
+
+def tool_output_chars(result) -> int:
+    """Total characters of tool outputs produced during one run."""
+    return sum(
+        len(str(item.output)) for item in result.new_items if item.type == "tool_call_output_item"
+    )
+
+
+async def run_mode(mode: str, prompts: list[str]) -> dict:
+    """Run all prompts in one session with every tool using the given encoding."""
+    settings.output_encoding = {"default": mode}
+    clear_all_caches()  # Cached responses were encoded with the previous mode
+
+    agent = create_agent()
+    session = CompactingSession(SQLiteSession(f"benchmark_{mode}"))
+    runs = []
+
+    for index, prompt in enumerate(prompts, start=1):
+        start_time = time.perf_counter()
+        try:
+            result = await Runner.run(agent, prompt, session=session)
+        except Exception as e:
+            print(f"  [{mode}] Test {index} failed: {e}")
+            continue
+        elapsed = time.perf_counter() - start_time
+
+        usage = extract_token_usage_from_context_wrapper(result) or {}
+        runs.append(
+            {
+                "prompt": prompt,
+                "seconds": round(elapsed, 3),
+                "input_tokens": usage.get("input_tokens") or 0,
+                "cached_input_tokens": usage.get("cached_input_tokens") or 0,
+                "output_tokens": usage.get("output_tokens") or 0,
+                "tool_output_chars": tool_output_chars(result),
+                "response_chars": len(ItemHelpers.text_message_outputs(result.new_items)),
+            }
+        )
+        print(
+            f"  [{mode}] Test {index}: {elapsed:.2f}s, "
+            f"input {runs[-1]['input_tokens']:,} tokens"
+        )
+
+    seconds = [run["seconds"] for run in runs]
+    return {
+        "mode": mode,
+        "prompts": len(runs),
+        "total_input_tokens": sum(run["input_tokens"] for run in runs),
+        "total_cached_input_tokens": sum(run["cached_input_tokens"] for run in runs),
+        "avg_input_tokens": round(statistics.mean(run["input_tokens"] for run in runs)) if runs else 0,
+        "est_tool_output_tokens": sum(run["tool_output_chars"] for run in runs) // CHARS_PER_TOKEN,
+        "p50_seconds": round(statistics.median(seconds), 3) if seconds else 0.0,
+        "total_seconds": round(sum(seconds), 3),
+        "runs": runs,
+    }
+
+
+def print_summary(results: list[dict]) -> None:
+    """Print a per-mode comparison table."""
+    print("\n| Mode | Prompts | Input Tokens | Avg/Prompt | Cached | Tool Output (est.) | p50 (s) | Total (s) |")
+    print("|------|--------:|-------------:|-----------:|-------:|-------------------:|--------:|----------:|")
+    for r in results:
+        print(
+            f"| {r['mode']} | {r['prompts']} | {r['total_input_tokens']:,} | "
+            f"{r['avg_input_tokens']:,} | {r['total_cached_input_tokens']:,} | "
+            f"{r['est_tool_output_tokens']:,} | {r['p50_seconds']} | {r['total_seconds']} |"
+        )
+
+
+async def main() -> int:
+    """Run the benchmark and save the results to the reports directory."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--modes", nargs="+", choices=OUTPUT_ENCODINGS, default=list(OUTPUT_ENCODINGS))
+    parser.add_argument("--limit", type=int, default=None, help="Only run the first N prompts")
+    args = parser.parse_args()
+
+    prompts = load_regression_prompts()[: args.limit]
+    print(f"🔍 Output encoding benchmark: {len(prompts)} prompts x {len(args.modes)} modes")
+
+    results = []
+    for mode in args.modes:
+        results.append(await run_mode(mode, prompts))
+
+    print_summary(results)
+
+    reports_dir = PROJECT_ROOT / settings.reports_directory
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    report_path = reports_dir / f"benchmark_output_encoding_{datetime.now():%Y-%m-%d_%H-%M}.json"
+    report_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"\n📄 Results saved to {report_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
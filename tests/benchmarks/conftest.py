@@ -0,0 +1,83 @@
+"""
+Shared fixtures for the offline tool-layer benchmarks
+
+Importing this conftest points the tool layer at a local FixtureServer:
+TRADIER_BASE_URL / POLYGON_BASE_URL are set to a free local port before any
+backend module is imported, and dummy API keys are provided if missing.
+
+Environment knobs:
+    BENCH_LATENCY_MS   Injected upstream latency per request (default: 0)
+    BENCH_JITTER_MS    Injected latency jitter, +/- (default: 0)
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from fixture_server import FixtureServer, find_free_port
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+_FIXTURE_PORT = find_free_port()
+_FIXTURE_BASE_URL = f"http://127.0.0.1:{_FIXTURE_PORT}"
+os.environ["TRADIER_BASE_URL"] = _FIXTURE_BASE_URL
+os.environ["POLYGON_BASE_URL"] = _FIXTURE_BASE_URL
+for key in ("OPENAI_API_KEY", "TRADIER_API_KEY", "POLYGON_API_KEY"):
+    os.environ.setdefault(key, "fixture")
+
+# Effectively unlimited local rate limits: measure the tool layer, not the quota
+UNLIMITED_RATE = {"requestsPerSecond": 1_000_000, "burst": 1_000_000}
+
+
+@pytest.fixture(scope="session")
+def bench_loop():
+    """Event loop shared by the fixture server and all benchmarked calls."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def fixture_server(bench_loop, tmp_path_factory):
+    """Running FixtureServer with the tool layer pointed at it."""
+    from backend.config import settings
+    from backend.tools import api_utils, rate_limit_utils
+
+    if api_utils.TRADIER_BASE_URL != _FIXTURE_BASE_URL:
+        pytest.skip("backend was imported before the benchmark conftest set the base URLs")
+
+    settings.rate_limits = {"tradier": UNLIMITED_RATE, "polygon": UNLIMITED_RATE}
+    rate_limit_utils._rate_limiters.clear()
+    # Local bar store in a temporary directory (never the real data/ store)
+    store_directory = tmp_path_factory.mktemp("price_history")
+    settings.price_history_store = dict(
+        settings.price_history_store,
+        path=str(store_directory / "price_history.db"),
+        columnarDirectory=str(store_directory / "ohlcv"),
+    )
+    # On-demand quote path only (no background snapshot poll task)
+    settings.quote_snapshots = dict(settings.quote_snapshots, enabled=False)
+
+    server = FixtureServer(
+        port=_FIXTURE_PORT,
+        latency_ms=float(os.getenv("BENCH_LATENCY_MS", "0")),
+        jitter_ms=float(os.getenv("BENCH_JITTER_MS", "0")),
+    )
+    bench_loop.run_until_complete(server.start())
+    yield server
+    bench_loop.run_until_complete(api_utils.get_connection_pool().close())
+    bench_loop.run_until_complete(server.stop())
+
+
+@pytest.fixture
+def run_async(bench_loop, fixture_server):
+    """Run a zero-argument coroutine function on the shared loop."""
+
+    def run(fn):
+        return bench_loop.run_until_complete(fn())
+
+    return run
@@ -0,0 +1,324 @@
+"""
+Scripted stand-in for the OpenAI model used by the agent-loop load tests
+
+ScriptedModel implements the Agents SDK Model interface (get_response and
+stream_response) without any network access. Each user prompt maps to a
+script: a list of steps, where every step is a list of tool calls the model
+"requests" in one response. After the last step the model answers with a short
+markdown message (including a table, so MarkdownStreamBuffer is exercised)
+that reports how many tool outputs were error responses.
+
+The Runner executes the scripted tool calls for real, so with the FixtureServer
+(fixture_server.py) a full Runner.run covers the whole agent loop: instructions,
+session reads/writes, tool execution, tool-layer caches and the HTTP client.
+
+script_for_prompt() maps the CLI regression prompts (test_cli_regression.sh)
+to the tool calls the live model makes for them. Dates and prices match the
+recorded fixtures (last bar 2025-10-17, SPY 676.01, expiration 2025-10-24).
+
+Usage:
+    agent = create_agent().clone(model=ScriptedModel(latency_ms=50))
+    result = await Runner.run(agent, "Current Price OHLC: $SPY", session=session)
+"""
+
+import asyncio
+import json
+import re
+import time
+import uuid
+from collections.abc import AsyncIterator
+from typing import Any, Optional
+
+from agents import Model, ModelResponse, Usage
+from openai.types.responses import (
+    Response,
+    ResponseCompletedEvent,
+    ResponseFunctionToolCall,
+    ResponseOutputMessage,
+    ResponseOutputText,
+    ResponseTextDeltaEvent,
+    ResponseUsage,
+)
+from openai.types.responses.response_usage import InputTokensDetails, OutputTokensDetails
+
+from backend.tools.error_utils import is_error_response
+
+# Rough characters-per-token ratio for simulated usage (matches history_compaction)
+CHARS_PER_TOKEN = 4
+
+# Characters per simulated text delta in stream_response()
+STREAM_CHUNK_CHARS = 24
+
+# Fixture-aligned arguments (see tests/benchmarks/fixtures)
+FIXTURE_LAST_DATE = "2025-10-17"
+FIXTURE_EXPIRATION = "2025-10-24"
+FIXTURE_PRICE = "676.01"
+
+# Price history prompts → (start_date, end_date), checked in order
+HISTORY_RANGES = [
+    ("Yesterday", ("2025-10-16", "2025-10-16")),
+    ("previous week's Friday", ("2025-10-10", "2025-10-10")),
+    ("Last week", ("2025-10-06", "2025-10-10")),
+    ("last 5 Trading Days", ("2025-10-13", FIXTURE_LAST_DATE)),
+    ("past 2 Weeks", ("2025-10-03", FIXTURE_LAST_DATE)),
+    ("past month", ("2025-09-17", FIXTURE_LAST_DATE)),
+    ("past 3 months", ("2025-07-17", FIXTURE_LAST_DATE)),
+]
+
+# One scripted tool call: (tool name, arguments)
+ToolCall = tuple[str, dict]
+
+
+def _tickers(prompt: str) -> str:
+    """Comma-separated tickers mentioned as $TICKER in a prompt."""
+    return ",".join(re.findall(r"\$([A-Z]+)", prompt)) or "SPY"
+
+
+def script_for_prompt(prompt: str) -> list[list[ToolCall]]:
+    """Map a regression prompt to the tool-call steps the live agent makes.
+
+    Args:
+        prompt: User prompt (e.g., "Current Price OHLC: $SPY")
+
+    Returns:
+        List of steps; each step is a list of (tool name, arguments) issued in
+        one model response. An empty list means the model answers directly.
+    """
+    tickers = _tickers(prompt)
+    lowered = prompt.lower()
+
+    if "no tool calls" in lowered:
+        return []
+    if prompt.strip() == "Market Status":
+        return [[("get_market_status_and_date_time", {})]]
+    if "options chains" in lowered:
+        prices = ",".join(FIXTURE_PRICE for _ in tickers.split(","))
+        return [
+            [("get_stock_quote", {"ticker": tickers})],
+            [
+                (
+                    "get_options_chain_both",
+                    {
+                        "ticker": tickers,
+                        "current_price": prices,
+                        "expiration_date": FIXTURE_EXPIRATION,
+                    },
+                )
+            ],
+        ]
+    if "expiration dates" in lowered:
+        return [[("get_options_expiration_dates", {"ticker": tickers})]]
+    if "support & resistance" in lowered:
+        return [
+            [
+                ("get_stock_quote", {"ticker": tickers}),
+                ("get_ta_indicators", {"ticker": tickers, "timespan": "day"}),
+            ]
+        ]
+    if "technical analysis indicator" in lowered:
+        return [[("get_ta_indicators", {"ticker": tickers, "timespan": "day"})]]
+    for phrase, (start_date, end_date) in HISTORY_RANGES:
+        if phrase.lower() in lowered:
+            arguments = {
+                "ticker": tickers,
+                "start_date": start_date,
+                "end_date": end_date,
+                "interval": "daily",
+            }
+            return [[("get_stock_price_history", arguments)]]
+    if "price" in lowered:
+        return [[("get_stock_quote", {"ticker": tickers})]]
+    return []
+
+
+def _item_field(item: Any, name: str) -> Any:
+    """Read a field from a dict input item or a pydantic output item."""
+    return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
+
+
+def _current_turn(input: Any) -> tuple[str, list]:
+    """Split model input into the latest user prompt and the items after it."""
+    if isinstance(input, str):
+        return input, []
+    for index in range(len(input) - 1, -1, -1):
+        item = input[index]
+        if _item_field(item, "role") == "user":
+            content = _item_field(item, "content")
+            if isinstance(content, list):
+                content = " ".join(str(part.get("text", "")) for part in content)
+            return str(content), list(input[index + 1 :])
+    return "", list(input)
+
+
+class ScriptedModel(Model):
+    """Model that replays scripted tool-call sequences instead of calling OpenAI."""
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        scripts: Optional[dict[str, list[list[ToolCall]]]] = None,
+    ):
+        """Create a scripted model.
+
+        Args:
+            latency_ms: Simulated model latency per response
+            scripts: Optional prompt → steps overrides (default: script_for_prompt)
+        """
+        self.latency_ms = latency_ms
+        self.scripts = scripts or {}
+        self.responses = 0
+        self.model_time = 0.0
+
+    def _next_output(self, input: Any) -> list:
+        """Build the output items for the next step of the current turn."""
+        prompt, turn_items = _current_turn(input)
+        script = self.scripts.get(prompt)
+        if script is None:
+            script = script_for_prompt(prompt)
+
+        # Completed steps = tool calls already issued in this turn, step by step
+        issued = sum(1 for item in turn_items if _item_field(item, "type") == "function_call")
+        step_index = 0
+        while step_index < len(script) and issued >= len(script[step_index]):
+            issued -= len(script[step_index])
+            step_index += 1
+
+        if step_index < len(script):
+            return [
+                ResponseFunctionToolCall(
+                    type="function_call",
+                    id=f"fc_{uuid.uuid4().hex}",
+                    call_id=f"call_{uuid.uuid4().hex}",
+                    name=name,
+                    arguments=json.dumps(arguments),
+                    status="completed",
+                )
+                for name, arguments in script[step_index]
+            ]
+
+        tool_outputs = [
+            str(_item_field(item, "output"))
+            for item in turn_items
+            if _item_field(item, "type") == "function_call_output"
+        ]
+        text = (
+            f"Scripted answer for: {prompt}\n\n"
+            "| Metric | Value |\n"
+            "|---|---|\n"
+            f"| Tool outputs | {len(tool_outputs)} |\n"
+            f"| Tool output chars | {sum(len(output) for output in tool_outputs)} |\n"
+            f"| Tool errors | {sum(is_error_response(output) for output in tool_outputs)} |\n"
+        )
+        return [
+            ResponseOutputMessage(
+                type="message",
+                id=f"msg_{uuid.uuid4().hex}",
+                role="assistant",
+                status="completed",
+                content=[ResponseOutputText(type="output_text", text=text, annotations=[])],
+            )
+        ]
+
+    @staticmethod
+    def _usage(system_instructions: Optional[str], input: Any, output: list) -> ResponseUsage:
+        """Estimate usage from serialized input/output size (deterministic)."""
+        input_chars = len(system_instructions or "") + len(json.dumps(input, default=str))
+        output_chars = sum(len(item.model_dump_json()) for item in output)
+        input_tokens = input_chars // CHARS_PER_TOKEN
+        output_tokens = output_chars // CHARS_PER_TOKEN
+        return ResponseUsage(
+            input_tokens=input_tokens,
+            input_tokens_details=InputTokensDetails(
+                cached_tokens=len(system_instructions or "") // CHARS_PER_TOKEN
+            ),
+            output_tokens=output_tokens,
+            output_tokens_details=OutputTokensDetails(reasoning_tokens=0),
+            total_tokens=input_tokens + output_tokens,
+        )
+
+    async def _respond(self, system_instructions: Optional[str], input: Any):
+        """Simulate model latency and return (output items, usage)."""
+        start = time.perf_counter()
+        if self.latency_ms > 0:
+            await asyncio.sleep(self.latency_ms / 1000)
+        output = self._next_output(input)
+        self.responses += 1
+        self.model_time += time.perf_counter() - start
+        return output, self._usage(system_instructions, input, output)
+
+    async def get_response(
+        self,
+        system_instructions,
+        input,
+        model_settings,
+        tools,
+        output_schema,
+        handoffs,
+        tracing,
+        *,
+        previous_response_id=None,
+        prompt=None,
+    ) -> ModelResponse:
+        """Return the next scripted response."""
+        output, usage = await self._respond(system_instructions, input)
+        return ModelResponse(
+            output=output,
+            usage=Usage(
+                requests=1,
+                input_tokens=usage.input_tokens,
+                input_tokens_details=usage.input_tokens_details,
+                output_tokens=usage.output_tokens,
+                output_tokens_details=usage.output_tokens_details,
+                total_tokens=usage.total_tokens,
+            ),
+            response_id=f"resp_{uuid.uuid4().hex}",
+        )
+
+    async def stream_response(
+        self,
+        system_instructions,
+        input,
+        model_settings,
+        tools,
+        output_schema,
+        handoffs,
+        tracing,
+        *,
+        previous_response_id=None,
+        prompt=None,
+    ) -> AsyncIterator:
+        """Stream the next scripted response as text deltas and a completed event."""
+        output, usage = await self._respond(system_instructions, input)
+        sequence = 0
+
+        for output_index, item in enumerate(output):
+            if item.type != "message":
+                continue
+            text = item.content[0].text
+            for offset in range(0, len(text), STREAM_CHUNK_CHARS):
+                yield ResponseTextDeltaEvent(
+                    type="response.output_text.delta",
+                    item_id=item.id,
+                    output_index=output_index,
+                    content_index=0,
+                    delta=text[offset : offset + STREAM_CHUNK_CHARS],
+                    logprobs=[],
+                    sequence_number=sequence,
+                )
+                sequence += 1
+
+        yield ResponseCompletedEvent(
+            type="response.completed",
+            sequence_number=sequence,
+            response=Response(
+                id=f"resp_{uuid.uuid4().hex}",
+                created_at=time.time(),
+                model="scripted",
+                object="response",
+                output=output,
+                parallel_tool_calls=True,
+                tool_choice="auto",
+                tools=[],
+                usage=usage,
+            ),
+        )
@@ -0,0 +1,176 @@
+"""
+Local stand-in server for the Tradier and Polygon.io APIs
+
+Replays the recorded JSON fixtures in tests/benchmarks/fixtures so the tool
+layer can be benchmarked with no network. Latency and failures can be
+injected per server instance:
+
+    server = FixtureServer(latency_ms=20, jitter_ms=5, failure_rate=0.1, failure_status=500)
+    await server.start()
+    ...
+    await server.stop()
+
+Point the tools at the server by setting TRADIER_BASE_URL and POLYGON_BASE_URL
+to server.base_url BEFORE importing backend modules (see conftest.py).
+"""
+
+import asyncio
+import json
+import random
+import socket
+from pathlib import Path
+
+from aiohttp import web
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def find_free_port() -> int:
+    """Return a free TCP port on 127.0.0.1."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def load_fixture(name: str) -> dict:
+    """Load a recorded JSON fixture by file name."""
+    return json.loads((FIXTURES_DIR / name).read_text(encoding="utf-8"))
+
+
+class FixtureServer:
+    """aiohttp server replaying recorded Tradier/Polygon responses."""
+
+    def __init__(
+        self,
+        port: int = 0,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        failure_rate: float = 0.0,
+        failure_status: int = 500,
+        seed: int = 0,
+    ):
+        """Create a fixture server (call start() to listen).
+
+        Args:
+            port: Port to listen on (0 picks a free port)
+            latency_ms: Added latency per request
+            jitter_ms: Uniform random jitter added to latency (+/-)
+            failure_rate: Fraction of requests answered with failure_status
+            failure_status: HTTP status for injected failures (e.g., 500, 429)
+            seed: Random seed for jitter and failure injection
+        """
+        self.port = port or find_free_port()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.failures = 0
+        self._runner = None
+
+        # Responses are pre-serialized once; quotes and history are rendered per request
+        self._quote = load_fixture("tradier_quotes.json")
+        self._history_bars = load_fixture("tradier_history.json")["history"]["day"]
+        self._bodies = {
+            name: json.dumps(load_fixture(f"{name}.json"))
+            for name in (
+                "tradier_expirations",
+                "tradier_chains",
+                "tradier_clock",
+                "polygon_aggs",
+                "polygon_indicator",
+                "polygon_indicator_macd",
+            )
+        }
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to use for TRADIER_BASE_URL / POLYGON_BASE_URL."""
+        return f"http://127.0.0.1:{self.port}"
+
+    def configure(self, latency_ms=None, jitter_ms=None, failure_rate=None, failure_status=None):
+        """Change latency/failure injection while the server is running."""
+        if latency_ms is not None:
+            self.latency_ms = latency_ms
+        if jitter_ms is not None:
+            self.jitter_ms = jitter_ms
+        if failure_rate is not None:
+            self.failure_rate = failure_rate
+        if failure_status is not None:
+            self.failure_status = failure_status
+
+    @web.middleware
+    async def _inject(self, request, handler):
+        """Apply latency and failure injection to every request."""
+        self.requests += 1
+        delay = self.latency_ms + self.random.uniform(-self.jitter_ms, self.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+        if self.failure_rate and self.random.random() < self.failure_rate:
+            self.failures += 1
+            headers = {"Retry-After": "0"} if self.failure_status == 429 else None
+            return web.json_response(
+                {"error": "injected failure"}, status=self.failure_status, headers=headers
+            )
+        return await handler(request)
+
+    def _body(self, name: str) -> web.Response:
+        return web.Response(text=self._bodies[name], content_type="application/json")
+
+    async def _quotes(self, request):
+        symbols = request.query.get("symbols", "SPY").split(",")
+        quotes = [dict(self._quote["quotes"]["quote"], symbol=symbol) for symbol in symbols]
+        return web.json_response({"quotes": {"quote": quotes if len(quotes) > 1 else quotes[0]}})
+
+    async def _expirations(self, request):
+        return self._body("tradier_expirations")
+
+    async def _history(self, request):
+        # Like Tradier, only return bars inside start/end (history is null when empty)
+        start = request.query.get("start", "")
+        end = request.query.get("end", "9999-12-31")
+        bars = [bar for bar in self._history_bars if start <= bar["date"] <= end]
+        return web.json_response({"history": {"day": bars} if bars else None})
+
+    async def _chains(self, request):
+        return self._body("tradier_chains")
+
+    async def _clock(self, request):
+        return self._body("tradier_clock")
+
+    async def _aggs(self, request):
+        return self._body("polygon_aggs")
+
+    async def _indicator(self, request):
+        if request.match_info["indicator"] == "macd":
+            return self._body("polygon_indicator_macd")
+        return self._body("polygon_indicator")
+
+    async def _root(self, request):
+        return web.Response(text="")
+
+    async def start(self) -> None:
+        """Start listening on 127.0.0.1:port."""
+        app = web.Application(middlewares=[self._inject])
+        app.router.add_get("/v1/markets/quotes", self._quotes)
+        app.router.add_get("/v1/markets/options/expirations", self._expirations)
+        app.router.add_get("/v1/markets/history", self._history)
+        app.router.add_get("/v1/markets/options/chains", self._chains)
+        app.router.add_get("/v1/markets/clock", self._clock)
+        app.router.add_get(
+            "/v2/aggs/ticker/{ticker}/range/{multiplier}/{timespan}/{start}/{end}", self._aggs
+        )
+        app.router.add_get("/v1/indicators/{indicator}/{ticker}", self._indicator)
+        app.router.add_route("HEAD", "/", self._root)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, "127.0.0.1", self.port).start()
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
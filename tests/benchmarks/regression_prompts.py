@@ -0,0 +1,22 @@
+"""
+CLI regression prompts shared by the benchmarks
+
+load_regression_prompts() reads the prompts array from test_cli_regression.sh,
+so the load test (test_agent_load.py) and the output encoding benchmark
+(benchmark_output_encoding.py) always replay the same prompts as the CLI
+regression suite.
+"""
+
+import re
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+REGRESSION_SCRIPT = PROJECT_ROOT / "test_cli_regression.sh"
+
+
+def load_regression_prompts() -> list[str]:
+    """Extract the prompts array from test_cli_regression.sh."""
+    script = REGRESSION_SCRIPT.read_text(encoding="utf-8")
+    block = script.split("declare -a prompts=(", 1)[1].split("\n)", 1)[0]
+    prompts = re.findall(r'^\s*"(.*)"\s*$', block, flags=re.MULTILINE)
+    return [prompt.replace("\\$", "$") for prompt in prompts]
@@ -0,0 +1,173 @@
+"""
+Offline end-to-end load test for the agent loop
+
+Drives Runner.run (via process_query_with_footer / stream_query_with_footer)
+for many concurrent simulated users, with ScriptedModel (fake_model.py) in
+place of OpenAI and the FixtureServer in place of Tradier/Polygon. Everything
+except the model runs for real: per-user SessionManager sessions (sharded
+SQLite + history compaction), tool execution, caches and the HTTP client.
+
+Each user sends the CLI regression prompts (test_cli_regression.sh) in order,
+in its own session. Requests pass through a queue that admits at most
+BENCH_QUEUE_LIMIT runs at once, like the Gradio event queue. gradio_app.main()
+does not call demo.queue(), so a local run uses Gradio's default
+default_concurrency_limit of 1; the deployment entry point (app.py) sets
+default_concurrency_limit=10. Set BENCH_QUEUE_LIMIT=10 to model it.
+
+Reported in each benchmark's extra_info (see --benchmark-json):
+- e2e_*:           Latency percentiles per query (queue wait excluded)
+- queue_wait_*:    Time spent waiting for a queue slot
+- session_write_*: Session add_items() cost (SQLite write per run step)
+- session_read_*:  Session get_items() cost (SQLite read + compaction)
+- ttfb_*:          Time to first streamed chunk (streaming test only)
+- throughput_per_s, model_share (fraction of e2e time spent in the fake model)
+
+Usage:
+    uv run pytest tests/benchmarks/test_agent_load.py -q
+    BENCH_USERS=64 BENCH_QUEUE_LIMIT=10 BENCH_MODEL_LATENCY_MS=200 uv run pytest tests/benchmarks/test_agent_load.py
+
+Environment knobs:
+    BENCH_USERS              Concurrent simulated users (default: 16)
+    BENCH_PROMPTS_PER_USER   Regression prompts sent by each user (default: 8)
+    BENCH_QUEUE_LIMIT        Concurrent runs admitted by the queue (default: 1)
+    BENCH_MODEL_LATENCY_MS   Simulated model latency per response (default: 0)
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from agents import set_tracing_disabled  # noqa: E402
+
+from backend.cli import process_query_with_footer, stream_query_with_footer  # noqa: E402
+from backend.services import SessionManager, create_agent  # noqa: E402
+from backend.tools.cache_utils import clear_all_caches  # noqa: E402
+from fake_model import ScriptedModel  # noqa: E402
+from regression_prompts import load_regression_prompts  # noqa: E402
+from test_tool_benchmarks import latency_percentiles  # noqa: E402
+
+USERS = int(os.getenv("BENCH_USERS", "16"))
+PROMPTS_PER_USER = int(os.getenv("BENCH_PROMPTS_PER_USER", "8"))
+QUEUE_LIMIT = int(os.getenv("BENCH_QUEUE_LIMIT", "1"))
+MODEL_LATENCY_MS = float(os.getenv("BENCH_MODEL_LATENCY_MS", "0"))
+
+# Scripted traces are never exported (no OpenAI key in the benchmark environment)
+set_tracing_disabled(True)
+
+
+class TimedSession:
+    """Session wrapper recording get_items()/add_items() durations."""
+
+    def __init__(self, session, reads: list, writes: list):
+        self.session = session
+        self.session_id = session.session_id
+        self.reads = reads
+        self.writes = writes
+
+    async def get_items(self, limit=None):
+        start = time.perf_counter()
+        items = await self.session.get_items(limit)
+        self.reads.append(time.perf_counter() - start)
+        return items
+
+    async def add_items(self, items):
+        start = time.perf_counter()
+        await self.session.add_items(items)
+        self.writes.append(time.perf_counter() - start)
+
+    async def pop_item(self):
+        return await self.session.pop_item()
+
+    async def clear_session(self):
+        await self.session.clear_session()
+
+
+def _prefixed(metrics: dict, prefix: str) -> dict:
+    """Prefix latency_percentiles() keys (e.g., p50_ms → e2e_p50_ms)."""
+    return {f"{prefix}_{key}": value for key, value in metrics.items()}
+
+
+def run_load(benchmark, run_async, tmp_path, streamed: bool) -> None:
+    """Run USERS concurrent users through the agent loop and record metrics."""
+    prompts = load_regression_prompts()[:PROMPTS_PER_USER]
+    model = ScriptedModel(latency_ms=MODEL_LATENCY_MS)
+    agent = create_agent().clone(model=model)
+    e2e, waits, reads, writes, ttfb, totals = [], [], [], [], [], []
+    responses = []
+
+    async def query(session, prompt: str) -> str:
+        start = time.perf_counter()
+        if not streamed:
+            return await process_query_with_footer(agent, session, prompt)
+        chunks = []
+        async for chunk in stream_query_with_footer(agent, session, prompt):
+            if not chunks:
+                ttfb.append(time.perf_counter() - start)
+            chunks.append(chunk)
+        return "".join(chunks)
+
+    async def user(manager: SessionManager, queue: asyncio.Semaphore, index: int):
+        session = TimedSession(manager.get_session(f"user{index}"), reads, writes)
+        for prompt in prompts:
+            queued_at = time.perf_counter()
+            async with queue:
+                started_at = time.perf_counter()
+                waits.append(started_at - queued_at)
+                responses.append(await query(session, prompt))
+                e2e.append(time.perf_counter() - started_at)
+
+    async def run_users():
+        clear_all_caches()
+        manager = SessionManager(
+            session_prefix="load",
+            timeout_minutes=60,
+            cleanup_interval_minutes=60,
+            persistent=True,
+            store_directory=str(tmp_path / f"round{len(totals)}"),
+            shard_count=4,
+        )
+        queue = asyncio.Semaphore(QUEUE_LIMIT)
+        start = time.perf_counter()
+        await asyncio.gather(*(user(manager, queue, index) for index in range(USERS)))
+        totals.append(time.perf_counter() - start)
+        await manager.close()
+
+    benchmark.pedantic(run_async, args=(run_users,), rounds=2, iterations=1)
+
+    queries = USERS * len(prompts)
+    assert len(responses) == queries * len(totals)
+    for response in responses:
+        assert "Scripted answer for:" in response, response[:300]
+        assert "| Tool errors | 0 |" in response, response[:300]
+        assert "Performance Metrics:" in response
+
+    benchmark.extra_info.update(_prefixed(latency_percentiles(e2e), "e2e"))
+    benchmark.extra_info.update(_prefixed(latency_percentiles(waits), "queue_wait"))
+    benchmark.extra_info.update(_prefixed(latency_percentiles(writes), "session_write"))
+    benchmark.extra_info.update(_prefixed(latency_percentiles(reads), "session_read"))
+    if streamed:
+        benchmark.extra_info.update(_prefixed(latency_percentiles(ttfb), "ttfb"))
+    benchmark.extra_info.update(
+        {
+            "users": USERS,
+            "queue_limit": QUEUE_LIMIT,
+            "queries_per_round": queries,
+            "throughput_per_s": round(queries / min(totals), 1),
+            "model_responses": model.responses,
+            "model_share": round(model.model_time / sum(e2e), 3),
+        }
+    )
+
+
+def test_agent_loop_load(benchmark, run_async, tmp_path):
+    """Concurrent users through Runner.run with per-user sessions."""
+    run_load(benchmark, run_async, tmp_path, streamed=False)
+
+
+def test_agent_loop_load_streamed(benchmark, run_async, tmp_path):
+    """Concurrent users through Runner.run_streamed (TTFB included)."""
+    run_load(benchmark, run_async, tmp_path, streamed=True)
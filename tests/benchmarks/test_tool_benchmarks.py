@@ -0,0 +1,182 @@
+"""
+Offline tool-layer benchmarks for Market Parser
+
+Runs every _get_* function in tradier_tools.py and polygon_tools.py against
+the local FixtureServer (recorded JSON fixtures, no network) and reports:
+- Latency percentiles (p50/p95/p99) for sequential calls
+- Throughput and latency percentiles under N concurrent callers
+- Memory allocations per call (tracemalloc peak bytes and allocation count)
+
+Results are attached to each benchmark's extra_info (see --benchmark-json).
+
+Usage:
+    uv run pytest tests/benchmarks -q
+    BENCH_CONCURRENCY=64 BENCH_LATENCY_MS=20 uv run pytest tests/benchmarks --benchmark-json=bench.json
+
+Environment knobs:
+    BENCH_ROUNDS            Sequential rounds per tool (default: 30)
+    BENCH_CONCURRENCY       Concurrent callers in throughput tests (default: 16)
+    BENCH_CALLS_PER_CALLER  Calls per concurrent caller (default: 5)
+"""
+
+import asyncio
+import os
+import statistics
+import time
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from backend.config import settings  # noqa: E402
+from backend.tools import polygon_tools, tradier_tools  # noqa: E402
+from backend.tools.error_utils import is_error_response  # noqa: E402
+
+ROUNDS = int(os.getenv("BENCH_ROUNDS", "30"))
+CONCURRENCY = int(os.getenv("BENCH_CONCURRENCY", "16"))
+CALLS_PER_CALLER = int(os.getenv("BENCH_CALLS_PER_CALLER", "5"))
+
+# Distinct tickers per concurrent caller, so HTTP coalescing does not merge them
+TICKERS = [
+    "SPY", "QQQ", "IWM", "NVDA", "AMD", "WDC", "SOUN", "AAPL",
+    "MSFT", "TSLA", "META", "AMZN", "GOOG", "NFLX", "INTC", "MU",
+]
+
+
+async def _ta_indicators(ticker: str, mode: str) -> str:
+    """Run _get_ta_indicators with the given indicator mode."""
+    previous, settings.ta_indicator_mode = settings.ta_indicator_mode, mode
+    try:
+        return await polygon_tools._get_ta_indicators(ticker, "day")
+    finally:
+        settings.ta_indicator_mode = previous
+
+
+# Tool name -> async callable taking a ticker (every tool; TA once per indicator mode)
+TOOL_CALLS = {
+    "stock_quote": lambda ticker: tradier_tools._get_stock_quote(ticker),
+    "options_expiration_dates": lambda ticker: tradier_tools._get_options_expiration_dates(ticker),
+    "stock_price_history": lambda ticker: tradier_tools._get_stock_price_history(
+        ticker, "2025-07-01", "2025-10-17", "daily"
+    ),
+    "options_chain_both": lambda ticker: tradier_tools._get_options_chain_both(
+        ticker, 676.01, "2025-10-24"
+    ),
+    "options_surface": lambda ticker: tradier_tools._get_options_surface(ticker, 676.01),
+    "market_status_and_date_time": lambda ticker: tradier_tools._get_market_status_and_date_time(),
+    "ta_indicators_local": lambda ticker: _ta_indicators(ticker, polygon_tools.TA_MODE_LOCAL),
+    "ta_indicators_remote": lambda ticker: _ta_indicators(ticker, polygon_tools.TA_MODE_REMOTE),
+}
+
+
+def latency_percentiles(samples: list[float]) -> dict:
+    """Summarize latency samples (seconds) as p50/p95/p99 in milliseconds."""
+    if len(samples) < 2:
+        value = round(samples[0] * 1000, 3) if samples else 0.0
+        return {"p50_ms": value, "p95_ms": value, "p99_ms": value}
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p95_ms": round(cuts[94] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+    }
+
+
+def assert_success(result) -> None:
+    """Fail if a tool returned an error response (fixtures out of sync with parsers)."""
+    if isinstance(result, str):
+        assert not is_error_response(result), result[:300]
+    else:
+        assert result, "empty result"
+
+
+@pytest.mark.parametrize("tool", list(TOOL_CALLS))
+def test_tool_latency(benchmark, run_async, tool):
+    """Sequential latency and allocations for one tool."""
+    call = TOOL_CALLS[tool]
+    samples = []
+
+    async def timed_call():
+        start = time.perf_counter()
+        result = await call("SPY")
+        samples.append(time.perf_counter() - start)
+        return result
+
+    result = benchmark.pedantic(
+        run_async, args=(timed_call,), rounds=ROUNDS, iterations=1, warmup_rounds=1
+    )
+    assert_success(result)
+
+    # Allocations for one call (separate run: tracemalloc slows execution)
+    tracemalloc.start()
+    try:
+        run_async(lambda: call("SPY"))
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        allocations = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    finally:
+        tracemalloc.stop()
+
+    benchmark.extra_info.update(latency_percentiles(samples[1:] or samples))
+    benchmark.extra_info.update({"peak_bytes": peak_bytes, "live_allocations": allocations})
+
+
+@pytest.mark.parametrize("tool", list(TOOL_CALLS))
+def test_tool_throughput(benchmark, run_async, tool):
+    """Throughput and latency percentiles under CONCURRENCY concurrent callers."""
+    call = TOOL_CALLS[tool]
+    samples = []
+    totals = []
+
+    async def caller(ticker: str):
+        for _ in range(CALLS_PER_CALLER):
+            start = time.perf_counter()
+            assert_success(await call(ticker))
+            samples.append(time.perf_counter() - start)
+
+    async def run_callers():
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(caller(TICKERS[index % len(TICKERS)]) for index in range(CONCURRENCY))
+        )
+        totals.append(time.perf_counter() - start)
+
+    benchmark.pedantic(run_async, args=(run_callers,), rounds=3, iterations=1)
+
+    calls = CONCURRENCY * CALLS_PER_CALLER
+    benchmark.extra_info.update(latency_percentiles(samples))
+    benchmark.extra_info.update(
+        {
+            "concurrency": CONCURRENCY,
+            "calls_per_round": calls,
+            "throughput_per_s": round(calls / statistics.median(totals), 1),
+        }
+    )
+
+
+@pytest.mark.parametrize("failure_status", [500, 429])
+def test_failure_injection(benchmark, run_async, fixture_server, failure_status):
+    """Latency and error rate with injected upstream failures.
+
+    500s surface as error responses; 429s are retried by fetch_json (Retry-After: 0),
+    so almost every call still succeeds.
+    """
+    fixture_server.configure(failure_rate=0.3, failure_status=failure_status)
+    results = []
+
+    async def run_calls():
+        results.extend(
+            await asyncio.gather(*(tradier_tools._get_stock_quote(t) for t in TICKERS))
+        )
+
+    try:
+        benchmark.pedantic(run_async, args=(run_calls,), rounds=5, iterations=1)
+    finally:
+        fixture_server.configure(failure_rate=0.0, failure_status=500)
+
+    error_rate = sum(is_error_response(result) for result in results) / len(results)
+    benchmark.extra_info.update({"failure_status": failure_status, "error_rate": round(error_rate, 3)})
+    if failure_status == 429:
+        assert error_rate < 0.3
+    else:
+        assert 0.0 < error_rate < 1.0
@@ -0,0 +1,15 @@
+"""
+Shared setup for unit tests
+
+Puts src/ on sys.path and provides dummy API keys (if missing), so backend
+modules can be imported without a .env file. No test here makes network calls.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+for key in ("OPENAI_API_KEY", "TRADIER_API_KEY", "POLYGON_API_KEY"):
+    os.environ.setdefault(key, "unit-test")
@@ -0,0 +1,46 @@
+"""
+Unit tests for the CLI performance metrics footer
+
+Covers the token line, the cached input ratio and the fallback when the
+ratio cannot be calculated.
+"""
+
+from backend import cli
+from backend.cli import _format_performance_footer
+
+
+def usage(**overrides):
+    token_usage = {"total_tokens": 1_000, "input_tokens": 800, "output_tokens": 200}
+    token_usage.update(overrides)
+    return token_usage
+
+
+def test_footer_shows_cached_input_ratio():
+    footer = _format_performance_footer(1.5, usage(cached_input_tokens=200), "gpt-5-nano")
+
+    assert "Tokens Used: 1,000 (Input: 800, Output: 200)" in footer
+    assert "Cached Input: 200 (25.0%)" in footer
+
+
+def test_footer_omits_cache_section_without_cached_tokens():
+    footer = _format_performance_footer(1.5, usage(), "gpt-5-nano")
+
+    assert "Cached" not in footer
+
+
+def test_footer_with_cached_tokens_but_no_input_tokens():
+    footer = _format_performance_footer(
+        1.5, usage(input_tokens=0, cached_input_tokens=200), "gpt-5-nano"
+    )
+
+    assert "Tokens Used: 1,000\n" in footer
+    assert "Model: gpt-5-nano" in footer
+
+
+def test_footer_shows_cached_input_without_ratio(monkeypatch):
+    monkeypatch.setattr(cli, "calculate_cached_input_ratio", lambda token_usage: None)
+
+    footer = _format_performance_footer(1.5, usage(cached_input_tokens=200), "gpt-5-nano")
+
+    assert "Cached Input: 200\n" in footer
+    assert "%" not in footer
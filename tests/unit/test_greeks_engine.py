@@ -0,0 +1,190 @@
+"""
+Unit tests for the local Black-Scholes greeks engine and the options chain index
+
+Covers the normal CDF approximation, implied volatility round-trips through
+black_scholes_price, greeks against finite differences, OptionSide strike
+windows/lookups and NaN cells of OptionsSurface.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from backend.tools.greeks_engine import (
+    black_scholes_greeks,
+    black_scholes_price,
+    compute_chain_greeks,
+    implied_volatility,
+    norm_cdf,
+)
+from backend.tools.options_chain import OptionsChain, OptionSide, OptionsSurface
+
+SPOT = 100.0
+RATE = 0.04
+
+
+def test_norm_cdf_matches_erf():
+    x = np.linspace(-8.0, 8.0, 1601)
+    expected = np.array([0.5 * (1.0 + math.erf(value / math.sqrt(2.0))) for value in x])
+    assert np.max(np.abs(norm_cdf(x) - expected)) < 7.5e-8
+
+
+@pytest.mark.parametrize("is_call", [True, False])
+def test_implied_volatility_round_trip(is_call):
+    strike, years, volatility = np.meshgrid(
+        np.linspace(80.0, 120.0, 9),
+        [0.05, 0.25, 1.0],
+        [0.1, 0.25, 0.5, 1.0],
+    )
+    strike, years, volatility = strike.ravel(), years.ravel(), volatility.ravel()
+    price = black_scholes_price(SPOT, strike, years, RATE, volatility, is_call)
+
+    solved = implied_volatility(price, SPOT, strike, years, RATE, is_call)
+    # Volatility is only determined where the price is sensitive to it (not for
+    # deep in/out-of-the-money options priced at their no-arbitrage bounds)
+    vega = black_scholes_greeks(SPOT, strike, years, RATE, volatility, is_call)["vega"]
+    sensitive = vega > 0.01
+    assert sensitive.sum() > len(price) // 2
+    assert np.all(np.isfinite(solved[sensitive]))
+    assert np.max(np.abs(solved - volatility)[sensitive]) < 1e-4
+
+    solvable = np.isfinite(solved)
+    repriced = black_scholes_price(SPOT, strike, years, RATE, solved, is_call)
+    assert np.max(np.abs(repriced - price)[solvable]) < 1e-5
+
+
+def test_implied_volatility_mixed_calls_and_puts():
+    strike = np.array([90.0, 100.0, 110.0])
+    is_call = np.array([False, True, True])
+    price = black_scholes_price(SPOT, strike, 0.5, RATE, 0.3, is_call)
+    solved = implied_volatility(price, SPOT, strike, 0.5, RATE, is_call)
+    assert solved == pytest.approx([0.3, 0.3, 0.3], abs=1e-5)
+
+
+def test_implied_volatility_outside_no_arbitrage_bounds_is_nan():
+    # Below intrinsic value, above the spot (call) and no quote
+    prices = np.array([5.0, 150.0, np.nan])
+    solved = implied_volatility(prices, SPOT, np.array([90.0, 100.0, 100.0]), 0.5, RATE, True)
+    assert np.all(np.isnan(solved))
+
+
+@pytest.mark.parametrize("is_call", [True, False])
+def test_greeks_match_finite_differences(is_call):
+    strike, years, volatility = 105.0, 0.5, 0.3
+    greeks = black_scholes_greeks(SPOT, strike, years, RATE, volatility, is_call)
+
+    def price(spot=SPOT, t=years, vol=volatility):
+        return float(black_scholes_price(spot, strike, t, RATE, vol, is_call))
+
+    # Tolerances allow for the derivative of the norm_cdf approximation error
+    h = 1e-3
+    assert float(greeks["delta"]) == pytest.approx(
+        (price(spot=SPOT + h) - price(spot=SPOT - h)) / (2 * h), abs=1e-4
+    )
+    assert float(greeks["gamma"]) == pytest.approx(
+        (price(spot=SPOT + h) - 2 * price() + price(spot=SPOT - h)) / h**2, abs=1e-4
+    )
+    # Per calendar day and per volatility point
+    assert float(greeks["theta"]) == pytest.approx(price(t=years - 1 / 365) - price(), abs=1e-3)
+    assert float(greeks["vega"]) == pytest.approx(price(vol=volatility + 0.01) - price(), abs=1e-3)
+
+
+def test_compute_chain_greeks_uses_mid_and_skips_missing_ask():
+    strike = np.array([100.0, 100.0])
+    mid = float(black_scholes_price(SPOT, 100.0, 0.25, RATE, 0.2, True))
+    greeks = compute_chain_greeks(
+        bid=[mid - 0.05, 1.0],
+        ask=[mid + 0.05, 0.0],
+        spot=SPOT,
+        strike=strike,
+        years=0.25,
+        rate=RATE,
+        is_call=True,
+    )
+    assert greeks["implied_volatility"][0] == pytest.approx(0.2, abs=1e-5)
+    assert all(np.isnan(greeks[name][1]) for name in greeks)
+
+
+def option(strike, option_type="call", bid=1.0, ask=1.2, smv_vol=0.2, delta=0.5):
+    greeks = {"delta": delta, "smv_vol": smv_vol} if smv_vol is not None else None
+    return {"strike": strike, "option_type": option_type, "bid": bid, "ask": ask, "greeks": greeks}
+
+
+def test_window_excludes_strike_equal_to_price():
+    side = OptionSide([option(strike) for strike in (98, 102, 100, 99, 101, 97, 103)], True)
+    above_start, above_end, below_start, below_end = side.window(100.0, 2)
+    assert side.strike[above_start:above_end].tolist() == [102.0, 101.0]
+    assert side.strike[below_start:below_end].tolist() == [99.0, 98.0]
+    assert [row["strike"] for row in side.window_rows(100.0, 2)] == [102, 101, 99, 98]
+
+
+def test_window_near_chain_edges():
+    side = OptionSide([option(strike) for strike in (100, 101, 102)], True)
+    assert [row["strike"] for row in side.window_rows(101.5, 5)] == [102, 101, 100]
+    assert [row["strike"] for row in side.window_rows(50.0, 2)] == [101, 100]
+    assert [row["strike"] for row in side.window_rows(200.0, 2)] == [102, 101]
+
+
+def test_empty_side():
+    side = OptionSide([], is_call=False)
+    assert len(side) == 0
+    assert side.window(100.0, 5) == (0, 0, 0, 0)
+    assert side.window_rows(100.0) == []
+    assert side.lookup(np.array([100.0, 101.0])).tolist() == [-1, -1]
+    assert side.fill_missing_greeks(SPOT, 0.1, RATE) == 0
+
+
+def test_lookup_with_duplicate_and_missing_strikes():
+    side = OptionSide(
+        [option(100, bid=1.0), option(105), option(100, bid=2.0), option(95)], is_call=True
+    )
+    index = side.lookup(np.array([100.0, 95.0, 102.5, 110.0, 90.0]))
+    # Duplicate strikes keep API order (stable sort): the first one is found
+    assert side.bid[index[0]] == 1.0
+    assert side.strike[index[1]] == 95.0
+    assert index[2:].tolist() == [-1, -1, -1]
+
+
+def test_fill_missing_greeks_only_for_rows_without_tradier_greeks():
+    price = float(black_scholes_price(SPOT, 105.0, 0.25, RATE, 0.3, True))
+    side = OptionSide(
+        [
+            option(105, bid=price - 0.01, ask=price + 0.01, smv_vol=None),
+            option(110, smv_vol=0.5, delta=0.25),
+        ],
+        is_call=True,
+    )
+    assert side.fill_missing_greeks(SPOT, 0.25, RATE) == 1
+    # Strike descending: the 110 row (Tradier greeks) comes first
+    assert side.implied_volatility.tolist() == pytest.approx([50.0, 30.0], abs=1e-2)
+    assert side.delta[0] == 0.25
+    assert side.missing_greeks.tolist() == [False, True]
+
+
+def test_surface_has_nan_for_unlisted_strikes():
+    near = OptionsChain.from_tradier(
+        [option(k, "call", smv_vol=0.2) for k in (101, 102, 103)]
+        + [option(k, "put", smv_vol=0.3) for k in (97, 98, 99)]
+    )
+    # The far expiration lists no 102 call and no 98 put
+    far = OptionsChain.from_tradier(
+        [option(k, "call", smv_vol=0.4) for k in (101, 103)]
+        + [option(k, "put", smv_vol=0.5) for k in (97, 99)]
+    )
+    surface = OptionsSurface(["2025-10-24", "2025-11-21"], [near, far], 100.0, 3)
+
+    assert surface.strike.tolist() == [103, 102, 101, 99, 98, 97]
+    assert surface.above_count == 3
+    iv = surface.implied_volatility
+    assert iv[:, 0].tolist() == pytest.approx([20.0] * 3 + [30.0] * 3)
+    assert np.isnan(iv[1, 1]) and np.isnan(iv[4, 1])
+    assert iv[[0, 2, 3, 5], 1].tolist() == pytest.approx([40.0, 40.0, 50.0, 50.0])
+    assert surface.atm_implied_volatility.tolist() == pytest.approx([25.0, 45.0])
+
+
+def test_surface_with_empty_side():
+    calls_only = OptionsChain.from_tradier([option(k, "call") for k in (101, 102)])
+    surface = OptionsSurface(["2025-10-24"], [calls_only], 100.0, 2)
+    assert surface.strike.tolist() == [102, 101]
+    assert surface.atm_implied_volatility.tolist() == pytest.approx([20.0])
@@ -0,0 +1,136 @@
+"""
+Unit tests for conversation history compaction
+
+Covers turn splitting, compaction of older turns and the token budget
+(the latest turn is kept even when it alone exceeds the budget).
+"""
+
+import asyncio
+
+from backend.services.history_compaction import (
+    CompactingSession,
+    compact_history,
+    estimate_tokens,
+    split_turns,
+)
+
+
+def user(text):
+    return {"role": "user", "content": text}
+
+
+def assistant(text, item_id="msg_1"):
+    content = [{"type": "output_text", "text": text, "annotations": []}]
+    return {"type": "message", "id": item_id, "role": "assistant", "content": content}
+
+
+def plain_assistant(text):
+    return {"role": "assistant", "content": text}
+
+
+def tool_call(call_id, payload="x"):
+    return [
+        {"type": "reasoning", "id": f"rs_{call_id}", "summary": []},
+        {"type": "function_call", "call_id": call_id, "name": "get_stock_quote", "arguments": "{}"},
+        {"type": "function_call_output", "call_id": call_id, "output": payload},
+    ]
+
+
+def turn(index, payload="x"):
+    return [
+        user(f"question {index}"),
+        *tool_call(f"call_{index}", payload),
+        assistant(f"answer {index}"),
+    ]
+
+
+def test_split_turns_starts_each_turn_with_user_message():
+    items = turn(1) + turn(2)
+    turns = split_turns(items)
+    assert len(turns) == 2
+    assert turns[0] == turn(1)
+    assert turns[1] == turn(2)
+
+
+def test_split_turns_drops_leading_partial_turn():
+    items = turn(1)[2:] + turn(2)
+    assert split_turns(items) == [turn(2)]
+    assert split_turns([]) == []
+
+
+def test_older_turns_keep_only_messages():
+    items = turn(1) + turn(2) + turn(3)
+    compacted = compact_history(items, recent_turns=1)
+
+    assert compacted == [
+        user("question 1"),
+        plain_assistant("answer 1"),
+        user("question 2"),
+        plain_assistant("answer 2"),
+        *turn(3),
+    ]
+    # No function_call is left without its output
+    call_ids = {item["call_id"] for item in compacted if item.get("type") == "function_call"}
+    output_ids = {
+        item["call_id"] for item in compacted if item.get("type") == "function_call_output"
+    }
+    assert call_ids == output_ids == {"call_3"}
+
+
+def test_replayed_message_ids_keep_their_reasoning_items():
+    items = turn(1) + turn(2) + turn(3)
+    compacted = compact_history(items, recent_turns=1)
+
+    # Reasoning models reject an output message replayed without its reasoning
+    # item: compacted assistant messages carry no id, verbatim turns keep both
+    for compacted_turn in split_turns(compacted):
+        has_reasoning = any(item.get("type") == "reasoning" for item in compacted_turn)
+        for item in compacted_turn:
+            if item.get("role") == "assistant":
+                assert has_reasoning or "id" not in item
+    assert [item["id"] for item in compacted if "id" in item] == ["rs_call_3", "msg_1"]
+
+
+def test_compaction_is_deterministic():
+    items = turn(1) + turn(2) + turn(3)
+    assert compact_history(items, 1, 100) == compact_history(list(items), 1, 100)
+
+
+def test_budget_drops_oldest_turns():
+    items = turn(1) + turn(2) + turn(3)
+    # Room for the compacted second turn and the verbatim latest turn only
+    budget = estimate_tokens([user("question 2"), plain_assistant("answer 2"), *turn(3)])
+
+    compacted = compact_history(items, recent_turns=1, token_budget=budget)
+    assert split_turns(compacted)[0][0] == user("question 2")
+    assert estimate_tokens(compacted) <= budget
+
+
+def test_budget_keeps_latest_turn_even_if_it_exceeds_budget():
+    items = turn(1) + turn(2, payload="y" * 10_000)
+    compacted = compact_history(items, recent_turns=1, token_budget=100)
+    assert compacted == turn(2, payload="y" * 10_000)
+    assert estimate_tokens(compacted) > 100
+
+
+class ListSession:
+    """Minimal in-memory session for CompactingSession tests."""
+
+    def __init__(self, items):
+        self.session_id = "test"
+        self.items = list(items)
+
+    async def get_items(self, limit=None):
+        return self.items[-limit:] if limit else list(self.items)
+
+
+def test_compacting_session_applies_budget_and_limit():
+    items = turn(1) + turn(2) + turn(3, payload="z" * 4_000)
+    session = CompactingSession(ListSession(items), max_items=100, token_budget=500, recent_turns=1)
+
+    compacted = asyncio.run(session.get_items())
+    assert compacted == turn(3, payload="z" * 4_000)
+    assert session.last_compaction["items_before"] == len(items)
+    assert session.last_compaction["items_after"] == len(compacted)
+
+    assert asyncio.run(session.get_items(limit=2)) == compacted[-2:]
@@ -0,0 +1,131 @@
+"""
+Unit tests for the local TA indicator engine
+
+Compares the vectorized SMA/EMA/RSI/MACD series (closed-form blocked
+smoothing) with plain Python reference loops.
+"""
+
+import numpy as np
+import pytest
+
+from backend.tools import indicator_engine
+from backend.tools.indicator_engine import (
+    compute_ema,
+    compute_macd,
+    compute_rsi,
+    compute_sma,
+    compute_ta_indicators,
+)
+
+TOLERANCE = 1e-9
+
+
+def reference_sma(close, window):
+    result = [np.nan] * len(close)
+    for i in range(window - 1, len(close)):
+        result[i] = sum(close[i - window + 1 : i + 1]) / window
+    return np.array(result)
+
+
+def reference_ema(close, window):
+    result = [np.nan] * len(close)
+    if len(close) < window:
+        return np.array(result)
+    alpha = 2.0 / (window + 1)
+    value = sum(close[:window]) / window
+    result[window - 1] = value
+    for i in range(window, len(close)):
+        value = alpha * close[i] + (1 - alpha) * value
+        result[i] = value
+    return np.array(result)
+
+
+def reference_rsi(close, window=14):
+    result = [np.nan] * len(close)
+    if len(close) <= window:
+        return np.array(result)
+    changes = [close[i] - close[i - 1] for i in range(1, len(close))]
+    gains = [max(change, 0.0) for change in changes]
+    losses = [max(-change, 0.0) for change in changes]
+    avg_gain = sum(gains[:window]) / window
+    avg_loss = sum(losses[:window]) / window
+
+    def rsi(gain, loss):
+        return 100.0 if loss == 0 else 100.0 - 100.0 / (1.0 + gain / loss)
+
+    result[window] = rsi(avg_gain, avg_loss)
+    for i in range(window, len(changes)):
+        avg_gain = (avg_gain * (window - 1) + gains[i]) / window
+        avg_loss = (avg_loss * (window - 1) + losses[i]) / window
+        result[i + 1] = rsi(avg_gain, avg_loss)
+    return np.array(result)
+
+
+def reference_macd(close, short_window=12, long_window=26, signal_window=9):
+    macd = reference_ema(close, short_window) - reference_ema(close, long_window)
+    signal = np.full(len(close), np.nan)
+    first_valid = long_window - 1
+    if len(close) > first_valid:
+        signal[first_valid:] = reference_ema(list(macd[first_valid:]), signal_window)
+    return macd, signal, macd - signal
+
+
+@pytest.fixture
+def close():
+    """Random-walk closing prices (long enough for EMA-200 and several smoothing blocks)."""
+    rng = np.random.default_rng(42)
+    return 100.0 + np.cumsum(rng.normal(0.0, 1.5, size=1500))
+
+
+def assert_series_close(actual, expected):
+    assert actual.shape == expected.shape
+    np.testing.assert_array_equal(np.isnan(actual), np.isnan(expected))
+    np.testing.assert_allclose(actual, expected, rtol=0, atol=TOLERANCE, equal_nan=True)
+
+
+@pytest.mark.parametrize("window", [5, 10, 20, 50, 200])
+def test_sma_matches_reference(close, window):
+    assert_series_close(compute_sma(close, window), reference_sma(list(close), window))
+
+
+@pytest.mark.parametrize("window", [5, 10, 20, 50, 200])
+def test_ema_matches_reference(close, window):
+    assert_series_close(compute_ema(close, window), reference_ema(list(close), window))
+
+
+def test_ema_blocks_match_reference(close, monkeypatch):
+    """Short re-basing blocks (many block boundaries) give the same series."""
+    monkeypatch.setattr(indicator_engine, "_MAX_SMOOTHING_SCALE", 1e3)
+    assert_series_close(compute_ema(close, 50), reference_ema(list(close), 50))
+    assert_series_close(compute_rsi(close), reference_rsi(list(close)))
+
+
+def test_rsi_matches_reference(close):
+    assert_series_close(compute_rsi(close), reference_rsi(list(close)))
+
+
+def test_rsi_without_losses_is_100():
+    close = np.arange(1.0, 40.0)
+    assert compute_rsi(close)[-1] == 100.0
+
+
+def test_macd_matches_reference(close):
+    for actual, expected in zip(compute_macd(close), reference_macd(list(close))):
+        assert_series_close(actual, expected)
+
+
+def test_short_series_are_undefined():
+    close = np.linspace(10.0, 20.0, 10)
+    assert np.isnan(compute_sma(close, 20)).all()
+    assert np.isnan(compute_ema(close, 20)).all()
+    assert np.isnan(compute_rsi(close)).all()
+
+
+def test_ta_indicators_omit_undefined_windows():
+    close = np.linspace(10.0, 20.0, 30)
+    timestamps = np.arange(len(close), dtype=np.int64) * 86_400_000
+    indicators = compute_ta_indicators(timestamps, close)
+
+    assert [item["window"] for item in indicators["sma_values"]] == [5, 10, 20]
+    assert indicators["rsi"]["timestamp"] == int(timestamps[-1])
+    assert indicators["macd"]["macd"] == pytest.approx(reference_macd(list(close))[0][-1])
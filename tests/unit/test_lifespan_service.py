@@ -0,0 +1,81 @@
+"""
+Unit tests for the Gradio server lifespan
+
+app_lifespan must enter every startup hook and exit all of them on
+shutdown (in reverse order), including when the server stops with an error.
+"""
+
+import asyncio
+import contextlib
+
+import pytest
+
+from backend.services import lifespan_service
+from backend.services.lifespan_service import app_lifespan
+
+HOOKS = (
+    "connection_pool_lifespan",
+    "metrics_lifespan",
+    "quote_snapshot_lifespan",
+    "session_manager_lifespan",
+)
+
+
+@pytest.fixture
+def events(monkeypatch):
+    recorded = []
+
+    def recording_hook(name):
+        @contextlib.asynccontextmanager
+        async def hook(app):
+            recorded.append(("enter", name))
+            try:
+                yield
+            finally:
+                recorded.append(("exit", name))
+
+        return hook
+
+    for name in HOOKS:
+        monkeypatch.setattr(lifespan_service, name, recording_hook(name))
+    return recorded
+
+
+def test_app_lifespan_enters_and_exits_every_hook(events):
+    async def serve():
+        async with app_lifespan(app=None):
+            assert events == [("enter", name) for name in HOOKS]
+
+    asyncio.run(serve())
+    assert events[len(HOOKS) :] == [("exit", name) for name in reversed(HOOKS)]
+
+
+def test_app_lifespan_exits_hooks_on_error(events):
+    async def serve():
+        async with app_lifespan(app=None):
+            raise RuntimeError("server crashed")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(serve())
+    assert [name for event, name in events if event == "exit"] == list(reversed(HOOKS))
+
+
+def test_session_manager_lifespan_closes_shards(monkeypatch, tmp_path):
+    from backend.services import session_service
+
+    manager = session_service.SessionManager("test", 30, 5, True, str(tmp_path), 2)
+    monkeypatch.setattr(session_service, "_session_manager", manager)
+
+    async def serve():
+        async with session_service.session_manager_lifespan(app=None):
+            session = manager.get_session("client")
+            await session.add_items([{"role": "user", "content": "hello"}])
+            assert manager._cleanup_task is not None
+
+    asyncio.run(serve())
+    assert manager._cleanup_task is None
+    assert all(not shard._connections for shard in manager._shards)
+    # History is kept; WAL checkpointed into the shard file
+    assert not any(path.stat().st_size for path in tmp_path.glob("*.db-wal"))
+    store = manager.get_session("client").session
+    assert asyncio.run(store.get_items()) == [{"role": "user", "content": "hello"}]
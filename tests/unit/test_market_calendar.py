@@ -0,0 +1,165 @@
+"""
+Unit tests for the NYSE trading calendar
+
+Checks the rule-based calendar against published NYSE holiday and early
+close schedules (2022-2027) and the session navigation at holidays and at
+the edges of the precomputed range.
+"""
+
+from datetime import date, datetime
+
+import pytest
+
+from backend.utils.market_calendar import (
+    MARKET_TIMEZONE,
+    STATE_CLOSED,
+    STATE_OPEN,
+    STATE_POSTMARKET,
+    MarketCalendar,
+    get_market_calendar,
+    nyse_early_closes,
+    nyse_holidays,
+)
+
+# Published NYSE full-day closures
+NYSE_HOLIDAYS = {
+    2024: [
+        date(2024, 1, 1), date(2024, 1, 15), date(2024, 2, 19), date(2024, 3, 29),
+        date(2024, 5, 27), date(2024, 6, 19), date(2024, 7, 4), date(2024, 9, 2),
+        date(2024, 11, 28), date(2024, 12, 25),
+    ],
+    2025: [
+        date(2025, 1, 1), date(2025, 1, 9), date(2025, 1, 20), date(2025, 2, 17),
+        date(2025, 4, 18), date(2025, 5, 26), date(2025, 6, 19), date(2025, 7, 4),
+        date(2025, 9, 1), date(2025, 11, 27), date(2025, 12, 25),
+    ],
+    2026: [
+        date(2026, 1, 1), date(2026, 1, 19), date(2026, 2, 16), date(2026, 4, 3),
+        date(2026, 5, 25), date(2026, 6, 19), date(2026, 7, 3), date(2026, 9, 7),
+        date(2026, 11, 26), date(2026, 12, 25),
+    ],
+    2027: [
+        date(2027, 1, 1), date(2027, 1, 18), date(2027, 2, 15), date(2027, 3, 26),
+        date(2027, 5, 31), date(2027, 6, 18), date(2027, 7, 5), date(2027, 9, 6),
+        date(2027, 11, 25), date(2027, 12, 24),
+    ],
+}
+
+# Published NYSE 13:00 ET closes
+NYSE_EARLY_CLOSES = {
+    2024: {date(2024, 7, 3), date(2024, 11, 29), date(2024, 12, 24)},
+    2025: {date(2025, 7, 3), date(2025, 11, 28), date(2025, 12, 24)},
+    # July 3 is the observed Independence Day holiday
+    2026: {date(2026, 11, 27), date(2026, 12, 24)},
+    # July 3 is a Saturday and December 24 the observed Christmas holiday
+    2027: {date(2027, 11, 26)},
+}
+
+
+@pytest.fixture(scope="module")
+def calendar():
+    return get_market_calendar()
+
+
+@pytest.mark.parametrize("year", sorted(NYSE_HOLIDAYS))
+def test_holidays_match_nyse_schedule(year):
+    assert sorted(nyse_holidays(year)) == NYSE_HOLIDAYS[year]
+
+
+@pytest.mark.parametrize("year", sorted(NYSE_EARLY_CLOSES))
+def test_early_closes_match_nyse_schedule(year):
+    assert nyse_early_closes(year) == NYSE_EARLY_CLOSES[year]
+
+
+@pytest.mark.parametrize("year, sessions", [(2022, 251), (2023, 250), (2024, 252), (2025, 250)])
+def test_sessions_per_year(calendar, year, sessions):
+    assert calendar.sessions_between(date(year, 1, 1), date(year, 12, 31)) == sessions
+
+
+def test_saturday_new_years_day_is_not_observed(calendar):
+    # 2022-01-01 and 2028-01-01 are Saturdays: the preceding Friday trades
+    assert date(2022, 1, 1) not in nyse_holidays(2022)
+    assert date(2021, 12, 31) not in nyse_holidays(2021)
+    assert calendar.is_session(date(2021, 12, 31))
+    assert calendar.is_session(date(2027, 12, 31))
+
+
+def test_juneteenth_from_2022(calendar):
+    assert calendar.is_session(date(2021, 6, 18))
+    # Sunday 2022-06-19 observed on Monday
+    assert calendar.holiday_name(date(2022, 6, 20)) == "Juneteenth"
+    assert calendar.is_session(date(2022, 6, 17))
+    # Saturday 2027-06-19 observed on Friday
+    assert calendar.holiday_name(date(2027, 6, 18)) == "Juneteenth"
+
+
+def test_observed_independence_day_and_christmas(calendar):
+    # Saturday July 4th → Friday; Sunday July 4th → Monday
+    assert calendar.holiday_name(date(2026, 7, 3)) == "Independence Day"
+    assert calendar.holiday_name(date(2027, 7, 5)) == "Independence Day"
+    # Sunday Christmas → Monday; Saturday Christmas → Friday
+    assert calendar.holiday_name(date(2022, 12, 26)) == "Christmas Day"
+    assert calendar.holiday_name(date(2027, 12, 24)) == "Christmas Day"
+    assert not calendar.is_session(date(2022, 12, 26))
+
+
+def test_early_close_session_close_and_market_state(calendar):
+    assert calendar.session_close(date(2024, 11, 29)) == datetime(
+        2024, 11, 29, 13, 0, tzinfo=MARKET_TIMEZONE
+    )
+    assert calendar.session_close(date(2024, 11, 27)) == datetime(
+        2024, 11, 27, 16, 0, tzinfo=MARKET_TIMEZONE
+    )
+    assert calendar.session_close(date(2024, 11, 28)) is None
+
+    half_day = datetime(2024, 12, 24, 13, 30, tzinfo=MARKET_TIMEZONE)
+    full_day = datetime(2024, 12, 23, 13, 30, tzinfo=MARKET_TIMEZONE)
+    assert calendar.market_state(half_day) == STATE_POSTMARKET
+    assert calendar.market_state(full_day) == STATE_OPEN
+    assert calendar.market_state(datetime(2024, 12, 25, 12, 0, tzinfo=MARKET_TIMEZONE)) == (
+        STATE_CLOSED
+    )
+
+
+def test_navigation_around_holidays(calendar):
+    assert calendar.previous_session(date(2024, 7, 5)) == date(2024, 7, 3)
+    assert calendar.next_session(date(2024, 7, 3)) == date(2024, 7, 5)
+    # Day of mourning for President Carter
+    assert calendar.previous_session(date(2025, 1, 10)) == date(2025, 1, 8)
+    assert calendar.next_session(date(2024, 12, 24)) == date(2024, 12, 26)
+    assert calendar.previous_session(date(2024, 1, 2)) == date(2023, 12, 29)
+    assert calendar.session_on_or_after(date(2024, 3, 29)) == date(2024, 4, 1)
+    assert calendar.session_on_or_before(date(2024, 3, 29)) == date(2024, 3, 28)
+    assert calendar.session_on_or_before(date(2024, 3, 28)) == date(2024, 3, 28)
+
+
+def test_sessions_between_at_holidays(calendar):
+    assert calendar.sessions_between(date(2024, 7, 4), date(2024, 7, 4)) == 0
+    assert calendar.sessions_between(date(2024, 7, 3), date(2024, 7, 5)) == 2
+    assert calendar.sessions_between(date(2024, 7, 5), date(2024, 7, 3)) == 0
+    assert calendar.sessions_between(date(2024, 12, 21), date(2025, 1, 3)) == 8
+
+
+def test_calendar_edges(calendar):
+    # 1990-01-01 (New Year's Day) is the first indexed date, 2100-12-31 the last
+    first_session = date(1990, 1, 2)
+    assert calendar.session_on_or_before(date(1990, 1, 1)) is None
+    assert calendar.session_on_or_after(date(1990, 1, 1)) == first_session
+    assert calendar.previous_session(first_session) is None
+    assert calendar.next_session(date(2100, 12, 30)) == date(2100, 12, 31)
+    assert calendar.next_session(date(2100, 12, 31)) is None
+
+    with pytest.raises(ValueError):
+        calendar.is_session(date(1989, 12, 29))
+    with pytest.raises(ValueError):
+        calendar.previous_session(date(2101, 1, 1))
+    with pytest.raises(ValueError):
+        calendar.sessions_between(date(2100, 12, 1), date(2101, 1, 31))
+
+
+def test_custom_year_range():
+    calendar = MarketCalendar(2024, 2024)
+    assert calendar.sessions_between(date(2024, 1, 1), date(2024, 12, 31)) == 252
+    assert calendar.next_session(date(2024, 12, 31)) is None
+    with pytest.raises(ValueError):
+        calendar.is_session(date(2025, 1, 2))
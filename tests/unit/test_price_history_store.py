@@ -0,0 +1,45 @@
+"""
+Unit tests for the price history store's gap bookkeeping
+
+Covers gap detection against covered ranges and the joining of gaps that
+are separated only by weekends and holidays into one request.
+"""
+
+from datetime import date
+
+from backend.tools.price_history_store import join_session_gaps, missing_ranges
+
+
+def test_missing_ranges_between_covered_ranges():
+    covered = [(date(2025, 10, 1), date(2025, 10, 5)), (date(2025, 10, 11), date(2025, 10, 12))]
+
+    assert missing_ranges(date(2025, 9, 29), date(2025, 10, 14), covered) == [
+        (date(2025, 9, 29), date(2025, 9, 30)),
+        (date(2025, 10, 6), date(2025, 10, 10)),
+        (date(2025, 10, 13), date(2025, 10, 14)),
+    ]
+
+
+def test_gaps_across_weekends_are_joined():
+    # Weeks of sessions without bars: the weekends between them are covered
+    gaps = [
+        (date(2025, 10, 20), date(2025, 10, 24)),
+        (date(2025, 10, 27), date(2025, 10, 31)),
+        (date(2025, 11, 3), date(2025, 11, 5)),
+    ]
+
+    assert join_session_gaps(gaps) == [(date(2025, 10, 20), date(2025, 11, 5))]
+
+
+def test_gaps_across_holidays_are_joined():
+    # Friday 2025-07-04 is Independence Day
+    gaps = [(date(2025, 6, 30), date(2025, 7, 3)), (date(2025, 7, 7), date(2025, 7, 11))]
+
+    assert join_session_gaps(gaps) == [(date(2025, 6, 30), date(2025, 7, 11))]
+
+
+def test_gaps_across_stored_sessions_stay_separate():
+    # Friday 2025-10-24 is a session with a stored bar
+    gaps = [(date(2025, 10, 20), date(2025, 10, 23)), (date(2025, 10, 27), date(2025, 10, 31))]
+
+    assert join_session_gaps(gaps) == gaps
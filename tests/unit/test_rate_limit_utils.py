@@ -0,0 +1,145 @@
+"""
+Unit tests for the adaptive per-provider token buckets
+
+Time is simulated: the module's clock and asyncio.sleep are replaced by a
+fake clock, so waits are exact and the tests run instantly.
+"""
+
+import asyncio
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from backend.tools import rate_limit_utils
+from backend.tools.rate_limit_utils import (
+    DEFAULT_RETRY_AFTER_SECONDS,
+    MIN_RATE_FRACTION,
+    AdaptiveTokenBucket,
+    parse_retry_after,
+)
+
+_real_sleep = asyncio.sleep
+
+
+class FakeClock:
+    """Monotonic/wall clock that only advances when a coroutine sleeps."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.wall = 1_760_000_000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.wall
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        self.wall += seconds
+        await _real_sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(
+        rate_limit_utils, "time", SimpleNamespace(monotonic=fake.monotonic, time=fake.time)
+    )
+    monkeypatch.setattr(
+        rate_limit_utils, "asyncio", SimpleNamespace(Lock=asyncio.Lock, sleep=fake.sleep)
+    )
+    return fake
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_burst_is_immediate_then_spaced_at_rate(clock):
+    bucket = AdaptiveTokenBucket("test", requests_per_second=2, burst=3)
+
+    async def acquire_all():
+        return [await bucket.acquire() for _ in range(5)]
+
+    waits = run(acquire_all())
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3:] == pytest.approx([0.5, 0.5])
+
+
+def test_waiters_are_served_fifo(clock):
+    bucket = AdaptiveTokenBucket("test", requests_per_second=1, burst=1)
+    order = []
+
+    async def caller(index):
+        await bucket.acquire()
+        order.append((index, clock.now))
+
+    async def main():
+        await asyncio.gather(*(caller(index) for index in range(4)))
+
+    run(main())
+    assert [index for index, _ in order] == [0, 1, 2, 3]
+    assert [at - order[0][1] for _, at in order] == pytest.approx([0.0, 1.0, 2.0, 3.0])
+
+
+def test_rate_limited_halves_rate_down_to_floor(clock):
+    bucket = AdaptiveTokenBucket("test", requests_per_second=8, burst=4)
+
+    bucket.on_rate_limited()
+    assert bucket.rate == pytest.approx(4.0)
+    bucket.on_rate_limited()
+    assert bucket.rate == pytest.approx(2.0)
+    for _ in range(10):
+        bucket.on_rate_limited()
+    assert bucket.rate == pytest.approx(8 * MIN_RATE_FRACTION)
+    assert bucket.stats()["rate_limited"] == 12
+
+
+def test_rate_limited_pauses_for_retry_after(clock):
+    bucket = AdaptiveTokenBucket("test", requests_per_second=10, burst=10)
+    bucket.on_rate_limited(retry_after=3.0)
+
+    waited = run(bucket.acquire())
+    # Paused 3 s, after which the halved rate (5/s) has refilled 15 tokens (capped)
+    assert waited == pytest.approx(3.0)
+
+
+def test_rate_limited_without_header_uses_default_pause(clock):
+    bucket = AdaptiveTokenBucket("test", requests_per_second=10, burst=10)
+    bucket.on_rate_limited()
+
+    assert run(bucket.acquire()) == pytest.approx(DEFAULT_RETRY_AFTER_SECONDS)
+
+
+def test_success_recovers_configured_rate(clock):
+    bucket = AdaptiveTokenBucket("test", requests_per_second=10, burst=10)
+    bucket.on_rate_limited()
+    assert bucket.rate == pytest.approx(5.0)
+
+    bucket.on_success()
+    assert bucket.rate == pytest.approx(5.5)
+    for _ in range(50):
+        bucket.on_success()
+    assert bucket.rate == pytest.approx(10.0)
+
+
+def test_parse_retry_after_seconds():
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after("0.25") == 0.25
+    assert parse_retry_after("-3") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("soon") is None
+
+
+def test_parse_retry_after_http_date(clock):
+    retry_at = datetime.fromtimestamp(clock.wall, timezone.utc) + timedelta(seconds=30)
+    assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == pytest.approx(30.0)
+
+    past = datetime.fromtimestamp(clock.wall, timezone.utc) - timedelta(seconds=30)
+    assert parse_retry_after(format_datetime(past, usegmt=True)) == 0.0